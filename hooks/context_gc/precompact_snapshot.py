@@ -16,24 +16,27 @@ from hooks.hooklib import (
 from .working_set_builder import build_working_set
 
 
-def _safe_mkdir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-
-
-def _write_snapshot(
-    session_dir: Path,
-    ws_text: str,
-    meta: dict,
-    tail: str,
-) -> None:
-    _safe_mkdir(session_dir)
-    (session_dir / "working_set.md").write_text(ws_text + "\n", encoding="utf-8")
-    (session_dir / "precompact_meta.json").write_text(
-        json.dumps(meta, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+def _snapshot_files(ws_text: str, meta: dict, tail: str) -> dict[str, bytes]:
+    files = {
+        "working_set.md": (ws_text + "\n").encode("utf-8"),
+        "precompact_meta.json": json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"),
+    }
     if tail.strip():
-        (session_dir / "transcript_tail.jsonl").write_text(tail, encoding="utf-8")
+        files["transcript_tail.jsonl"] = tail.encode("utf-8")
+    return files
+
+
+def _write_snapshot(aidd_root: Path, session_dir: Path, files: dict[str, bytes], meta: dict) -> None:
+    # Session and by-ticket copies hard-link the same content-addressed blobs.
+    from aidd_runtime.reports import context_snapshots
+
+    context_snapshots.write_snapshot(aidd_root, session_dir, files, meta=meta)
+
+
+def _write_latest(aidd_root: Path, path: Path, files: dict[str, bytes]) -> None:
+    from aidd_runtime.reports import context_snapshots
+
+    context_snapshots.write_file(aidd_root, path, files["working_set.md"])
 
 
 def _log(aidd_root: Path, message: str) -> None:
@@ -92,17 +95,18 @@ def main() -> None:
     if ctx.transcript_path:
         tail = _tail_file(Path(ctx.transcript_path).expanduser())
 
+    files = _snapshot_files(ws.text, meta, tail)
     session_dir = reports_dir / (ctx.session_id or "unknown")
-    _write_snapshot(session_dir, ws.text, meta, tail)
-    (reports_dir / "latest_working_set.md").write_text(ws.text + "\n", encoding="utf-8")
+    _write_snapshot(aidd_root, session_dir, files, meta)
+    _write_latest(aidd_root, reports_dir / "latest_working_set.md", files)
     _log(aidd_root, f"wrote session snapshot: {session_dir}")
     _log(aidd_root, f"wrote latest snapshot: {reports_dir / 'latest_working_set.md'}")
 
     if ws.ticket:
         ticket_root = reports_dir / "by-ticket" / ws.ticket
         ticket_session_dir = ticket_root / (ctx.session_id or "unknown")
-        _write_snapshot(ticket_session_dir, ws.text, meta, tail)
-        (ticket_root / "latest_working_set.md").write_text(ws.text + "\n", encoding="utf-8")
+        _write_snapshot(aidd_root, ticket_session_dir, files, meta)
+        _write_latest(aidd_root, ticket_root / "latest_working_set.md", files)
         _log(aidd_root, f"wrote ticket snapshot: {ticket_session_dir}")
         _log(aidd_root, f"wrote ticket latest: {ticket_root / 'latest_working_set.md'}")
 
@@ -13,19 +13,17 @@ from hooks.hooklib import (
 from .working_set_builder import build_working_set
 
 
-def _safe_mkdir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-
-
 def _write_latest(aidd_root: Path, ws_text: str, ticket: str | None) -> None:
-    reports_dir = aidd_root / "reports" / "context"
-    _safe_mkdir(reports_dir)
-    (reports_dir / "latest_working_set.md").write_text(ws_text + "\n", encoding="utf-8")
+    # Both views hard-link one blob from the snapshot store instead of holding two copies.
+    from aidd_runtime.reports import context_snapshots
+
+    reports_dir = context_snapshots.context_dir(aidd_root)
+    data = (ws_text + "\n").encode("utf-8")
+    context_snapshots.write_file(aidd_root, reports_dir / "latest_working_set.md", data)
 
     if ticket:
         ticket_root = reports_dir / "by-ticket" / ticket
-        _safe_mkdir(ticket_root)
-        (ticket_root / "latest_working_set.md").write_text(ws_text + "\n", encoding="utf-8")
+        context_snapshots.write_file(aidd_root, ticket_root / "latest_working_set.md", data)
 
 
 def main() -> None:
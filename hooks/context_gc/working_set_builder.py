@@ -4,17 +4,20 @@ from __future__ import annotations
 import json
 import re
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from hooks.hooklib import load_config, resolve_aidd_root, resolve_context_gc_mode
+from hooks.hooklib import git_current_branch, load_config, resolve_aidd_root, resolve_context_gc_mode
 
 
 CODE_FENCE_RE = re.compile(r"^```")
 TASK_RE = re.compile(r"^\s*-\s*\[\s*\]\s+(.*)$")
 DONE_TASK_RE = re.compile(r"^\s*-\s*\[\s*[xX]\s*\]\s+(.*)$")
+CACHE_VERSION = 1
+CACHE_FILENAME = "working_set.json"
 
 
 @dataclass(frozen=True)
@@ -104,6 +107,159 @@ def _run_git(project_dir: Path, args: List[str], timeout: float = 1.5) -> Option
         return None
 
 
+def _signature(path: Path) -> Optional[List[int]]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def _find_git_dir(project_dir: Path) -> Optional[Path]:
+    """Locate the git dir by walking up from ``project_dir`` (no git process, so cache hits stay cheap)."""
+    for candidate in (project_dir, *project_dir.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if text.startswith("gitdir:"):
+                git_dir = Path(text[len("gitdir:") :].strip())
+                return git_dir if git_dir.is_absolute() else (candidate / git_dir).resolve()
+            return None
+    return None
+
+
+def _git_state_key(project_dir: Path) -> Optional[List[Any]]:
+    """Stat signatures of HEAD, the checked-out ref and the index; None outside a repository."""
+    git_dir = _find_git_dir(project_dir)
+    if git_dir is None:
+        return None
+    common_dir = git_dir
+    try:
+        common_dir = (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+    except OSError:
+        pass
+    head_path = git_dir / "HEAD"
+    ref_sig: Optional[List[Any]] = None
+    try:
+        head = head_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref: "):
+        ref = head[len("ref: ") :].strip()
+        ref_sig = [ref, _signature(common_dir / ref), _signature(common_dir / "packed-refs")]
+    return [git_dir.as_posix(), head, _signature(head_path), ref_sig, _signature(git_dir / "index")]
+
+
+class _SectionCache:
+    """Rendered working-set sections under ``aidd/.cache/working_set.json``, each keyed by its own inputs."""
+
+    def __init__(self, aidd_root: Optional[Path]) -> None:
+        self.path = aidd_root / ".cache" / CACHE_FILENAME if aidd_root else None
+        self.sections: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if self.path is None:
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+            sections = payload.get("sections")
+            self.sections = sections if isinstance(sections, dict) else {}
+
+    def get(
+        self,
+        name: str,
+        key: Any,
+        build: Callable[[], Any],
+        *,
+        max_age: Optional[float] = None,
+        rekey: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Cached section value for ``key``; ``rekey`` recomputes the key after builds that touch their inputs."""
+        entry = self.sections.get(name)
+        now = time.time()
+        if (
+            isinstance(entry, dict)
+            and entry.get("key") == key
+            and (max_age is None or now - float(entry.get("built_at") or 0) <= max_age)
+        ):
+            return entry.get("value")
+        value = build()
+        if rekey is not None:
+            key = rekey()
+        self.sections[name] = {"key": key, "built_at": now, "value": value}
+        self.dirty = True
+        return value
+
+    def flush(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        payload = {"version": CACHE_VERSION, "sections": self.sections}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            return
+        self.dirty = False
+
+
+def _read_active_state(state_path: Path) -> List[Optional[str]]:
+    if not state_path.exists():
+        return [None, None, None]
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        payload = {}
+    if not isinstance(payload, dict):
+        return [None, None, None]
+    slug = str(payload.get("slug_hint") or "").strip() or None
+    ticket = str(payload.get("ticket") or "").strip() or None
+    stage = str(payload.get("stage") or "").strip() or None
+    return [ticket, slug, stage]
+
+
+def _context_pack_lines(path: Path, max_lines: int, max_chars: int) -> List[str]:
+    md = _strip_long_code_blocks(_read_text(path))
+    excerpt = _extract_pack_excerpt(md, max_lines, max_chars)
+    if not excerpt:
+        return []
+    return ["#### Context Pack (rolling)", excerpt, ""]
+
+
+def _tasklist_lines(path: Path, max_tasks: int) -> List[str]:
+    todos, done, total = _extract_tasks(_read_text(path), max_tasks=max_tasks)
+    lines = ["#### Tasklist"]
+    if total:
+        lines.append(f"- Progress: {done}/{total} done")
+    lines.extend(todos)
+    lines.append("")
+    return lines
+
+
+def _repo_state_lines(project_dir: Path, max_status_lines: int) -> List[str]:
+    branch = git_current_branch(project_dir)
+    status = _run_git(project_dir, ["status", "--porcelain", "-uno"])
+    if not (branch or status):
+        return []
+    lines = ["#### Repo state"]
+    if branch:
+        lines.append(f"- Branch: {branch}")
+    if status:
+        status_lines = status.splitlines()[:max_status_lines]
+        lines.append(f"- Dirty files: {len(status_lines)}")
+        lines.extend(f"  - {line}" for line in status_lines[: min(10, len(status_lines))])
+    lines.append("")
+    return lines
+
+
 def build_working_set(project_dir: Path) -> WorkingSet:
     aidd_root = resolve_aidd_root(project_dir)
     cfg = load_config(aidd_root)
@@ -117,6 +273,7 @@ def build_working_set(project_dir: Path) -> WorkingSet:
     max_tasks = int(ws_cfg.get("max_tasks", 25))
     pack_max_lines = int(ws_cfg.get("context_pack_max_lines", 20))
     pack_max_chars = int(ws_cfg.get("context_pack_max_chars", 1200))
+    cache = _SectionCache(aidd_root)
 
     ticket = None
     slug = None
@@ -124,15 +281,9 @@ def build_working_set(project_dir: Path) -> WorkingSet:
 
     if aidd_root:
         state_path = aidd_root / "docs" / ".active.json"
-        if state_path.exists():
-            try:
-                payload = json.loads(state_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                payload = {}
-            if isinstance(payload, dict):
-                slug = str(payload.get("slug_hint") or "").strip() or None
-                ticket = str(payload.get("ticket") or "").strip() or None
-                stage = str(payload.get("stage") or "").strip() or None
+        ticket, slug, stage = cache.get(
+            "active_state", [state_path.as_posix(), _signature(state_path)], lambda: _read_active_state(state_path)
+        )
         if ticket is None:
             ticket = slug
 
@@ -149,40 +300,46 @@ def build_working_set(project_dir: Path) -> WorkingSet:
     if aidd_root and ticket:
         context_pack_path = aidd_root / "reports" / "context" / f"{ticket}.pack.md"
         tasklist = aidd_root / "docs" / "tasklist" / f"{ticket}.md"
-        if context_pack_path.exists():
-            md = _strip_long_code_blocks(_read_text(context_pack_path))
-            excerpt = _extract_pack_excerpt(md, pack_max_lines, pack_max_chars)
-            if excerpt:
-                parts.append("#### Context Pack (rolling)")
-                parts.append(excerpt)
-                parts.append("")
-
-        if tasklist.exists():
-            md = _read_text(tasklist)
-            todos, done, total = _extract_tasks(md, max_tasks=max_tasks)
-            parts.append("#### Tasklist")
-            if total:
-                parts.append(f"- Progress: {done}/{total} done")
-            if todos:
-                parts.extend(todos)
-            parts.append("")
+        pack_sig = _signature(context_pack_path)
+        if pack_sig is not None:
+            parts.extend(
+                cache.get(
+                    "context_pack",
+                    [context_pack_path.as_posix(), pack_sig, pack_max_lines, pack_max_chars],
+                    lambda: _context_pack_lines(context_pack_path, pack_max_lines, pack_max_chars),
+                )
+            )
+
+        tasklist_sig = _signature(tasklist)
+        if tasklist_sig is not None:
+            parts.extend(
+                cache.get(
+                    "tasklist",
+                    [tasklist.as_posix(), tasklist_sig, max_tasks],
+                    lambda: _tasklist_lines(tasklist, max_tasks),
+                )
+            )
 
     if ws_cfg.get("include_git_status", True):
-        branch = _run_git(project_dir, ["rev-parse", "--abbrev-ref", "HEAD"])
-        status = _run_git(project_dir, ["status", "--porcelain", "-uno"])
-        if branch or status:
-            parts.append("#### Repo state")
-            if branch:
-                parts.append(f"- Branch: {branch}")
-            if status:
-                lines = status.splitlines()
-                max_lines = int(ws_cfg.get("max_git_status_lines", 60))
-                lines = lines[:max_lines]
-                parts.append(f"- Dirty files: {len(lines)}")
-                for line in lines[: min(10, len(lines))]:
-                    parts.append(f"  - {line}")
-            parts.append("")
+        max_status_lines = int(ws_cfg.get("max_git_status_lines", 60))
+        git_key = _git_state_key(project_dir)
+        if git_key is None:
+            parts.extend(_repo_state_lines(project_dir, max_status_lines))
+        else:
+            # `git status` refreshes the index it reads, so the key is retaken after a rebuild.
+            # Unstaged edits to tracked files move neither HEAD nor the index, so the cached
+            # status is also bounded in age.
+            parts.extend(
+                cache.get(
+                    "repo_state",
+                    [project_dir.as_posix(), git_key, max_status_lines],
+                    lambda: _repo_state_lines(project_dir, max_status_lines),
+                    max_age=float(ws_cfg.get("git_status_cache_seconds", 30)),
+                    rekey=lambda: [project_dir.as_posix(), _git_state_key(project_dir), max_status_lines],
+                )
+            )
 
+    cache.flush()
     text = "\n".join(parts).strip()
     if len(text) > max_chars:
         text = text[: max_chars - 120].rstrip() + "\n\n... (truncated)\n"
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import subprocess
 import sys
 from pathlib import Path
 from typing import Iterable
@@ -66,6 +68,8 @@ DEFAULT_EXCLUDE_DIRS = [
     "testFixtures",
 ]
 DOCS_PREFIX = "docs/"
+INDEX_CACHE_NAME = "gate-tests.index.json"
+INDEX_CACHE_VERSION = 1
 
 
 def _bootstrap() -> None:
@@ -143,6 +147,161 @@ def _unique(seq: Iterable[str]) -> list[str]:
     return out
 
 
+def _expected_test_paths(
+    path: str,
+    root_dir: str,
+    test_patterns: list[str],
+    test_exts: list[str],
+) -> list[str]:
+    rel = path[len(root_dir) + 1 :]
+    rel_dir = str(Path(rel).parent)
+    rel_dir = "" if rel_dir == "." else rel_dir
+    base = Path(path).stem
+    ext = f".{path.rsplit('.', 1)[1].lower()}"
+
+    expected_paths: list[str] = []
+    for pattern in test_patterns:
+        if not pattern:
+            continue
+        use_test_ext = "{test_ext}" in pattern
+        ext_candidates = test_exts if use_test_ext and test_exts else [ext]
+        for test_ext in ext_candidates:
+            candidate_path = (
+                pattern.replace("{rel_dir}", rel_dir)
+                .replace("{rel_path}", rel)
+                .replace("{base}", base)
+                .replace("{ext}", ext)
+                .replace("{test_ext}", test_ext)
+            )
+            while "//" in candidate_path:
+                candidate_path = candidate_path.replace("//", "/")
+            candidate_path = candidate_path.lstrip("./")
+            expected_paths.append(candidate_path)
+    return _unique(expected_paths)
+
+
+def _pattern_prefixes(test_patterns: list[str]) -> list[str]:
+    """Static leading directories of test patterns; an empty prefix means "any path"."""
+    prefixes: list[str] = []
+    for pattern in test_patterns:
+        static = pattern.split("{", 1)[0]
+        prefixes.append(static.rsplit("/", 1)[0] + "/" if "/" in static else "")
+    return _unique(prefixes)
+
+
+def _git_index_path(root: Path) -> Path | None:
+    for parent in (root, *root.parents):
+        git_dir = parent / ".git"
+        if git_dir.is_dir():
+            return git_dir / "index"
+        if git_dir.exists():
+            # worktrees/submodules keep the index elsewhere; skip persistent caching
+            return None
+    return None
+
+
+def _git_tracked_files(root: Path) -> list[str] | None:
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-z", "--cached"],
+            cwd=str(root),
+            capture_output=True,
+            timeout=3,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return [item for item in proc.stdout.decode("utf-8", errors="replace").split("\0") if item]
+
+
+class TestFileIndex:
+    """In-memory set of candidate test files built from `git ls-files` plus untracked paths.
+
+    Membership is only a positive filter: a hit is confirmed with a single stat so files
+    deleted from the worktree but still present in the git index are not reported as tests,
+    and callers confirm misses on disk (ignored test files are not in the listing).
+    """
+
+    def __init__(self, root: Path, files: Iterable[str]) -> None:
+        self.root = root
+        self.files = set(files)
+
+    def has_any(self, expected_paths: list[str]) -> bool:
+        for candidate in expected_paths:
+            if candidate in self.files and (self.root / candidate).is_file():
+                return True
+        return False
+
+    def sources_with_tests(
+        self,
+        targets: list[tuple[str, str]],
+        test_patterns: list[str],
+        test_exts: list[str],
+    ) -> set[str]:
+        covered: set[str] = set()
+        for path, root_dir in targets:
+            if self.has_any(_expected_test_paths(path, root_dir, test_patterns, test_exts)):
+                covered.add(path)
+        return covered
+
+
+def _load_test_index(root: Path, test_patterns: list[str], untracked: list[str]) -> TestFileIndex | None:
+    """Build the test-file index, reusing the tracked listing while the git index mtime is unchanged."""
+    index_path = _git_index_path(root)
+    if index_path is None:
+        return None
+    prefixes = _pattern_prefixes(test_patterns)
+    try:
+        stat = index_path.stat()
+        index_key = [stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        index_key = None
+    patterns_hash = hashlib.sha256(json.dumps(prefixes).encode("utf-8")).hexdigest()
+    cache_path = root / ".cache" / INDEX_CACHE_NAME
+
+    tracked: list[str] | None = None
+    if index_key is not None:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+        if (
+            isinstance(cached, dict)
+            and cached.get("version") == INDEX_CACHE_VERSION
+            and cached.get("index") == index_key
+            and cached.get("patterns_hash") == patterns_hash
+            and isinstance(cached.get("files"), list)
+        ):
+            tracked = [str(item) for item in cached["files"]]
+
+    if tracked is None:
+        listed = _git_tracked_files(root)
+        if listed is None:
+            return None
+        if "" in prefixes:
+            tracked = listed
+        else:
+            prefix_tuple = tuple(prefixes)
+            tracked = [item for item in listed if item.startswith(prefix_tuple)]
+        if index_key is not None:
+            payload = {
+                "version": INDEX_CACHE_VERSION,
+                "index": index_key,
+                "patterns_hash": patterns_hash,
+                "files": tracked,
+            }
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+                tmp_path.replace(cache_path)
+            except OSError:
+                pass
+
+    return TestFileIndex(root, [*tracked, *(_normalize_path(item) for item in untracked)])
+
+
 def _load_tests_config(root: Path) -> dict[str, list[str]]:
     config_path = root / "config" / "gates.json"
     try:
@@ -414,36 +573,19 @@ def main() -> int:
     event_status = "fail"
     event_should_log = True
     try:
+        targets = list(zip(target_files, target_roots))
+        test_index = _load_test_index(root, test_patterns, changed_files)
+        covered: set[str] | None = None
+        if test_index is not None:
+            covered = test_index.sources_with_tests(targets, test_patterns, test_exts)
+
         missing_files: list[str] = []
         missing_tests: list[str] = []
-        for path, root_dir in zip(target_files, target_roots):
-            rel = path[len(root_dir) + 1 :]
-            rel_dir = str(Path(rel).parent)
-            rel_dir = "" if rel_dir == "." else rel_dir
-            base = Path(path).stem
-            ext = f".{path.rsplit('.', 1)[1].lower()}"
-
-            expected_paths: list[str] = []
-            for pattern in test_patterns:
-                if not pattern:
-                    continue
-                use_test_ext = "{test_ext}" in pattern
-                ext_candidates = test_exts if use_test_ext and test_exts else [ext]
-                for test_ext in ext_candidates:
-                    candidate_path = (
-                        pattern.replace("{rel_dir}", rel_dir)
-                        .replace("{rel_path}", rel)
-                        .replace("{base}", base)
-                        .replace("{ext}", ext)
-                        .replace("{test_ext}", test_ext)
-                    )
-                    while "//" in candidate_path:
-                        candidate_path = candidate_path.replace("//", "/")
-                    candidate_path = candidate_path.lstrip("./")
-                    expected_paths.append(candidate_path)
-
-            expected_paths = _unique(expected_paths)
-            has_tests = any((root / p).is_file() for p in expected_paths)
+        for path, root_dir in targets:
+            expected_paths = _expected_test_paths(path, root_dir, test_patterns, test_exts)
+            has_tests = covered is not None and path in covered
+            if not has_tests:
+                has_tests = any((root / p).is_file() for p in expected_paths)
             if has_tests:
                 if ticket:
                     _emit_research_hint(root, path, ticket, slug_hint)
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import datetime as dt
 import io
 import json
 import os
 import re
 import sys
-from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Optional
 
@@ -252,19 +252,21 @@ def _loop_preflight_guard(root: Path, ticket: str, stage: str, hooks_mode: str)
 
 def _run_plan_review_gate(root: Path, ticket: str, file_path: str, branch: str) -> tuple[int, str]:
     from aidd_runtime import plan_review_gate
+    from hooks import hooklib
 
     args = ["--ticket", ticket, "--file-path", file_path, "--skip-on-plan-edit"]
     if branch:
         args.extend(["--branch", branch])
     parsed = plan_review_gate.parse_args(args)
     buf = io.StringIO()
-    with redirect_stdout(buf):
-        status = plan_review_gate.run_gate(parsed)
+    with hooklib.capture_stream("stdout", buf):
+        status = plan_review_gate.run_gate(parsed, target=root)
     return status, buf.getvalue().strip()
 
 
 def _run_prd_review_gate(root: Path, ticket: str, slug_hint: str, file_path: str, branch: str) -> tuple[int, str]:
     from aidd_runtime import prd_review_gate
+    from hooks import hooklib
 
     args = ["--ticket", ticket, "--file-path", file_path, "--skip-on-prd-edit"]
     if slug_hint:
@@ -273,13 +275,14 @@ def _run_prd_review_gate(root: Path, ticket: str, slug_hint: str, file_path: str
         args.extend(["--branch", branch])
     parsed = prd_review_gate.parse_args(args)
     buf = io.StringIO()
-    with redirect_stdout(buf):
-        status = prd_review_gate.run_gate(parsed)
+    with hooklib.capture_stream("stdout", buf):
+        status = prd_review_gate.run_gate(parsed, target=root)
     return status, buf.getvalue().strip()
 
 
 def _run_tasklist_check(root: Path, ticket: str, slug_hint: str, branch: str) -> tuple[int, str]:
     from aidd_runtime import tasklist_check
+    from hooks import hooklib
 
     args = ["--ticket", ticket, "--quiet-ok"]
     if slug_hint:
@@ -288,16 +291,17 @@ def _run_tasklist_check(root: Path, ticket: str, slug_hint: str, branch: str) ->
         args.extend(["--branch", branch])
     parsed = tasklist_check.parse_args(args)
     buf = io.StringIO()
-    with redirect_stderr(buf):
-        status = tasklist_check.run_check(parsed)
+    with hooklib.capture_stream("stderr", buf):
+        status = tasklist_check.run_check(parsed, target=root)
     return status, buf.getvalue().strip()
 
 
 def _reviewer_notice(root: Path, ticket: str, slug_hint: str) -> str:
-    config_path = root / "config" / "gates.json"
+    from aidd_runtime import config_cache
+
     try:
-        config = json.loads(config_path.read_text(encoding="utf-8"))
-    except Exception:
+        config = config_cache.gates_config(root)
+    except ValueError:
         return ""
 
     reviewer_cfg = config.get("reviewer") or {}
@@ -382,10 +386,11 @@ def _reviewer_notice(root: Path, ticket: str, slug_hint: str) -> str:
 
 
 def _handoff_block(root: Path, ticket: str, slug_hint: str, branch: str, tasklist_path: Path) -> str:
-    config_path = root / "config" / "gates.json"
+    from aidd_runtime import config_cache
+
     try:
-        config = json.loads(config_path.read_text(encoding="utf-8"))
-    except Exception:
+        config = config_cache.gates_config(root)
+    except ValueError:
         config = {}
 
     def marker_for(path: Path) -> str:
@@ -549,6 +554,7 @@ def main() -> int:
     from aidd_runtime.analyst_guard import AnalystValidationError, load_settings as load_analyst_settings, validate_prd
     from aidd_runtime.progress import ProgressConfig, check_progress
     from aidd_runtime.research_guard import ResearchValidationError, load_settings as load_research_settings, validate_research
+    from aidd_runtime import gate_verdicts, git_objects, runtime
 
     ctx = hooklib.read_hook_context()
     root, used_workspace = hooklib.resolve_project_root(ctx)
@@ -564,7 +570,6 @@ def main() -> int:
         )
         return 2
 
-    os.chdir(root)
     hooks_mode = hooklib.resolve_hooks_mode()
     fast_mode = hooks_mode == "fast"
 
@@ -644,6 +649,25 @@ def main() -> int:
     event_status = "fail"
     event_should_log = True
     fast_mode_warn = False
+    repo = git_objects.repo_info(root)
+    head = git_objects.reader(root).info("HEAD") if repo is not None else None
+    git_index = repo.git_dir / "index" if repo is not None else None
+    verdicts = gate_verdicts.VerdictCache(
+        root,
+        ticket,
+        common=gate_verdicts.GateInputs(
+            files=(root / "config" / "gates.json",),
+            values=gate_verdicts.values(
+                ticket=ticket,
+                slug_hint=slug_hint,
+                stage=active_stage,
+                branch=current_branch,
+                hooks_mode=hooks_mode,
+                docs_only=runtime.docs_only_mode_requested(),
+                head=head.oid if head is not None else "",
+            ),
+        ),
+    )
     try:
         hooklib.ensure_template(root, "docs/research/template.md", root / "docs" / "research" / f"{ticket}.md")
         hooklib.ensure_template(root, "docs/prd/template.md", root / "docs" / "prd" / f"{ticket}.prd.md")
@@ -663,14 +687,27 @@ def main() -> int:
             _log_stderr(f"BLOCK: нет PRD → запустите /feature-dev-aidd:idea-new {ticket}")
             return 2
 
-        analyst_settings = load_analyst_settings(root)
-        try:
-            validate_prd(root, ticket, settings=analyst_settings, branch=current_branch or None)
-        except AnalystValidationError as exc:
-            _log_stderr(str(exc))
+        prd_path = root / "docs" / "prd" / f"{ticket}.prd.md"
+
+        def _analyst_verdict() -> gate_verdicts.GateVerdict:
+            analyst_settings = load_analyst_settings(root)
+            try:
+                validate_prd(root, ticket, settings=analyst_settings, branch=current_branch or None)
+            except AnalystValidationError as exc:
+                return gate_verdicts.GateVerdict(status=2, stderr=str(exc))
+            return gate_verdicts.GateVerdict(status=0)
+
+        verdict, _ = verdicts.run("analyst", gate_verdicts.GateInputs(files=(prd_path,)), _analyst_verdict)
+        if verdict.status != 0:
+            _log_stderr(verdict.stderr)
             return 2
 
-        status, output = _run_plan_review_gate(root, ticket, file_path, current_branch)
+        verdict, _ = verdicts.run(
+            "plan_review",
+            gate_verdicts.GateInputs(files=(plan_path,), values=gate_verdicts.values(file_path=file_path)),
+            lambda: gate_verdicts.GateVerdict(*_run_plan_review_gate(root, ticket, file_path, current_branch)),
+        )
+        status, output = verdict.status, verdict.stdout
         if status != 0:
             if fast_mode and active_stage == "implement":
                 fast_mode_warn = True
@@ -685,7 +722,16 @@ def main() -> int:
                     _log_stderr(f"BLOCK: Plan Review не готов → выполните /feature-dev-aidd:review-spec {ticket}")
                 return 2
 
-        status, output = _run_prd_review_gate(root, ticket, slug_hint, file_path, current_branch)
+        verdict, _ = verdicts.run(
+            "prd_review",
+            gate_verdicts.GateInputs(
+                files=(prd_path,),
+                dirs=(root / "reports" / "prd",),
+                values=gate_verdicts.values(file_path=file_path),
+            ),
+            lambda: gate_verdicts.GateVerdict(*_run_prd_review_gate(root, ticket, slug_hint, file_path, current_branch)),
+        )
+        status, output = verdict.status, verdict.stdout
         if status != 0:
             if fast_mode and active_stage == "implement":
                 fast_mode_warn = True
@@ -700,22 +746,52 @@ def main() -> int:
                     _log_stderr(f"BLOCK: PRD Review не готов → выполните /feature-dev-aidd:review-spec {ticket}")
                 return 2
 
-        research_settings = load_research_settings(root)
-        try:
-            research_stage = active_stage or "review"
-            research_summary = validate_research(
-                root,
-                ticket,
-                settings=research_settings,
-                branch=current_branch or None,
-                expected_stage=research_stage,
-                allow_scoped_links_empty_warn=research_stage in {"plan", "review", "qa"},
+        research_stage = active_stage or "review"
+
+        def _research_verdict() -> gate_verdicts.GateVerdict:
+            research_settings = load_research_settings(root)
+            captured = io.StringIO()
+            try:
+                with hooklib.capture_stream("stderr", captured):
+                    research_summary = validate_research(
+                        root,
+                        ticket,
+                        settings=research_settings,
+                        branch=current_branch or None,
+                        expected_stage=research_stage,
+                        allow_scoped_links_empty_warn=research_stage in {"plan", "review", "qa"},
+                    )
+            except ResearchValidationError as exc:
+                return gate_verdicts.GateVerdict(status=2, stdout=str(exc), stderr=captured.getvalue())
+            return gate_verdicts.GateVerdict(
+                status=0,
+                stderr=captured.getvalue(),
+                data={"skipped_reason": research_summary.skipped_reason or ""},
+            )
+
+        if git_index is not None:
+            # Language detection for RLM requirements reads the git file listing, so the index is an input too.
+            verdict, _ = verdicts.run(
+                "research",
+                gate_verdicts.GateInputs(
+                    files=(root / "docs" / "research" / f"{ticket}.md", git_index),
+                    dirs=(root / "reports" / "research",),
+                    values=gate_verdicts.values(
+                        stage=research_stage,
+                        utc_date=dt.datetime.now(dt.timezone.utc).date().isoformat(),
+                    ),
+                ),
+                _research_verdict,
             )
-        except ResearchValidationError as exc:
-            _log_stderr(str(exc))
+        else:
+            verdict = _research_verdict()
+        if verdict.stderr:
+            sys.stderr.write(verdict.stderr)
+        if verdict.status != 0:
+            _log_stderr(verdict.stdout)
             return 2
 
-        if research_summary.skipped_reason == "pending-baseline":
+        if verdict.data.get("skipped_reason") == "pending-baseline":
             event_status = "pass"
             return 0
 
@@ -766,6 +842,7 @@ def main() -> int:
         event_status = "warn" if fast_mode_warn else "pass"
         return 0
     finally:
+        verdicts.flush()
         if event_should_log:
             hooklib.append_event(root, "gate-workflow", event_status, source="hook gate-workflow")
 
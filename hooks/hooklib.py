@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import datetime as dt
+import io
 import json
 import os
 import shutil
 import subprocess
 import sys
+import threading
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, TextIO
 
-from aidd_runtime import stage_lexicon
+from aidd_runtime import config_cache, git_objects, stage_lexicon
 from aidd_runtime.resources import DEFAULT_PROJECT_SUBDIR, resolve_project_root as resolve_workspace_root
 
 
@@ -25,6 +28,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "context_pack_max_chars": 1200,
         "include_git_status": True,
         "max_git_status_lines": 80,
+        "git_status_cache_seconds": 30,
     },
     "context_limits": {
         "mode": "tokens",
@@ -213,26 +217,25 @@ def resolve_aidd_root(project_dir: Path) -> Optional[Path]:
 
 
 def load_config(aidd_root: Optional[Path]) -> Dict[str, Any]:
-    cfg = json.loads(json.dumps(DEFAULT_CONFIG))
+    cfg = config_cache.thaw(DEFAULT_CONFIG)
     if not aidd_root:
         return cfg
 
     path = aidd_root / "config" / "context_gc.json"
-    if not path.exists():
-        return cfg
-
     try:
-        user_cfg = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:
+        user_cfg = config_cache.load_json(path)
+    except ValueError as exc:
         print(f"Failed to read {path}: {exc}", file=sys.stderr)
         return cfg
+    if not isinstance(user_cfg, dict):
+        return cfg
 
     def deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
         for key, value in src.items():
             if isinstance(value, dict) and isinstance(dst.get(key), dict):
                 dst[key] = deep_merge(dict(dst[key]), value)
             else:
-                dst[key] = value
+                dst[key] = config_cache.thaw(value)
         return dst
 
     return deep_merge(cfg, user_cfg)
@@ -406,6 +409,60 @@ def prefix_lines(prefix: str, text: str) -> str:
     return "\n".join(f"{prefix} {line}" for line in text.splitlines())
 
 
+class ThreadStreamRouter(io.TextIOBase):
+    """Stand-in for ``sys.stdout``/``sys.stderr`` that sends each thread's writes to its own buffer.
+
+    Installed by the Stop cascade while gates run in threads; ``contextlib.redirect_*`` would swap
+    the stream for every thread at once, so gates capture through :func:`capture_stream` instead.
+    """
+
+    def __init__(self, fallback: TextIO) -> None:
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def _target(self) -> TextIO:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else self.fallback
+
+    @contextmanager
+    def capture(self, buf: TextIO) -> Iterator[TextIO]:
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(buf)
+        try:
+            yield buf
+        finally:
+            stack.pop()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self.fallback, "encoding", None) or "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+
+@contextmanager
+def capture_stream(name: str, buf: TextIO) -> Iterator[TextIO]:
+    """``redirect_stdout``/``redirect_stderr`` that only captures the current thread under a router."""
+    stream = getattr(sys, name)
+    if isinstance(stream, ThreadStreamRouter):
+        with stream.capture(buf):
+            yield buf
+        return
+    redirect = redirect_stdout if name == "stdout" else redirect_stderr
+    with redirect(buf):
+        yield buf
+
+
 def _run_git(cwd: Path, args: Sequence[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         ["git", *args],
@@ -416,15 +473,11 @@ def _run_git(cwd: Path, args: Sequence[str]) -> subprocess.CompletedProcess[str]
 
 
 def git_has_head(cwd: Path) -> bool:
-    result = _run_git(cwd, ["rev-parse", "--verify", "HEAD"])
-    return result.returncode == 0
+    return git_objects.has_head(cwd)
 
 
 def git_current_branch(cwd: Path) -> str:
-    result = _run_git(cwd, ["rev-parse", "--abbrev-ref", "HEAD"])
-    if result.returncode != 0:
-        return ""
-    return (result.stdout or "").strip()
+    return git_objects.current_branch(cwd)
 
 
 def collect_changed_files(cwd: Path) -> list[str]:
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 
+try:  # Python 3.11+
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - python 3.10 falls back to line-based extraction
+    tomllib = None
+
 
 HOOK_PREFIX = "[lint-deps]"
 
@@ -97,6 +103,22 @@ PIPFILE_LOCK_IGNORE = {
     "develop",
 }
 
+PACKAGE_JSON_DEP_SECTIONS = (
+    "dependencies",
+    "devDependencies",
+    "peerDependencies",
+    "optionalDependencies",
+)
+
+CARGO_DEP_SECTIONS = (
+    "dependencies",
+    "dev-dependencies",
+    "build-dependencies",
+)
+
+CACHE_NAME = "lint-deps.json"
+CACHE_VERSION = 1
+
 
 def _bootstrap() -> Path:
     raw = os.environ.get("CLAUDE_PLUGIN_ROOT")
@@ -154,6 +176,66 @@ def _resolve_dep_files(config_path: Path) -> list[str]:
     return list(DEFAULT_DEPS_FILES)
 
 
+def _compile_dep_matcher(patterns: list[str]) -> re.Pattern[str]:
+    """Compile dependency-file globs into one regex; a leading `**/` also matches top-level files."""
+    parts: list[str] = []
+    for pattern in patterns:
+        parts.append(translate(pattern))
+        if pattern.startswith("**/"):
+            parts.append(translate(pattern[3:]))
+    if not parts:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{part})" for part in parts))
+
+
+def _git_head_state(root: Path) -> tuple[Path, str] | None:
+    result = _run_git(root, ["rev-parse", "--show-toplevel", "--verify", "HEAD"])
+    if result.returncode != 0:
+        return None
+    lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    if len(lines) != 2:
+        return None
+    return Path(lines[0]), lines[1]
+
+
+def _blob_id(data: bytes) -> str:
+    header = f"blob {len(data)}\0".encode("ascii")
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def _read_head_blobs(toplevel: Path, paths: list[str]) -> dict[str, str | None]:
+    """Read HEAD versions of several files through a single `git cat-file --batch` call."""
+    blobs: dict[str, str | None] = {path: None for path in paths}
+    if not paths:
+        return blobs
+    request = "".join(f"HEAD:{path}\n" for path in paths).encode("utf-8")
+    try:
+        proc = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            cwd=str(toplevel),
+            input=request,
+            capture_output=True,
+        )
+    except OSError:
+        return blobs
+    if proc.returncode != 0:
+        return blobs
+    data = proc.stdout
+    offset = 0
+    for path in paths:
+        newline = data.find(b"\n", offset)
+        if newline < 0:
+            break
+        header = data[offset:newline].split()
+        offset = newline + 1
+        if len(header) != 3 or header[1] != b"blob":
+            continue
+        size = int(header[2])
+        blobs[path] = data[offset : offset + size].decode("utf-8", errors="replace")
+        offset += size + 1
+    return blobs
+
+
 def _parse_diff_added_lines(diff_text: str) -> dict[str, list[str]]:
     result: dict[str, list[str]] = {}
     current_path: str | None = None
@@ -477,6 +559,240 @@ def _extract_dependencies(path: str, lines: list[str]) -> set[str]:
     return set()
 
 
+def _requirement_names(values: object) -> set[str]:
+    deps: set[str] = set()
+    if isinstance(values, dict):
+        values = [item for group in values.values() if isinstance(group, list) for item in group]
+    if not isinstance(values, list):
+        return deps
+    for raw in values:
+        if not isinstance(raw, str):
+            continue
+        name = _clean_requirement(raw)
+        if name:
+            deps.add(name)
+    return deps
+
+
+def _table_keys(table: object, *, skip: set[str] | None = None) -> set[str]:
+    if not isinstance(table, dict):
+        return set()
+    return {str(key) for key in table if not skip or str(key).lower() not in skip}
+
+
+def _structured_package_json(text: str) -> set[str] | None:
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    deps: set[str] = set()
+    for section in PACKAGE_JSON_DEP_SECTIONS:
+        deps.update(_table_keys(payload.get(section)))
+    return deps
+
+
+def _load_toml(text: str) -> dict | None:
+    if tomllib is None:
+        return None
+    try:
+        return tomllib.loads(text)
+    except (tomllib.TOMLDecodeError, ValueError):
+        return None
+
+
+def _structured_cargo(text: str) -> set[str] | None:
+    payload = _load_toml(text)
+    if payload is None:
+        return None
+    tables = [payload, payload.get("workspace") or {}]
+    target = payload.get("target")
+    if isinstance(target, dict):
+        tables.extend(item for item in target.values() if isinstance(item, dict))
+    deps: set[str] = set()
+    for table in tables:
+        if not isinstance(table, dict):
+            continue
+        for section in CARGO_DEP_SECTIONS:
+            deps.update(_table_keys(table.get(section)))
+    return deps
+
+
+def _structured_pyproject(text: str) -> set[str] | None:
+    payload = _load_toml(text)
+    if payload is None:
+        return None
+    deps: set[str] = set()
+    project = payload.get("project") or {}
+    if isinstance(project, dict):
+        deps.update(_requirement_names(project.get("dependencies")))
+        deps.update(_requirement_names(project.get("optional-dependencies")))
+    build_system = payload.get("build-system") or {}
+    if isinstance(build_system, dict):
+        deps.update(_requirement_names(build_system.get("requires")))
+    groups = payload.get("dependency-groups")
+    if isinstance(groups, dict):
+        for group in groups.values():
+            deps.update(_requirement_names(group))
+    tool = payload.get("tool") or {}
+    poetry = tool.get("poetry") if isinstance(tool, dict) else None
+    if isinstance(poetry, dict):
+        for section in ("dependencies", "dev-dependencies"):
+            deps.update(_table_keys(poetry.get(section), skip={"python"}))
+        poetry_groups = poetry.get("group")
+        if isinstance(poetry_groups, dict):
+            for group in poetry_groups.values():
+                if isinstance(group, dict):
+                    deps.update(_table_keys(group.get("dependencies"), skip={"python"}))
+    return deps
+
+
+def _structured_pipfile_lock(text: str) -> set[str] | None:
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    deps: set[str] = set()
+    for section in ("default", "develop"):
+        deps.update(_table_keys(payload.get(section)))
+    return deps
+
+
+def _structured_poetry_lock(text: str) -> set[str] | None:
+    payload = _load_toml(text)
+    if payload is None:
+        return None
+    packages = payload.get("package")
+    if not isinstance(packages, list):
+        return set()
+    return {str(item["name"]) for item in packages if isinstance(item, dict) and item.get("name")}
+
+
+STRUCTURED_EXTRACTORS = {
+    "package.json": _structured_package_json,
+    "cargo.toml": _structured_cargo,
+    "pyproject.toml": _structured_pyproject,
+    "pipfile.lock": _structured_pipfile_lock,
+    "poetry.lock": _structured_poetry_lock,
+}
+
+
+def _structured_added_dependencies(path: str, new_text: str, old_text: str | None) -> set[str] | None:
+    """Diff two manifest versions structurally; None means the caller should fall back to line diffs."""
+    extractor = STRUCTURED_EXTRACTORS.get(Path(path).name.lower())
+    if extractor is None:
+        return None
+    new_deps = extractor(new_text)
+    if new_deps is None:
+        return None
+    old_deps: set[str] = set()
+    if old_text is not None:
+        parsed_old = extractor(old_text)
+        if parsed_old is None:
+            return None
+        old_deps = parsed_old
+    return new_deps - old_deps
+
+
+def _load_cache(path: Path) -> dict[str, dict]:
+    payload = _load_json(path)
+    if payload.get("version") != CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_cache(path: Path, entries: dict[str, dict]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": entries}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+    except OSError:
+        return
+
+
+def _changed_tracked_paths(toplevel: Path) -> list[str]:
+    """Toplevel-relative paths of tracked files that differ from HEAD.
+
+    Untracked files are left out: like the `git diff HEAD` this hook has always linted, they
+    add no dependency lines until they are staged.
+    """
+    result = _run_git(toplevel, ["diff", "--name-only", "--no-renames", "HEAD"])
+    if result.returncode != 0:
+        return []
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def _unallowed_dependencies(
+    root: Path,
+    head_state: tuple[Path, str],
+    dep_paths: list[str],
+    allowed: set[str],
+) -> list[tuple[str, list[str]]]:
+    """Return disallowed added dependencies per changed manifest, reusing cached per-blob results."""
+    toplevel, head = head_state
+    allowed_lower = {item.lower() for item in allowed}
+    allow_hash = hashlib.sha256("\n".join(sorted(allowed)).encode("utf-8")).hexdigest()
+    cache_path = root / ".cache" / CACHE_NAME
+    cache = _load_cache(cache_path)
+
+    keys: dict[str, str] = {}
+    texts: dict[str, str] = {}
+    results: dict[str, list[str]] = {}
+    misses: list[str] = []
+    for path in dep_paths:
+        try:
+            data = (toplevel / path).read_bytes()
+        except OSError:
+            continue
+        key = f"{head}:{_blob_id(data)}:{allow_hash}"
+        keys[path] = key
+        cached = cache.get(path)
+        if isinstance(cached, dict) and cached.get("key") == key and isinstance(cached.get("deps"), list):
+            results[path] = [str(item) for item in cached["deps"]]
+            continue
+        texts[path] = data.decode("utf-8", errors="replace")
+        misses.append(path)
+
+    added: dict[str, set[str]] = {}
+    line_based: list[str] = []
+    structured_paths = [path for path in misses if Path(path).name.lower() in STRUCTURED_EXTRACTORS]
+    head_blobs = _read_head_blobs(toplevel, structured_paths)
+    for path in misses:
+        deps = None
+        if path in head_blobs:
+            deps = _structured_added_dependencies(path, texts[path], head_blobs[path])
+        if deps is None:
+            line_based.append(path)
+        else:
+            added[path] = deps
+
+    if line_based:
+        result = _run_git(
+            toplevel,
+            ["diff", "--unified=0", "--no-color", "HEAD", "--", *(f":(literal){path}" for path in line_based)],
+        )
+        if result.returncode == 0:
+            for path, lines in _parse_diff_added_lines(result.stdout).items():
+                added[path] = _extract_dependencies(path, lines)
+
+    for path in misses:
+        deps = added.get(path, set())
+        results[path] = sorted(dep for dep in deps if dep not in allowed and dep.lower() not in allowed_lower)
+        cache[path] = {"key": keys[path], "deps": results[path]}
+    if misses:
+        _write_cache(cache_path, cache)
+
+    return [(path, results[path]) for path in dep_paths if results.get(path)]
+
+
 def main() -> int:
     _bootstrap()
     from hooks import hooklib
@@ -492,11 +808,17 @@ def main() -> int:
     if not hooklib.config_get_bool(config_path, "deps_allowlist", False):
         return 0
 
+    head_state = _git_head_state(root)
+    if head_state is None:
+        return 0
     dep_files = _resolve_dep_files(config_path)
-    if dep_files:
-        changed_files = hooklib.collect_changed_files(root)
-        if not any(fnmatch(path, pattern) for path in changed_files for pattern in dep_files):
-            return 0
+    dep_matcher = _compile_dep_matcher(dep_files)
+    # Without dependency globs every changed file is linted; extraction only knows manifests.
+    dep_paths = [
+        path for path in _changed_tracked_paths(head_state[0]) if not dep_files or dep_matcher.fullmatch(path)
+    ]
+    if not dep_paths:
+        return 0
 
     allow_path = root / "config" / "allowed-deps.txt"
     if not allow_path.is_file():
@@ -512,28 +834,8 @@ def main() -> int:
     if not allowed:
         return 0
 
-    added_lines: dict[str, list[str]] = {}
-    if hooklib.git_has_head(root):
-        result = _run_git(
-            root,
-            [
-                "diff",
-                "--unified=0",
-                "--no-color",
-                "HEAD",
-                "--",
-                *dep_files,
-            ],
-        )
-        if result.returncode == 0:
-            added_lines = _parse_diff_added_lines(result.stdout)
-
-    allowed_lower = {item.lower() for item in allowed}
-    for path, lines in added_lines.items():
-        deps = _extract_dependencies(path, lines)
-        for dep in sorted(deps):
-            if dep in allowed or dep.lower() in allowed_lower:
-                continue
+    for _path, deps in _unallowed_dependencies(root, head_state, dep_paths, allowed):
+        for dep in deps:
             _log_stdout(f"WARN: dependency '{dep}' не в allowlist (config/allowed-deps.txt)")
 
     return 0
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from hook_entrypoint import run_hook_module
+
+
+def main() -> int:
+    return run_hook_module(
+        hook_prefix="[stop-cascade]",
+        module_import_path="hooks.stop_cascade",
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
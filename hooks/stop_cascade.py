@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Stop/SubagentStop cascade: every Stop gate in one interpreter with a shared hook context.
+
+gate-workflow, gate-tests and lint-deps only read the workspace, so they run concurrently;
+context-gc-stop, gate-qa and format-and-test write reports or run commands and stay
+sequential. The concurrent gates keep the per-hook timeouts they had as separate hooks: a
+gate still running past its budget is reported as failed and left behind on a daemon thread.
+Each gate's output is captured separately and replayed in registration order, and the exit
+status is the most severe one (2 blocks, as with the standalone hooks).
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import io
+import os
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Sequence
+
+HOOK_PREFIX = "[stop-cascade]"
+HOOKS_DIR = Path(__file__).resolve().parent
+
+
+@dataclass(frozen=True)
+class StopGate:
+    name: str
+    script: str
+    parallel: bool = False
+    # Wall-clock budget for a parallel gate (0 = none); sequential gates share the hook timeout.
+    timeout_seconds: float = 0.0
+
+
+GATES: tuple[StopGate, ...] = (
+    StopGate("context-gc-stop", "context-gc-stop.sh"),
+    StopGate("gate-workflow", "gate-workflow.sh", parallel=True, timeout_seconds=5.0),
+    StopGate("gate-tests", "gate-tests.sh", parallel=True, timeout_seconds=5.0),
+    StopGate("lint-deps", "lint-deps.sh", parallel=True, timeout_seconds=10.0),
+    StopGate("gate-qa", "gate-qa.sh"),
+    StopGate("format-and-test", "format-and-test.sh"),
+)
+
+
+@dataclass
+class GateResult:
+    name: str
+    status: int
+    stdout: str
+    stderr: str
+    duration_ms: int
+
+
+def _bootstrap() -> None:
+    raw = os.environ.get("CLAUDE_PLUGIN_ROOT")
+    if not raw:
+        print(f"{HOOK_PREFIX} CLAUDE_PLUGIN_ROOT is required to run hooks.", file=sys.stderr)
+        raise SystemExit(2)
+    plugin_root = Path(raw).expanduser().resolve()
+    for path in (str(plugin_root), str(HOOKS_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    vendor_dir = HOOKS_DIR / "_vendor"
+    if vendor_dir.exists():
+        sys.path.insert(0, str(vendor_dir))
+
+
+def _load_script(script: str) -> ModuleType:
+    """Import a hook script (``*.sh`` files are Python) under a private module name."""
+    name = "_aidd_stop_" + Path(script).stem.replace("-", "_")
+    loader = importlib.machinery.SourceFileLoader(name, str(HOOKS_DIR / script))
+    spec = importlib.util.spec_from_loader(name, loader)
+    if spec is None:
+        raise ImportError(f"cannot load hook script {script}")
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def _exit_status(code: object, err: io.StringIO) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    err.write(f"{code}\n")
+    return 1
+
+
+def _run_gate(gate: StopGate, modules: Dict[str, ModuleType], router_out, router_err) -> GateResult:
+    out, err = io.StringIO(), io.StringIO()
+    started = time.monotonic()
+    with router_out.capture(out), router_err.capture(err):
+        try:
+            module = modules.get(gate.name)
+            if module is None:
+                module = _load_script(gate.script)
+            status = _exit_status(module.main(), err)
+        except SystemExit as exc:
+            status = _exit_status(exc.code, err)
+        except Exception:
+            err.write(f"[{gate.name}] hook crashed:\n{traceback.format_exc()}")
+            status = 1
+    duration_ms = int((time.monotonic() - started) * 1000)
+    return GateResult(gate.name, status, out.getvalue(), err.getvalue(), duration_ms)
+
+
+def _run_parallel(
+    gates: Sequence[StopGate], modules: Dict[str, ModuleType], router_out, router_err
+) -> Dict[str, GateResult]:
+    finished: Dict[str, GateResult] = {}
+
+    def _worker(gate: StopGate) -> None:
+        finished[gate.name] = _run_gate(gate, modules, router_out, router_err)
+
+    started = time.monotonic()
+    threads = []
+    for gate in gates:
+        # Daemon threads: a gate left running past its budget must not hold the process open.
+        thread = threading.Thread(target=_worker, args=(gate,), name=f"stop-gate-{gate.name}", daemon=True)
+        thread.start()
+        threads.append((gate, thread))
+    results: Dict[str, GateResult] = {}
+    for gate, thread in threads:
+        if gate.timeout_seconds > 0:
+            thread.join(max(started + gate.timeout_seconds - time.monotonic(), 0.0))
+        else:
+            thread.join()
+        if thread.is_alive():
+            results[gate.name] = GateResult(
+                gate.name,
+                1,
+                "",
+                f"[{gate.name}] timed out after {gate.timeout_seconds:g}s; result skipped.",
+                int((time.monotonic() - started) * 1000),
+            )
+        else:
+            results[gate.name] = finished[gate.name]
+    return results
+
+
+def combined_status(results: Sequence[GateResult]) -> int:
+    """2 when any gate blocks, else the first non-zero status, else 0."""
+    statuses = [result.status for result in results]
+    if 2 in statuses:
+        return 2
+    return next((status for status in statuses if status != 0), 0)
+
+
+def run_cascade(gates: Sequence[StopGate] = GATES) -> List[GateResult]:
+    from hooks import hooklib
+
+    payload = hooklib.read_hook_payload()
+    start_dir = Path.cwd()
+    if isinstance(payload, dict):
+        # Gates fall back to the process cwd; pin it before any of them chdir into the project.
+        payload.setdefault("cwd", str(start_dir))
+
+    modules: Dict[str, ModuleType] = {}
+    results: Dict[str, GateResult] = {}
+    for gate in gates:
+        if gate.parallel:
+            # Import on the main thread so module-level bootstrap never races.
+            try:
+                modules[gate.name] = _load_script(gate.script)
+            except SystemExit as exc:
+                err = io.StringIO()
+                results[gate.name] = GateResult(gate.name, _exit_status(exc.code, err), "", err.getvalue(), 0)
+            except Exception:
+                crash = f"[{gate.name}] hook crashed on import:\n{traceback.format_exc()}"
+                results[gate.name] = GateResult(gate.name, 1, "", crash, 0)
+
+    original_out, original_err = sys.stdout, sys.stderr
+    router_out = hooklib.ThreadStreamRouter(original_out)
+    router_err = hooklib.ThreadStreamRouter(original_err)
+    sys.stdout, sys.stderr = router_out, router_err
+    try:
+        parallel = [gate for gate in gates if gate.parallel and gate.name not in results]
+        for gate in gates:
+            if gate.name in results:
+                continue
+            os.chdir(start_dir)
+            if not gate.parallel:
+                results[gate.name] = _run_gate(gate, modules, router_out, router_err)
+                continue
+            results.update(_run_parallel(parallel, modules, router_out, router_err))
+    finally:
+        sys.stdout, sys.stderr = original_out, original_err
+        os.chdir(start_dir)
+    return [results[gate.name] for gate in gates]
+
+
+def _record_timings(results: Sequence[GateResult], status: int) -> None:
+    from hooks import hooklib
+
+    ctx = hooklib.read_hook_context()
+    root, _ = hooklib.resolve_project_root(ctx)
+    if not (root / "docs").is_dir():
+        return
+    details = {
+        "event": ctx.hook_event_name,
+        "gates": {item.name: {"status": item.status, "duration_ms": item.duration_ms} for item in results},
+    }
+    try:
+        hooklib.append_event(root, "stop-cascade", "fail" if status else "pass", details=details, source="hook stop-cascade")
+    except OSError:
+        pass
+
+
+def main() -> int:
+    _bootstrap()
+    results = run_cascade()
+    for result in results:
+        if result.stdout:
+            sys.stdout.write(result.stdout if result.stdout.endswith("\n") else result.stdout + "\n")
+        if result.stderr:
+            sys.stderr.write(result.stderr if result.stderr.endswith("\n") else result.stderr + "\n")
+    status = combined_status(results)
+    _record_timings(results, status)
+    return status
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
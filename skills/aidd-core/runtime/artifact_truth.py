@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 from aidd_runtime import gates
 from aidd_runtime import runtime
@@ -323,6 +323,16 @@ def collapse_events(events: Sequence[dict[str, Any]], *, enabled: bool = True) -
         return [dict(item) for item in events if isinstance(item, dict)]
 
     collapsed: list[dict[str, Any]] = []
+    extend_collapsed_events(collapsed, events)
+    return finalize_collapsed_events(collapsed)
+
+
+def extend_collapsed_events(collapsed: list[dict[str, Any]], events: Iterable[dict[str, Any]]) -> None:
+    """Fold events into a working collapse list (entries keep `_signature` until finalized).
+
+    Only the last entry can absorb new events, so callers may keep a bounded tail of `collapsed`
+    between calls and resume folding appended events incrementally.
+    """
     for raw in events:
         if not isinstance(raw, dict):
             continue
@@ -331,16 +341,16 @@ def collapse_events(events: Sequence[dict[str, Any]], *, enabled: bool = True) -
         sample_reason = str(
             details.get("summary") or details.get("reason") or details.get("reason_code") or ""
         ).strip()
-        signature = (
+        signature = [
             str(event.get("type") or "").strip(),
             str(event.get("status") or "").strip(),
             str(event.get("source") or "").strip(),
             sample_reason,
-        )
+        ]
         if collapsed:
             prev = collapsed[-1]
             prev_signature = prev.get("_signature")
-            if prev_signature == signature:
+            if isinstance(prev_signature, (list, tuple)) and list(prev_signature) == signature:
                 prev["repeat_count"] = int(prev.get("repeat_count") or 1) + 1
                 prev["last_seen"] = event.get("ts") or prev.get("last_seen") or prev.get("ts")
                 if sample_reason:
@@ -354,8 +364,11 @@ def collapse_events(events: Sequence[dict[str, Any]], *, enabled: bool = True) -
             event["sample_reason"] = sample_reason
         collapsed.append(event)
 
+
+def finalize_collapsed_events(collapsed: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     finalized: list[dict[str, Any]] = []
-    for event in collapsed:
+    for raw in collapsed:
+        event = dict(raw)
         event.pop("_signature", None)
         if int(event.get("repeat_count") or 1) <= 1:
             event.pop("repeat_count", None)
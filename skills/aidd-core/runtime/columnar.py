@@ -0,0 +1,109 @@
+"""Read-only access to columnar pack sections (``{"cols": [...], "rows": [[...], ...]}``).
+
+Packs store findings, test runs, matches and reuse candidates column-wise. Readers walk the
+packed arrays through :class:`ColumnarTable` instead of rebuilding one dict per row: rows are
+exposed as lightweight mapping views, and single columns or projections are read straight
+from the row lists.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+def is_columnar(value: object) -> bool:
+    return isinstance(value, dict) and isinstance(value.get("cols"), list) and isinstance(value.get("rows"), list)
+
+
+class Row(Mapping[str, Any]):
+    """Mapping view of one packed row; columns past the end of a short row are absent."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Sequence[Any]) -> None:
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        idx = self._index[key]
+        if idx >= len(self._values):
+            raise KeyError(key)
+        return self._values[idx]
+
+    def __iter__(self) -> Iterator[str]:
+        size = len(self._values)
+        return (col for col, idx in self._index.items() if idx < size)
+
+    def __len__(self) -> int:
+        return min(len(self._index), len(self._values))
+
+    def __repr__(self) -> str:
+        return f"Row({dict(self)!r})"
+
+
+class ColumnarTable:
+    """Lazy reader over a columnar section; iteration yields :class:`Row` views."""
+
+    __slots__ = ("cols", "_rows", "_index")
+
+    def __init__(self, cols: Sequence[object], rows: Sequence[object]) -> None:
+        self.cols: List[str] = [str(col) for col in cols]
+        self._rows = rows
+        # Last occurrence wins for duplicated column names, as with the inflated dicts.
+        self._index: Dict[str, int] = {col: idx for idx, col in enumerate(self.cols)}
+
+    @classmethod
+    def from_section(cls, section: object) -> Optional["ColumnarTable"]:
+        if not is_columnar(section):
+            return None
+        return cls(section["cols"], section["rows"])  # type: ignore[index]
+
+    def _iter_values(self) -> Iterator[list]:
+        if not self.cols:
+            return
+        for row in self._rows:
+            if isinstance(row, list) and row:
+                yield row
+
+    def __iter__(self) -> Iterator[Row]:
+        index = self._index
+        return (Row(index, values) for values in self._iter_values())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._iter_values())
+
+    def column(self, name: str) -> Iterator[Any]:
+        """Values of one column (None for rows too short to hold it)."""
+        idx = self._index.get(name)
+        for values in self._iter_values():
+            yield values[idx] if idx is not None and idx < len(values) else None
+
+    def project(self, *names: str) -> Iterator[Tuple[Any, ...]]:
+        positions = [self._index.get(name) for name in names]
+        for values in self._iter_values():
+            size = len(values)
+            yield tuple(values[idx] if idx is not None and idx < size else None for idx in positions)
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> Iterator[Row]:
+        """Rows whose ``name`` column satisfies ``predicate``; other cells are not touched."""
+        idx = self._index.get(name)
+        index = self._index
+        for values in self._iter_values():
+            value = values[idx] if idx is not None and idx < len(values) else None
+            if predicate(value):
+                yield Row(index, values)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self]
+
+
+def iter_records(section: object) -> Iterator[Mapping[str, Any]]:
+    """Rows of a columnar section, or the mapping entries of a plain list section."""
+    table = ColumnarTable.from_section(section)
+    if table is not None:
+        yield from table
+        return
+    if isinstance(section, list):
+        for item in section:
+            if isinstance(item, Mapping):
+                yield item
@@ -0,0 +1,155 @@
+"""Process-wide cache of parsed JSON config files (``gates.json``, ``conventions.json``).
+
+Each file is parsed once per process and handed out as a read-only view; the entry is
+re-read only when the file's ``(mtime_ns, size)`` changes, so long-lived processes see
+edits while hook cascades stop re-parsing the same document for every gate.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class FrozenDict(dict):
+    """``dict`` that rejects mutation; still passes ``isinstance(..., dict)`` and serialises as JSON."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("config views are read-only; copy with thaw() before editing")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+    __ior__ = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return thaw(self)
+
+
+class FrozenList(list):
+    """``list`` counterpart of :class:`FrozenDict`."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("config views are read-only; copy with thaw() before editing")
+
+    __setitem__ = __delitem__ = append = clear = extend = insert = pop = remove = reverse = sort = _readonly  # type: ignore[assignment]
+    __iadd__ = __imul__ = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> list:
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain mutable deep copy of a frozen view."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+EMPTY = FrozenDict()
+# Files modified this recently may be rewritten again within one timestamp tick without a size
+# change, so their cached entries are confirmed against the raw bytes (git's "racy clean" rule).
+RACY_WINDOW_NS = 2_000_000_000
+
+_Signature = Optional[Tuple[int, int]]
+
+
+class _Entry:
+    __slots__ = ("signature", "raw", "value", "error")
+
+    def __init__(self, signature: _Signature, raw: Optional[bytes], value: Any, error: Optional[Exception]) -> None:
+        self.signature = signature
+        self.raw = raw
+        self.value = value
+        self.error = error
+
+
+_ENTRIES: Dict[str, _Entry] = {}
+_LOCK = threading.Lock()
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _parse(signature: _Signature, raw: Optional[bytes]) -> _Entry:
+    if raw is None:
+        return _Entry(None, None, None, None)
+    racy = signature is not None and time.time_ns() - signature[0] < RACY_WINDOW_NS
+    try:
+        value = freeze(json.loads(raw.decode("utf-8")))
+    except (UnicodeDecodeError, ValueError) as exc:
+        return _Entry(signature, raw if racy else None, None, ValueError(str(exc)))
+    return _Entry(signature, raw if racy else None, value, None)
+
+
+def _read(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def load_json(path: Path) -> Optional[Any]:
+    """Frozen parse of ``path``; None when the file is missing.
+
+    Parse errors are cached alongside the signature and re-raised (``ValueError``) on every
+    call until the file changes, so callers keep their own error handling.
+    """
+    key = str(path.absolute())
+    signature = _signature(path)
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+    if entry is None or entry.signature != signature or (signature is not None and entry.raw is not None):
+        raw = _read(path) if signature is not None else None
+        if entry is None or entry.signature != signature or raw != entry.raw:
+            entry = _parse(signature if raw is not None else None, raw)
+        elif signature is not None and time.time_ns() - signature[0] >= RACY_WINDOW_NS:
+            entry.raw = None
+        with _LOCK:
+            _ENTRIES[key] = entry
+    if entry.error is not None:
+        raise entry.error
+    return entry.value
+
+
+def load_object(path: Path) -> FrozenDict:
+    """Like :func:`load_json` but a missing file or a non-object document reads as an empty mapping."""
+    value = load_json(path)
+    return value if isinstance(value, FrozenDict) else EMPTY
+
+
+def gates_config(root: Path) -> FrozenDict:
+    return load_object(root / "config" / "gates.json")
+
+
+def conventions(root: Path) -> FrozenDict:
+    return load_object(root / "config" / "conventions.json")
+
+
+def clear() -> None:
+    with _LOCK:
+        _ENTRIES.clear()
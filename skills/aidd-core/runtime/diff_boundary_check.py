@@ -37,6 +37,7 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import cache_helpers
+from aidd_runtime import git_objects
 from aidd_runtime import runtime
 
 IGNORE_PREFIXES = ("aidd/", ".aidd_audit/", ".claude/", ".cursor/")
@@ -174,21 +175,7 @@ def git_lines(args: List[str]) -> List[str]:
 
 
 def resolve_git_root(base: Path) -> Path:
-    try:
-        proc = subprocess.run(
-            ["git", "-C", str(base), "rev-parse", "--show-toplevel"],
-            text=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        )
-    except OSError:
-        return base
-    if proc.returncode != 0:
-        return base
-    root = proc.stdout.strip()
-    if not root:
-        return base
-    return Path(root).resolve()
+    return git_objects.toplevel(base) or base
 
 
 def collect_diff_files(base: Path) -> List[str]:
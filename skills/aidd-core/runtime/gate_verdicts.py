@@ -0,0 +1,145 @@
+"""Replayable gate verdicts keyed by a fingerprint of each gate's declared inputs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+CACHE_VERSION = 1
+DISABLE_ENV = "AIDD_GATE_VERDICT_CACHE"
+
+
+@dataclass(frozen=True)
+class GateInputs:
+    """What a gate reads: files, directories (direct children) and plain values such as branch or stage."""
+
+    files: Tuple[Path, ...] = ()
+    dirs: Tuple[Path, ...] = ()
+    values: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass
+class GateVerdict:
+    status: int
+    stdout: str = ""
+    stderr: str = ""
+    data: Dict[str, object] = field(default_factory=dict)
+
+
+def _stat_entry(path: Path) -> List[object]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return [path.as_posix(), None]
+    return [path.as_posix(), stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def _dir_entry(path: Path) -> List[object]:
+    try:
+        children = sorted(path.iterdir())
+    except OSError:
+        return [path.as_posix(), None]
+    return [path.as_posix(), [_stat_entry(child) for child in children if not child.is_dir()]]
+
+
+def fingerprint(gate: str, inputs: GateInputs, common: GateInputs) -> str:
+    payload = {
+        "version": CACHE_VERSION,
+        "gate": gate,
+        "files": [_stat_entry(path) for path in (*common.files, *inputs.files)],
+        "dirs": [_dir_entry(path) for path in (*common.dirs, *inputs.dirs)],
+        "values": sorted([*common.values, *inputs.values]),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def enabled() -> bool:
+    return os.environ.get(DISABLE_ENV, "").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class VerdictCache:
+    """Per-ticket store under ``aidd/.cache/gates``; one remembered verdict per gate."""
+
+    def __init__(self, root: Path, ticket: str, *, common: Optional[GateInputs] = None) -> None:
+        self.path = root / ".cache" / "gates" / f"{ticket}.json"
+        self.common = common or GateInputs()
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return {}
+        gates = payload.get("gates")
+        return gates if isinstance(gates, dict) else {}
+
+    def lookup(self, gate: str, key: str) -> Optional[GateVerdict]:
+        entry = self._entries.get(gate)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        verdict = entry.get("verdict")
+        if not isinstance(verdict, dict):
+            return None
+        try:
+            return GateVerdict(
+                status=int(verdict["status"]),
+                stdout=str(verdict.get("stdout") or ""),
+                stderr=str(verdict.get("stderr") or ""),
+                data=dict(verdict.get("data") or {}),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def store(self, gate: str, key: str, verdict: GateVerdict) -> None:
+        self._entries[gate] = {
+            "key": key,
+            "verdict": {
+                "status": verdict.status,
+                "stdout": verdict.stdout,
+                "stderr": verdict.stderr,
+                "data": verdict.data,
+            },
+        }
+        self._dirty = True
+
+    def run(self, gate: str, inputs: GateInputs, compute: Callable[[], GateVerdict]) -> Tuple[GateVerdict, bool]:
+        """Replay the stored verdict when the fingerprint matches, else compute and remember it.
+
+        Returns ``(verdict, replayed)``. Inputs are fingerprinted before ``compute`` runs so a gate that
+        rewrites one of its own inputs is re-evaluated next time instead of trusting a stale key.
+        """
+        if not enabled():
+            return compute(), False
+        key = fingerprint(gate, inputs, self.common)
+        cached = self.lookup(gate, key)
+        if cached is not None:
+            return cached, True
+        verdict = compute()
+        if fingerprint(gate, inputs, self.common) == key:
+            self.store(gate, key, verdict)
+        return verdict, False
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        payload = {"version": CACHE_VERSION, "gates": self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+def values(**items: object) -> Tuple[Tuple[str, str], ...]:
+    return tuple((name, "" if value is None else str(value)) for name, value in items.items())
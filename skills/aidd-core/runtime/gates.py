@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import shlex
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Iterable
 
+from aidd_runtime import config_cache
+
 DEFAULT_TESTS_POLICY = {
     "implement": "none",
     "review": "targeted",
@@ -14,6 +15,8 @@ DEFAULT_TESTS_POLICY = {
 
 TEST_EXECUTION_PROFILES = ("fast", "targeted", "full", "none")
 TEST_EXECUTION_WHEN = ("on_stop", "checkpoint", "manual")
+QA_TESTS_DEFAULT_MAX_WORKERS = 1
+QA_TESTS_DEFAULT_COMMAND_TIMEOUT_SECONDS = 0.0
 
 
 def _resolve_gates_path(target: Path) -> Path:
@@ -21,12 +24,11 @@ def _resolve_gates_path(target: Path) -> Path:
 
 
 def load_gates_config(target: Path) -> dict:
+    """Read-only view of ``gates.json``, parsed once per process (see ``config_cache``)."""
     path = _resolve_gates_path(target)
-    if not path.exists():
-        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:
+        return config_cache.load_object(path)
+    except ValueError as exc:
         raise ValueError(f"не удалось прочитать {path}: {exc}")
 
 
@@ -238,6 +240,31 @@ def load_qa_tests_contract(config: dict | None) -> tuple[dict, list[str]]:
     return contract, deduped_errors
 
 
+def _non_negative_number(value: object, default: float) -> float:
+    try:
+        number = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+    return number if number >= 0 else default
+
+
+def load_qa_tests_limits(config: dict | None) -> dict:
+    """Execution limits for qa.tests: worker cap and per-command/total deadlines in seconds (0 = none)."""
+    cfg = config if isinstance(config, dict) else {}
+    qa_cfg = cfg.get("qa")
+    tests_cfg = qa_cfg.get("tests") if isinstance(qa_cfg, dict) else None
+    if not isinstance(tests_cfg, dict):
+        tests_cfg = {}
+    max_workers = int(_non_negative_number(tests_cfg.get("max_workers"), QA_TESTS_DEFAULT_MAX_WORKERS))
+    return {
+        "max_workers": max(1, max_workers),
+        "command_timeout_seconds": _non_negative_number(
+            tests_cfg.get("command_timeout_seconds"), QA_TESTS_DEFAULT_COMMAND_TIMEOUT_SECONDS
+        ),
+        "total_timeout_seconds": _non_negative_number(tests_cfg.get("total_timeout_seconds"), 0.0),
+    }
+
+
 def load_qa_tests_contract_for_target(target: Path) -> tuple[dict, list[str]]:
     config = load_gates_config(target)
     return load_qa_tests_contract(config)
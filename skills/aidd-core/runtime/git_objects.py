@@ -0,0 +1,296 @@
+"""Long-lived ``git cat-file --batch`` readers for HEAD blobs, trees and existence checks.
+
+One reader pair (``--batch`` and ``--batch-check``) is kept per repository for the
+life of the process, so hook cascades and status scripts stop forking a git process
+(plus repo discovery) for every question they ask.  Every request runs under a read
+deadline: a pipe that stops answering is killed and the question answered with None.
+"""
+
+from __future__ import annotations
+
+import atexit
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RepoInfo:
+    toplevel: Path
+    git_dir: Path
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    oid: str
+    kind: str
+    size: int
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    mode: str
+    kind: str
+    oid: str
+    name: str
+
+
+READ_TIMEOUT_SECONDS = 5.0
+REPO_INFO_TIMEOUT_SECONDS = 3.0
+
+_REPO_CACHE: Dict[str, RepoInfo] = {}
+_READERS: Dict[str, "GitObjectReader"] = {}
+_LOCK = threading.Lock()
+
+
+class GitObjectReader:
+    """Serialises requests over ``git cat-file --batch`` / ``--batch-check`` pipes rooted at ``toplevel``."""
+
+    def __init__(self, toplevel: Path, *, read_timeout: float = READ_TIMEOUT_SECONDS) -> None:
+        self.toplevel = toplevel
+        self.read_timeout = read_timeout
+        self._lock = threading.Lock()
+        self._batch: Optional[subprocess.Popen[bytes]] = None
+        self._check: Optional[subprocess.Popen[bytes]] = None
+
+    def _spawn(self, mode: str) -> Optional[subprocess.Popen[bytes]]:
+        try:
+            return subprocess.Popen(
+                ["git", "cat-file", mode],
+                cwd=self.toplevel,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+
+    def _process(self, mode: str) -> Optional[subprocess.Popen[bytes]]:
+        attr = "_batch" if mode == "--batch" else "_check"
+        proc = getattr(self, attr)
+        if proc is None or proc.poll() is not None:
+            proc = self._spawn(mode)
+            setattr(self, attr, proc)
+        return proc
+
+    def _request(self, mode: str, spec: str) -> Optional[Tuple[ObjectInfo, bytes]]:
+        """Header (and for ``--batch`` the payload) answering ``spec``, read under ``read_timeout``."""
+        if not spec or "\n" in spec:
+            return None
+        proc = self._process(mode)
+        if proc is None or proc.stdin is None or proc.stdout is None:
+            return None
+        expired = threading.Event()
+
+        def _expire() -> None:
+            # Killing git closes its stdout, which unblocks the pending pipe read below.
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(self.read_timeout, _expire)
+        timer.daemon = True
+        timer.start()
+        info: Optional[ObjectInfo] = None
+        data = b""
+        try:
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().decode("utf-8", errors="replace").rstrip("\n")
+            parts = header.split(" ")
+            if len(parts) == 3 and parts[2].isdigit():
+                info = ObjectInfo(oid=parts[0], kind=parts[1], size=int(parts[2]))
+                if mode == "--batch":
+                    data = proc.stdout.read(info.size)
+                    proc.stdout.read(1)
+        except (OSError, ValueError):
+            header = ""
+        finally:
+            timer.cancel()
+        if expired.is_set() or not header or (mode == "--batch" and info is not None and len(data) != info.size):
+            self._discard(mode)
+            return None
+        if info is None:
+            return None
+        return info, data
+
+    def _discard(self, mode: str) -> None:
+        attr = "_batch" if mode == "--batch" else "_check"
+        proc = getattr(self, attr)
+        setattr(self, attr, None)
+        if proc is not None:
+            _terminate(proc)
+
+    def info(self, spec: str) -> Optional[ObjectInfo]:
+        with self._lock:
+            result = self._request("--batch-check", spec)
+        return result[0] if result else None
+
+    def exists(self, spec: str) -> bool:
+        return self.info(spec) is not None
+
+    def read(self, spec: str) -> Optional[Tuple[ObjectInfo, bytes]]:
+        with self._lock:
+            return self._request("--batch", spec)
+
+    def read_blob(self, spec: str) -> Optional[bytes]:
+        result = self.read(spec)
+        if result is None or result[0].kind != "blob":
+            return None
+        return result[1]
+
+    def tree(self, spec: str) -> Optional[List[TreeEntry]]:
+        """Entries of the tree named by ``spec`` (e.g. ``HEAD:src``), parsed from the raw tree object."""
+        result = self.read(spec)
+        if result is None:
+            return None
+        info, data = result
+        if info.kind == "commit":
+            result = self.read(f"{info.oid}^{{tree}}")
+            if result is None:
+                return None
+            info, data = result
+        if info.kind != "tree":
+            return None
+        digest_len = len(info.oid) // 2
+        entries: List[TreeEntry] = []
+        pos = 0
+        while pos < len(data):
+            space = data.find(b" ", pos)
+            nul = data.find(b"\0", space + 1) if space >= 0 else -1
+            if nul < 0 or nul + 1 + digest_len > len(data):
+                return None
+            try:
+                mode = data[pos:space].decode("ascii")
+            except UnicodeDecodeError:
+                return None
+            name = data[space + 1 : nul].decode("utf-8", errors="surrogateescape")
+            oid = data[nul + 1 : nul + 1 + digest_len].hex()
+            pos = nul + 1 + digest_len
+            kind = "tree" if mode == "40000" else "commit" if mode == "160000" else "blob"
+            entries.append(TreeEntry(mode=mode, kind=kind, oid=oid, name=name))
+        return entries
+
+    def close(self) -> None:
+        with self._lock:
+            self._discard("--batch")
+            self._discard("--batch-check")
+
+
+def _terminate(proc: subprocess.Popen[bytes]) -> None:
+    try:
+        if proc.stdin is not None:
+            proc.stdin.close()
+        proc.wait(timeout=1)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        proc.kill()
+        proc.wait()
+    finally:
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+
+def repo_info(cwd: Path) -> Optional[RepoInfo]:
+    """Work-tree toplevel and git dir for ``cwd``; positive answers are memoised per process."""
+    key = str(cwd)
+    cached = _REPO_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+            timeout=REPO_INFO_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
+    if proc.returncode != 0 or len(lines) < 2:
+        return None
+    info = RepoInfo(toplevel=Path(lines[0]).expanduser().resolve(), git_dir=Path(lines[1]))
+    _REPO_CACHE[key] = info
+    return info
+
+
+def toplevel(cwd: Path) -> Optional[Path]:
+    info = repo_info(cwd)
+    return info.toplevel if info else None
+
+
+def reader(cwd: Path) -> Optional[GitObjectReader]:
+    info = repo_info(cwd)
+    if info is None:
+        return None
+    key = str(info.toplevel)
+    with _LOCK:
+        existing = _READERS.get(key)
+        if existing is None:
+            existing = GitObjectReader(info.toplevel)
+            _READERS[key] = existing
+    return existing
+
+
+def repo_relative(cwd: Path, path: Path) -> Optional[str]:
+    """``path`` (absolute or relative to ``cwd``) as a posix path relative to the repository toplevel."""
+    top = toplevel(cwd)
+    if top is None:
+        return None
+    candidate = path if path.is_absolute() else cwd / path
+    try:
+        return candidate.resolve().relative_to(top).as_posix()
+    except (OSError, ValueError):
+        return None
+
+
+def has_head(cwd: Path) -> bool:
+    objects = reader(cwd)
+    return bool(objects and objects.exists("HEAD"))
+
+
+def read_head_text(cwd: Path, path: Path) -> Optional[str]:
+    """Text of ``path`` as committed at HEAD, or None when it is not tracked there."""
+    objects = reader(cwd)
+    rel = repo_relative(cwd, path)
+    if objects is None or rel is None:
+        return None
+    data = objects.read_blob(f"HEAD:{rel}")
+    if data is None:
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
+def current_branch(cwd: Path) -> str:
+    """Short branch name (``HEAD`` when detached), read from the git dir; empty without a commit."""
+    info = repo_info(cwd)
+    if info is None or not has_head(cwd):
+        return ""
+    try:
+        head = (info.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+    if head.startswith("ref: "):
+        ref = head[len("ref: ") :].strip()
+        return ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
+
+
+def close_all() -> None:
+    with _LOCK:
+        readers = list(_READERS.values())
+        _READERS.clear()
+    for item in readers:
+        item.close()
+
+
+def reset() -> None:
+    """Forget memoised repositories and stop every reader (tests, long-lived daemons after re-init)."""
+    close_all()
+    _REPO_CACHE.clear()
+
+
+atexit.register(close_all)
@@ -0,0 +1,232 @@
+"""Markdown outline: one pass over a document yields headings and handoff markers with byte offsets."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aidd_runtime.config_cache import RACY_WINDOW_NS
+
+OUTLINE_VERSION = 1
+CACHE_DIRNAME = "md_outline"
+
+HEADING_RE = re.compile(r"^(#{1,6})(?:\s+(.*?))?\s*$")
+# Section bodies end at the next column-0 level-2 heading (same rule md-slice/md-patch always used).
+SECTION_BOUNDARY_RE = re.compile(r"^##\s")
+AIDD_ID_RE = re.compile(r"^(AIDD:[A-Z0-9_]+)\b", re.IGNORECASE)
+HANDOFF_MARKER_RE = re.compile(r"^<!-- handoff:(?P<id>\S+) (?P<kind>start|end)")
+
+
+def slugify(title: str) -> str:
+    slug = re.sub(r"[^\w\s:-]", "", title.strip().lower())
+    return re.sub(r"\s+", "-", slug)
+
+
+@dataclass(frozen=True)
+class Heading:
+    line: int
+    offset: int
+    level: int
+    title: str
+    slug: str
+    text: str
+    boundary: bool
+
+
+@dataclass(frozen=True)
+class HandoffMarker:
+    line: int
+    offset: int
+    end_offset: int
+    handoff_id: str
+    kind: str
+
+
+@dataclass
+class Outline:
+    size: int
+    line_count: int
+    headings: List[Heading]
+    handoffs: List[HandoffMarker]
+    _by_text: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _by_aidd_id: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _boundary_lines: List[int] = field(default_factory=list, init=False, repr=False)
+    _boundary_offsets: List[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for idx, heading in enumerate(self.headings):
+            self._by_text.setdefault(heading.text, idx)
+            match = AIDD_ID_RE.match(heading.title) if heading.level == 2 else None
+            if match:
+                self._by_aidd_id.setdefault(match.group(1).upper(), idx)
+            if heading.boundary:
+                self._boundary_lines.append(heading.line)
+                self._boundary_offsets.append(heading.offset)
+
+    def _section_end(self, line: int) -> Tuple[int, int]:
+        pos = bisect.bisect_right(self._boundary_lines, line)
+        if pos < len(self._boundary_lines):
+            return self._boundary_lines[pos], self._boundary_offsets[pos]
+        return self.line_count, self.size
+
+    def _span(self, idx: Optional[int]) -> Optional[Tuple[int, int, int, int]]:
+        if idx is None:
+            return None
+        heading = self.headings[idx]
+        end_line, end_offset = self._section_end(heading.line)
+        return heading.line, end_line, heading.offset, end_offset
+
+    def section(self, heading_text: str) -> Optional[Tuple[int, int, int, int]]:
+        """(start_line, end_line, start_offset, end_offset) of the first heading whose stripped line equals ``heading_text``."""
+        return self._span(self._by_text.get(heading_text.strip()))
+
+    def aidd_section(self, name: str) -> Optional[Tuple[int, int, int, int]]:
+        """Span of the first ``## AIDD:<NAME>`` heading, matched case-insensitively on the AIDD id."""
+        return self._span(self._by_aidd_id.get(name.strip().upper()))
+
+    def handoff(self, handoff_id: str) -> Tuple[Optional[HandoffMarker], Optional[HandoffMarker]]:
+        start: Optional[HandoffMarker] = None
+        for marker in self.handoffs:
+            if marker.handoff_id != handoff_id:
+                continue
+            if start is None:
+                if marker.kind == "start":
+                    start = marker
+                continue
+            if marker.kind == "end":
+                return start, marker
+        return start, None
+
+    def to_payload(self) -> Dict[str, object]:
+        return {
+            "version": OUTLINE_VERSION,
+            "size": self.size,
+            "line_count": self.line_count,
+            "headings": [asdict(item) for item in self.headings],
+            "handoffs": [asdict(item) for item in self.handoffs],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, object]) -> "Outline":
+        return cls(
+            size=int(payload["size"]),
+            line_count=int(payload["line_count"]),
+            headings=[Heading(**item) for item in payload.get("headings") or []],
+            handoffs=[HandoffMarker(**item) for item in payload.get("handoffs") or []],
+        )
+
+
+def parse_outline(data: bytes) -> Outline:
+    """Index headings and handoff markers; line breaks follow ``str.splitlines`` so line numbers match it."""
+    text = data.decode("utf-8")
+    headings: List[Heading] = []
+    handoffs: List[HandoffMarker] = []
+    offset = 0
+    line_count = 0
+    for idx, raw in enumerate(text.splitlines(keepends=True)):
+        line_count = idx + 1
+        length = len(raw.encode("utf-8"))
+        line = raw.splitlines()[0]
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            match = HEADING_RE.match(stripped)
+            if match:
+                title = match.group(2) or ""
+                headings.append(
+                    Heading(
+                        line=idx,
+                        offset=offset,
+                        level=len(match.group(1)),
+                        title=title,
+                        slug=slugify(title),
+                        text=stripped,
+                        boundary=bool(SECTION_BOUNDARY_RE.match(line)),
+                    )
+                )
+        elif stripped.startswith("<!-- handoff:"):
+            match = HANDOFF_MARKER_RE.match(stripped)
+            if match:
+                handoffs.append(
+                    HandoffMarker(
+                        line=idx,
+                        offset=offset,
+                        end_offset=offset + length,
+                        handoff_id=match.group("id"),
+                        kind=match.group("kind"),
+                    )
+                )
+        offset += length
+    return Outline(size=len(data), line_count=line_count, headings=headings, handoffs=handoffs)
+
+
+_MEMORY_CACHE: Dict[str, Tuple[Tuple[int, int], Outline]] = {}
+
+
+def outline_cache_dir(root: Path) -> Path:
+    return root / ".cache" / CACHE_DIRNAME
+
+
+def load_outline(path: Path, *, cache_dir: Optional[Path] = None) -> Outline:
+    """Outline for ``path`` keyed by (path, mtime_ns, size): memory first, then ``cache_dir``, then a fresh parse.
+
+    A file modified within ``RACY_WINDOW_NS`` may be rewritten again without moving its
+    signature, so it is always parsed fresh and its outline is not cached.
+    """
+    stat_result = path.stat()
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    key = str(path.resolve())
+    if time.time_ns() - stat_result.st_mtime_ns < RACY_WINDOW_NS:
+        _MEMORY_CACHE.pop(key, None)
+        return parse_outline(path.read_bytes())
+    cached = _MEMORY_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == OUTLINE_VERSION
+            and payload.get("path") == key
+            and payload.get("signature") == list(signature)
+        ):
+            try:
+                outline = Outline.from_payload(payload)
+            except (KeyError, TypeError, ValueError):
+                outline = None
+            if outline is not None:
+                _MEMORY_CACHE[key] = (signature, outline)
+                return outline
+
+    outline = parse_outline(path.read_bytes())
+    _MEMORY_CACHE[key] = (signature, outline)
+    if cache_path is not None:
+        payload = {**outline.to_payload(), "path": key, "signature": list(signature)}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
+    return outline
+
+
+def read_lines(path: Path, start_offset: int, end_offset: int) -> List[str]:
+    """Lines of ``path`` between two outline offsets, read without loading the rest of the file."""
+    with path.open("rb") as handle:
+        handle.seek(start_offset)
+        chunk = handle.read(max(0, end_offset - start_offset))
+    # The file may have changed since it was outlined; never fail on an offset inside a character.
+    return chunk.decode("utf-8", errors="replace").splitlines()
@@ -170,8 +170,8 @@ def _emit_gate_outcome(message: str, *, docs_only_mode: bool, reason_code: str)
     return 1
 
 
-def run_gate(args: argparse.Namespace) -> int:
-    root = detect_project_root()
+def run_gate(args: argparse.Namespace, *, target: Path | None = None) -> int:
+    root = detect_project_root(target)
     docs_only_mode = runtime.docs_only_mode_requested(explicit=getattr(args, "docs_only", False))
     config_path = Path(args.config)
     if not config_path.is_absolute():
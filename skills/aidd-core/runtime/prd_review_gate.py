@@ -44,6 +44,7 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
+from aidd_runtime import columnar
 from aidd_runtime import gates
 from aidd_runtime import runtime
 from aidd_runtime.feature_ids import resolve_aidd_root
@@ -190,21 +191,6 @@ def _resolve_report_path(root: Path, template: str) -> Path:
     return report_path
 
 
-def _inflate_columnar(section: object) -> List[dict]:
-    if not isinstance(section, dict):
-        return list(section) if isinstance(section, list) else []
-    cols = section.get("cols")
-    rows = section.get("rows")
-    if not isinstance(cols, list) or not isinstance(rows, list):
-        return []
-    inflated: List[dict] = []
-    for row in rows:
-        if not isinstance(row, list):
-            continue
-        inflated.append({str(col): row[idx] if idx < len(row) else None for idx, col in enumerate(cols)})
-    return inflated
-
-
 def format_message(
     kind: str,
     ticket: str,
@@ -272,8 +258,8 @@ def extract_dialog_status(content: str) -> str | None:
     return None
 
 
-def run_gate(args: argparse.Namespace) -> int:
-    root = detect_project_root()
+def run_gate(args: argparse.Namespace, *, target: Path | None = None) -> int:
+    root = detect_project_root(target)
     docs_only_mode = runtime.docs_only_mode_requested(explicit=getattr(args, "docs_only", False))
     config_path = Path(args.config)
     if not config_path.is_absolute():
@@ -398,16 +384,13 @@ def run_gate(args: argparse.Namespace) -> int:
             )
 
     if report_data is not None:
-        raw_findings = report_data.get("findings") or []
-        findings = _inflate_columnar(raw_findings) if isinstance(raw_findings, dict) else raw_findings
+        findings = columnar.iter_records(report_data.get("findings") or [])
         blocking_severities: Set[str] = {
             str(item).lower() for item in gate.get("blocking_severities", DEFAULT_BLOCKING_SEVERITIES)
         }
         if blocking_severities:
             for finding in findings:
-                severity = ""
-                if isinstance(finding, dict):
-                    severity = str(finding.get("severity") or "").lower()
+                severity = str(finding.get("severity") or "").lower()
                 if severity and severity in blocking_severities:
                     label = feature_label(ticket, slug_hint)
                     return emit(
@@ -16,6 +16,7 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
@@ -58,6 +59,10 @@ DEFAULT_BLOCKERS = ("blocker", "critical")
 DEFAULT_WARNINGS = ("major", "minor")
 SEVERITY_ORDER = ["blocker", "critical", "major", "minor", "info"]
 MANUAL_MARKERS = ("manual", "ручн")
+CODE_TOKEN_RE = re.compile(r"FIXME|TODO")
+CODE_SCAN_MARKERS = ("src/", "tests/", ".kt", ".java", ".py", ".js", ".ts", ".tsx", ".json", ".yaml")
+HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+READ_WORKERS = 8
 
 
 def _normalize_id_text(value: str) -> str:
@@ -162,6 +167,11 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="append",
         help="Optional scope filters (reserved for future heuristics).",
     )
+    parser.add_argument(
+        "--full-scan",
+        action="store_true",
+        help="Scan whole changed files for TODO/FIXME instead of added diff lines only (env: QA_AGENT_FULL_SCAN=1).",
+    )
     return parser.parse_args(argv)
 
 
@@ -199,13 +209,106 @@ def collect_changed_files() -> List[str]:
     return sorted(files)
 
 
-def _find_token_lines(content: str, token: str) -> Iterable[Tuple[int, str]]:
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if token in line:
-            yield idx, line.strip()
+def _git_stdout(args: Sequence[str]) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=ROOT_DIR,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except (FileNotFoundError, OSError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def _unquote_git_path(raw: str) -> str:
+    if len(raw) >= 2 and raw.startswith('"') and raw.endswith('"'):
+        raw = raw[1:-1].replace('\\"', '"').replace("\\t", "\t").replace("\\n", "\n").replace("\\\\", "\\")
+    return raw
+
+
+def parse_added_lines(diff_text: str) -> Dict[str, List[Tuple[int, str]]]:
+    """Map post-image paths of a ``git diff -U0`` to their added (line_no, text) pairs."""
+    added: Dict[str, List[Tuple[int, str]]] = {}
+    current: Optional[List[Tuple[int, str]]] = None
+    old_left = new_left = 0
+    line_no = 0
+    for raw in diff_text.split("\n"):
+        if old_left > 0 or new_left > 0:
+            if raw.startswith("+") and new_left > 0:
+                if current is not None:
+                    current.append((line_no, raw[1:]))
+                line_no += 1
+                new_left -= 1
+            elif raw.startswith("-") and old_left > 0:
+                old_left -= 1
+            elif not raw.startswith("\\"):
+                old_left = new_left = 0
+            continue
+        if raw.startswith("+++ "):
+            path = _unquote_git_path(raw[4:].rstrip("\t"))
+            if path == "/dev/null":
+                current = None
+                continue
+            if path.startswith("b/"):
+                path = path[2:]
+            current = added.setdefault(path, [])
+            continue
+        match = HUNK_HEADER_RE.match(raw)
+        if match:
+            old_left = int(match.group(1)) if match.group(1) is not None else 1
+            line_no = int(match.group(2))
+            new_left = int(match.group(3)) if match.group(3) is not None else 1
+    return added
 
 
-def analyse_code_tokens(files: Iterable[str]) -> List[Finding]:
+def collect_added_lines() -> Optional[Dict[str, List[Tuple[int, str]]]]:
+    """Added lines of the workspace change set from a single ``git diff -U0`` (None when git is unavailable)."""
+    args = ["-c", "core.quotePath=false", "diff", "-U0", "--no-color", "--no-ext-diff", "--no-renames"]
+    diff_base = os.environ.get("QA_AGENT_DIFF_BASE", "").strip()
+    if diff_base:
+        args.extend(["--merge-base", diff_base])
+    else:
+        args.append("HEAD")
+    diff_text = _git_stdout(args)
+    if diff_text is None:
+        return None
+    return parse_added_lines(diff_text)
+
+
+def _is_code_scan_candidate(relative: str) -> bool:
+    # Ограничимся только исходниками и тестами
+    return any(part in relative for part in CODE_SCAN_MARKERS)
+
+
+def _read_numbered_lines(relative: str) -> Optional[List[Tuple[int, str]]]:
+    path = ROOT_DIR / relative
+    if not path.is_file():
+        return None
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return list(enumerate(content.splitlines(), start=1))
+
+
+def _read_files_parallel(relatives: Sequence[str]) -> Dict[str, List[Tuple[int, str]]]:
+    if not relatives:
+        return {}
+    workers = max(1, min(READ_WORKERS, len(relatives)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_read_numbered_lines, relatives)
+        return {relative: lines for relative, lines in zip(relatives, results) if lines is not None}
+
+
+def analyse_code_tokens(files: Iterable[str], *, full_scan: bool = False) -> List[Finding]:
     findings: List[Finding] = []
     token_rules = {
         "FIXME": (
@@ -219,22 +322,33 @@ def analyse_code_tokens(files: Iterable[str]) -> List[Finding]:
             "Уберите TODO или перенесите в задачу с ссылкой перед релизом.",
         ),
     }
-    for relative in files:
-        path = ROOT_DIR / relative
-        if not path.is_file():
-            continue
-        # Ограничимся только исходниками и тестами
-        if not any(part in relative for part in ("src/", "tests/", ".kt", ".java", ".py", ".js", ".ts", ".tsx", ".json", ".yaml")):
-            continue
-        try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
+    candidates = [relative for relative in files if _is_code_scan_candidate(relative)]
+    added = None if full_scan else collect_added_lines()
+    untracked: Set[str] = set()
+    if added is not None and candidates:
+        untracked.update(run_git(["ls-files", "--others", "--exclude-standard"]))
+    scan_lines: Dict[str, List[Tuple[int, str]]] = {}
+    to_read: List[str] = []
+    for relative in candidates:
+        if added is None or relative in untracked:
+            # Untracked files (or no usable diff) are new content in full.
+            to_read.append(relative)
+        else:
+            # Paths missing from the diff (mode-only changes, unchanged files) add no lines.
+            scan_lines[relative] = added.get(relative, [])
+    scan_lines.update(_read_files_parallel(to_read))
+
+    for relative in candidates:
+        first_hits: Dict[str, Tuple[int, str]] = {}
+        for line_no, line in scan_lines.get(relative) or []:
+            for match in CODE_TOKEN_RE.finditer(line):
+                first_hits.setdefault(match.group(0), (line_no, line.strip()))
+            if len(first_hits) == len(token_rules):
+                break
         for token, (severity, title, recommendation) in token_rules.items():
-            matches = list(_find_token_lines(content, token))
-            if not matches:
+            if token not in first_hits:
                 continue
-            line_no, snippet = matches[0]
+            line_no, snippet = first_hits[token]
             findings.append(
                 Finding(
                     severity=severity,
@@ -425,9 +539,10 @@ def aggregate_findings(
     tests_summary: str,
     tests_executed: List[Dict],
     allow_missing_tests: bool,
+    full_scan: bool = False,
 ) -> tuple[List[Finding], List[str]]:
     findings: List[Finding] = []
-    findings.extend(analyse_code_tokens(files))
+    findings.extend(analyse_code_tokens(files, full_scan=full_scan))
     tasklist_findings, manual_required = analyse_tasklist(ticket, slug_hint)
     findings.extend(tasklist_findings)
     findings.extend(analyse_tests_coverage(files))
@@ -508,6 +623,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     branch = args.branch or runtime.detect_branch(ROOT_DIR)
     files = collect_changed_files()
     tests_summary, tests_executed, allow_missing_tests = load_tests_metadata()
+    full_scan = bool(args.full_scan or os.environ.get("QA_AGENT_FULL_SCAN", "").strip() == "1")
     findings, manual_required = aggregate_findings(
         files,
         ticket,
@@ -515,6 +631,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         tests_summary=tests_summary,
         tests_executed=tests_executed,
         allow_missing_tests=allow_missing_tests,
+        full_scan=full_scan,
     )
     findings = dedupe_findings(findings)
     manual_required = dedupe_strings(manual_required)
@@ -550,6 +667,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         "tests_executed": tests_executed,
         "inputs": {
             "diff_base": os.environ.get("QA_AGENT_DIFF_BASE") or None,
+            "token_scan": "full" if full_scan else "diff",
         },
     }
 
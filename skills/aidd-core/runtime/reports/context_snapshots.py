@@ -0,0 +1,258 @@
+"""Content-addressed store for context-GC snapshots (``aidd/reports/context/objects``).
+
+Snapshot files (working set, precompact meta, transcript tail, ``latest_working_set.md``) are
+written once as blobs named by their sha256 and exposed at their usual paths as hard links,
+so the session and by-ticket copies share one inode. Each snapshot directory carries a small
+``manifest.json`` naming the blobs it uses; :func:`prune` drops old snapshots and any blob no
+manifest references.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from aidd_runtime.io_utils import utc_timestamp
+
+SCHEMA = "aidd.context_snapshot.v1"
+MANIFEST_FILENAME = "manifest.json"
+LATEST_FILENAME = "latest_working_set.md"
+LEGACY_META_FILENAME = "precompact_meta.json"
+
+
+def context_dir(root: Path) -> Path:
+    return root / "reports" / "context"
+
+
+def objects_dir(root: Path) -> Path:
+    return context_dir(root) / "objects"
+
+
+def blob_path(root: Path, digest: str) -> Path:
+    return objects_dir(root) / digest[:2] / digest[2:]
+
+
+def put_blob(root: Path, data: bytes) -> str:
+    """Store ``data`` once and return its sha256; an existing blob only has its mtime refreshed (LRU)."""
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(root, digest)
+    if path.exists():
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return digest
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return digest
+
+
+def link_blob(root: Path, digest: str, dest: Path) -> None:
+    """Expose a blob at ``dest`` as a hard link (copy when the filesystem refuses links)."""
+    source = blob_path(root, digest)
+    try:
+        if dest.exists() and os.path.samefile(source, dest):
+            return
+    except OSError:
+        pass
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    tmp_path.replace(dest)
+
+
+def write_file(root: Path, dest: Path, data: bytes) -> str:
+    digest = put_blob(root, data)
+    link_blob(root, digest, dest)
+    return digest
+
+
+def write_snapshot(root: Path, snapshot_dir: Path, files: Dict[str, bytes], *, meta: Dict[str, object]) -> Dict[str, object]:
+    """Link ``files`` into ``snapshot_dir`` and record them in its manifest."""
+    entries: Dict[str, Dict[str, object]] = {}
+    for name, data in files.items():
+        entries[name] = {"sha256": write_file(root, snapshot_dir / name, data), "size": len(data)}
+    manifest = {"schema": SCHEMA, "written_at": utc_timestamp(), "meta": meta, "files": entries}
+    write_manifest(snapshot_dir, manifest)
+    return manifest
+
+
+def write_manifest(snapshot_dir: Path, manifest: Dict[str, object]) -> None:
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    path = snapshot_dir / MANIFEST_FILENAME
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def load_manifest(snapshot_dir: Path) -> Optional[Dict[str, object]]:
+    try:
+        payload = json.loads((snapshot_dir / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema") != SCHEMA:
+        return None
+    return payload
+
+
+def _manifest_digests(manifest: Dict[str, object]) -> Set[str]:
+    files = manifest.get("files")
+    if not isinstance(files, dict):
+        return set()
+    return {str(item.get("sha256")) for item in files.values() if isinstance(item, dict) and item.get("sha256")}
+
+
+def iter_snapshot_dirs(root: Path) -> List[Path]:
+    """Session snapshot directories (``<session>/`` and ``by-ticket/<ticket>/<session>/``), old layout included."""
+    base = context_dir(root)
+    candidates: List[Path] = []
+    for pattern in ("*", "by-ticket/*/*"):
+        for path in base.glob(pattern):
+            if path.name == "objects" or not path.is_dir():
+                continue
+            if (path / MANIFEST_FILENAME).is_file() or (path / LEGACY_META_FILENAME).is_file():
+                candidates.append(path)
+    return sorted(candidates)
+
+
+def _snapshot_time(snapshot_dir: Path) -> float:
+    for name in (MANIFEST_FILENAME, LEGACY_META_FILENAME):
+        try:
+            return (snapshot_dir / name).stat().st_mtime
+        except OSError:
+            continue
+    return 0.0
+
+
+def _latest_inodes(root: Path) -> Set[tuple]:
+    """Inodes behind the ``latest_working_set.md`` views; their blobs stay live without a manifest."""
+    base = context_dir(root)
+    inodes: Set[tuple] = set()
+    for path in [base / LATEST_FILENAME, *base.glob(f"by-ticket/*/{LATEST_FILENAME}")]:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            continue
+        inodes.add((stat_result.st_dev, stat_result.st_ino))
+    return inodes
+
+
+def _iter_blobs(root: Path) -> Iterable[Path]:
+    base = objects_dir(root)
+    if not base.is_dir():
+        return []
+    return (path for path in base.glob("??/*") if path.is_file() and not path.name.startswith("."))
+
+
+def _dir_bytes(path: Path) -> int:
+    total = 0
+    for item in path.rglob("*"):
+        try:
+            if item.is_file():
+                total += item.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+@dataclass
+class PruneReport:
+    removed_snapshots: List[str] = field(default_factory=list)
+    removed_blobs: int = 0
+    freed_bytes: int = 0
+    kept_snapshots: int = 0
+    kept_blob_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "schema": "aidd.context_snapshot_prune.v1",
+            "removed_snapshots": self.removed_snapshots,
+            "removed_blobs": self.removed_blobs,
+            "freed_bytes": self.freed_bytes,
+            "kept_snapshots": self.kept_snapshots,
+            "kept_blob_bytes": self.kept_blob_bytes,
+        }
+
+
+def prune(
+    root: Path,
+    *,
+    max_age_days: float = 0,
+    max_bytes: int = 0,
+    dry_run: bool = False,
+    now: Optional[float] = None,
+) -> PruneReport:
+    """Drop snapshots older than ``max_age_days``, then least recently written ones until the
+    referenced blobs fit in ``max_bytes`` (0 disables either limit), then unreferenced blobs."""
+    report = PruneReport()
+    current = time.time() if now is None else now
+    snapshots = sorted(iter_snapshot_dirs(root), key=_snapshot_time)
+    doomed: List[Path] = []
+    if max_age_days > 0:
+        cutoff = current - max_age_days * 86400
+        doomed = [path for path in snapshots if _snapshot_time(path) < cutoff]
+    kept = [path for path in snapshots if path not in doomed]
+
+    blob_sizes: Dict[str, int] = {}
+    pinned: Set[str] = set()
+    latest = _latest_inodes(root)
+    for path in _iter_blobs(root):
+        try:
+            stat_result = path.stat()
+        except OSError:
+            continue
+        digest = path.parent.name + path.name
+        blob_sizes[digest] = stat_result.st_size
+        if (stat_result.st_dev, stat_result.st_ino) in latest:
+            pinned.add(digest)
+    digests: Dict[Path, Set[str]] = {}
+    for path in kept:
+        manifest = load_manifest(path)
+        digests[path] = _manifest_digests(manifest) if manifest else set()
+
+    def referenced_bytes() -> int:
+        live: Set[str] = set().union(*digests.values()) if digests else set()
+        return sum(blob_sizes.get(digest, 0) for digest in live)
+
+    if max_bytes > 0:
+        while kept and referenced_bytes() > max_bytes:
+            oldest = kept.pop(0)
+            digests.pop(oldest, None)
+            doomed.append(oldest)
+
+    for path in doomed:
+        report.removed_snapshots.append(path.relative_to(context_dir(root)).as_posix())
+        if not (path / MANIFEST_FILENAME).is_file():
+            report.freed_bytes += _dir_bytes(path)
+        if not dry_run:
+            shutil.rmtree(path, ignore_errors=True)
+
+    live = pinned.union(*digests.values())
+    for digest, size in blob_sizes.items():
+        if digest in live:
+            report.kept_blob_bytes += size
+            continue
+        report.removed_blobs += 1
+        report.freed_bytes += size
+        if not dry_run:
+            try:
+                blob_path(root, digest).unlink()
+            except OSError:
+                pass
+    report.kept_snapshots = len(kept)
+    return report
@@ -0,0 +1,168 @@
+"""Structured loop-run/loop-step telemetry (JSONL)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from aidd_runtime.io_utils import append_jsonl, utc_timestamp
+
+SCHEMA = "aidd.loop_telemetry.v1"
+TELEMETRY_FILENAME = "loop.telemetry.jsonl"
+KIND_ITERATION = "iteration"
+KIND_PHASE = "phase"
+
+ENV_ENABLED = "AIDD_LOOP_TELEMETRY"
+ENV_PATH = "AIDD_LOOP_TELEMETRY_PATH"
+ENV_RUN_ID = "AIDD_LOOP_TELEMETRY_RUN_ID"
+ENV_ITERATION = "AIDD_LOOP_TELEMETRY_ITERATION"
+ENV_MAX_BYTES = "AIDD_LOOP_TELEMETRY_MAX_BYTES"
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+# Past this size the log is rotated to ``<name>.1`` (one previous generation is kept).
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# Counted process-wide so in-process loop-step phases are attributed to the loop-run iteration.
+_SUBPROCESS_COUNT = 0
+_SUBPROCESS_LOCK = threading.Lock()
+
+
+def telemetry_path(root: Path, ticket: str) -> Path:
+    return root / "reports" / "loops" / ticket / TELEMETRY_FILENAME
+
+
+def rotated_path(path: Path) -> Path:
+    return path.with_name(path.name + ".1")
+
+
+def max_bytes() -> int:
+    """Rotation threshold from ``AIDD_LOOP_TELEMETRY_MAX_BYTES``; 0 disables rotation."""
+    raw = os.environ.get(ENV_MAX_BYTES, "").strip()
+    try:
+        return max(int(raw), 0) if raw else DEFAULT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def _rotate_if_full(path: Path) -> None:
+    limit = max_bytes()
+    if limit and file_size(path) >= limit:
+        try:
+            path.replace(rotated_path(path))
+        except OSError:
+            return
+
+
+def telemetry_enabled() -> bool:
+    return os.environ.get(ENV_ENABLED, "").strip().lower() not in _DISABLED_VALUES
+
+
+def telemetry_env(path: Path, *, run_id: str, iteration: int) -> Dict[str, str]:
+    """Environment handed to loop-step so its phase records join the loop-run iteration."""
+    if not telemetry_enabled():
+        return {}
+    return {
+        ENV_PATH: str(path),
+        ENV_RUN_ID: str(run_id),
+        ENV_ITERATION: str(iteration),
+    }
+
+
+def note_subprocess(count: int = 1) -> None:
+    global _SUBPROCESS_COUNT
+    with _SUBPROCESS_LOCK:
+        _SUBPROCESS_COUNT += count
+
+
+def subprocess_count() -> int:
+    with _SUBPROCESS_LOCK:
+        return _SUBPROCESS_COUNT
+
+
+def file_size(path: Optional[Path]) -> int:
+    if path is None:
+        return 0
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _env_iteration() -> Optional[int]:
+    raw = os.environ.get(ENV_ITERATION, "").strip()
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
+def emit(
+    kind: str,
+    *,
+    phase: str,
+    duration_ms: float,
+    path: Optional[Path] = None,
+    run_id: Optional[str] = None,
+    iteration: Optional[int] = None,
+    **fields: Any,
+) -> None:
+    """Append one telemetry record; silently no-op when telemetry is off or unbound."""
+    if not telemetry_enabled():
+        return
+    if path is None:
+        raw_path = os.environ.get(ENV_PATH, "").strip()
+        if not raw_path:
+            return
+        path = Path(raw_path)
+    payload: Dict[str, Any] = {
+        "schema": SCHEMA,
+        "ts": utc_timestamp(),
+        "kind": kind,
+        "run_id": run_id if run_id is not None else os.environ.get(ENV_RUN_ID, "").strip() or None,
+        "iteration": iteration if iteration is not None else _env_iteration(),
+        "phase": phase,
+        "duration_ms": round(float(duration_ms), 3),
+        "pid": os.getpid(),
+    }
+    for key, value in fields.items():
+        if value is not None and value != "":
+            payload[key] = value
+    _rotate_if_full(path)
+    try:
+        append_jsonl(path, payload)
+    except OSError:
+        return
+
+
+@contextmanager
+def phase(
+    name: str,
+    *,
+    kind: str = KIND_PHASE,
+    path: Optional[Path] = None,
+    run_id: Optional[str] = None,
+    iteration: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Time a block with the monotonic clock; callers may add fields to the yielded record."""
+    record: Dict[str, Any] = {}
+    subprocess_before = subprocess_count()
+    started = time.monotonic()
+    try:
+        yield record
+    except BaseException:
+        record.setdefault("status", "error")
+        raise
+    finally:
+        emit(
+            kind,
+            phase=name,
+            duration_ms=(time.monotonic() - started) * 1000.0,
+            path=path,
+            run_id=run_id,
+            iteration=iteration,
+            subprocess_count=subprocess_count() - subprocess_before,
+            **record,
+        )
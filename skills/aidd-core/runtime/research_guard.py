@@ -32,9 +32,11 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import gates
+from aidd_runtime import rlm_stats
 from aidd_runtime import runtime
 from aidd_runtime.feature_ids import resolve_aidd_root
-from aidd_runtime.rlm_config import detect_lang
+from aidd_runtime.rlm_config import ext_histogram, langs_from_histogram
+from aidd_runtime.rlm_lang_scan import git_ext_histogram, walk_ext_histogram
 
 
 class ResearchValidationError(RuntimeError):
@@ -64,6 +66,7 @@ RESEARCH_TEMPLATE_MARKERS = (
 )
 STATUS_LINE_RE = re.compile(r"^\*{0,2}\s*status\s*\*{0,2}\s*:\s*(.+)$", re.IGNORECASE)
 LIST_ITEM_RE = re.compile(r"^(?:[-+*])\s+")
+LANG_SCAN_MAX_FILES = 5000
 
 
 @dataclass
@@ -276,57 +279,31 @@ def _detect_langs_from_files(files: Iterable[str], required_langs: Iterable[str]
     wanted = {lang for lang in required_langs if lang}
     if not wanted:
         return set()
-    found: set[str] = set()
-    for raw in files:
-        if not raw:
-            continue
-        lang = detect_lang(Path(str(raw)))
-        if lang and lang in wanted:
-            found.add(lang)
-    return found
+    return langs_from_histogram(ext_histogram(files)) & wanted
 
 
-def _detect_langs_from_paths(root: Path, paths: Iterable[str], required_langs: Iterable[str]) -> set[str]:
-    exts_by_lang = {
-        "kt": {".kt"},
-        "kts": {".kts"},
-        "java": {".java"},
-        "js": {".js", ".jsx"},
-        "ts": {".ts", ".tsx"},
-        "py": {".py"},
-        "go": {".go"},
-    }
-    wanted = {lang for lang in required_langs if lang in exts_by_lang}
+def _detect_langs_from_paths(
+    root: Path,
+    paths: Iterable[str],
+    required_langs: Iterable[str],
+    *,
+    ticket: str = "",
+) -> set[str]:
+    wanted = {lang for lang in required_langs if lang}
     if not wanted:
         return set()
-    found: set[str] = set()
-    max_files = 5000
-    scanned = 0
+    candidates: list[Path] = []
     for raw in paths:
-        if scanned >= max_files:
-            break
         candidate = _resolve_report_path(root, raw)
-        if not candidate or not candidate.exists():
-            continue
-        if candidate.is_file():
-            ext = candidate.suffix.lower()
-            for lang, exts in exts_by_lang.items():
-                if lang in wanted and ext in exts:
-                    found.add(lang)
-            scanned += 1
-            continue
-        for _base, _, files in os.walk(candidate):
-            for name in files:
-                scanned += 1
-                if scanned >= max_files:
-                    break
-                ext = Path(name).suffix.lower()
-                for lang, exts in exts_by_lang.items():
-                    if lang in wanted and ext in exts:
-                        found.add(lang)
-            if scanned >= max_files:
-                break
-    return found
+        if candidate and candidate.exists():
+            candidates.append(candidate)
+    if not candidates:
+        return set()
+    histogram = git_ext_histogram(root, ticket, candidates) if ticket else None
+    if not histogram:
+        # Outside git (or nothing listed under the targets) fall back to a bounded directory walk.
+        histogram = walk_ext_histogram(candidates, max_files=LANG_SCAN_MAX_FILES)
+    return langs_from_histogram(histogram) & wanted
 
 
 def _parse_iso_datetime(value: object) -> Optional[dt.datetime]:
@@ -395,6 +372,7 @@ def _should_require_rlm(
     *,
     settings: ResearchSettings,
     rlm_targets: dict,
+    ticket: str = "",
 ) -> bool:
     if not settings.rlm_enabled:
         return False
@@ -402,8 +380,13 @@ def _should_require_rlm(
     if not required_langs:
         return True
 
-    files = rlm_targets.get("files") or []
-    detected = _detect_langs_from_files([str(item) for item in files], required_langs)
+    stats = rlm_targets.get("stats") if isinstance(rlm_targets.get("stats"), dict) else {}
+    histogram = stats.get("ext_histogram")
+    if isinstance(histogram, dict):
+        detected = langs_from_histogram(histogram) & set(required_langs)
+    else:
+        files = rlm_targets.get("files") or []
+        detected = _detect_langs_from_files([str(item) for item in files], required_langs)
     if detected:
         return True
 
@@ -411,7 +394,7 @@ def _should_require_rlm(
     paths_discovered = rlm_targets.get("paths_discovered") or []
     if not paths and not paths_discovered:
         paths = ["src"]
-    detected = _detect_langs_from_paths(root, list(paths) + list(paths_discovered), required_langs)
+    detected = _detect_langs_from_paths(root, list(paths) + list(paths_discovered), required_langs, ticket=ticket)
     return bool(set(required_langs) & detected)
 
 
@@ -461,7 +444,12 @@ def _validate_rlm_evidence(
     except Exception:
         rlm_targets = {}
 
-    if not _should_require_rlm(root, settings=settings, rlm_targets=rlm_targets if isinstance(rlm_targets, dict) else {}):
+    if not _should_require_rlm(
+        root,
+        settings=settings,
+        rlm_targets=rlm_targets if isinstance(rlm_targets, dict) else {},
+        ticket=ticket,
+    ):
         return warnings
 
     worklist_status = None
@@ -480,11 +468,21 @@ def _validate_rlm_evidence(
         settings.downstream_gate_mode == "always_soft" and stage in {"plan", "review", "qa"}
     )
 
+    # Producers keep {ticket}-rlm.stats.json current; only a stale sidecar costs a streaming count.
+    graph_stats = rlm_stats.load_stats(root, ticket)
     nodes_exists = rlm_nodes_path.exists()
-    nodes_total = _count_rlm_nodes(rlm_nodes_path) if nodes_exists else 0
+    nodes_stats = rlm_stats.fresh_section(graph_stats, rlm_stats.SECTION_NODES, root=root, path=rlm_nodes_path)
+    if nodes_stats is not None:
+        nodes_total = int(nodes_stats.get("file_nodes") or 0)
+    else:
+        nodes_total = _count_rlm_nodes(rlm_nodes_path) if nodes_exists else 0
 
     links_exists = rlm_links_path.exists()
-    links_rows = _count_jsonl_rows(rlm_links_path) if links_exists else 0
+    links_stats_entry = rlm_stats.fresh_section(graph_stats, rlm_stats.SECTION_LINKS, root=root, path=rlm_links_path)
+    if links_stats_entry is not None:
+        links_rows = int(links_stats_entry.get("rows") or 0)
+    else:
+        links_rows = _count_jsonl_rows(rlm_links_path) if links_exists else 0
     links_total: Optional[int] = None
     links_empty_reason = ""
     links_stats = _load_rlm_links_stats(rlm_links_stats_path)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from pathlib import Path
 from typing import Dict, Iterable
 
+from aidd_runtime import config_cache
 from aidd_runtime.resources import DEFAULT_PROJECT_SUBDIR, resolve_project_root as resolve_workspace_root
 
 
@@ -58,12 +58,9 @@ SPECIAL_FILES = {
 
 
 def load_conventions(root: Path) -> Dict:
-    path = root / "config" / "conventions.json"
-    if not path.exists():
-        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        return config_cache.conventions(root)
+    except ValueError:
         return {}
 
 
@@ -160,6 +157,33 @@ def detect_lang(path: Path) -> str:
     return LANG_BY_EXT.get(ext, "")
 
 
+def _lang_key(raw: str) -> str:
+    name = raw.rsplit("/", 1)[-1]
+    if name in SPECIAL_FILES:
+        return name
+    dot = name.rfind(".")
+    return name[dot:].lower() if dot > 0 else ""
+
+
+def ext_histogram(paths: Iterable[str]) -> Dict[str, int]:
+    """Count paths per extension (special files such as ``Makefile`` count under their name)."""
+    histogram: Dict[str, int] = {}
+    for raw in paths:
+        key = _lang_key(str(raw or ""))
+        if key:
+            histogram[key] = histogram.get(key, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+def langs_from_histogram(histogram: Dict[str, int]) -> set[str]:
+    langs: set[str] = set()
+    for key in histogram:
+        lang = SPECIAL_FILES.get(key) or LANG_BY_EXT.get(key, "")
+        if lang:
+            langs.add(lang)
+    return langs
+
+
 def normalize_ignore_dirs(raw: Iterable[str] | None) -> set[str]:
     if not raw:
         return set(DEFAULT_IGNORE_DIRS)
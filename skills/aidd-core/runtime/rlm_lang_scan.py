@@ -0,0 +1,134 @@
+"""Extension histograms of the files under RLM target paths, for language detection.
+
+Inside git the tracked-file histogram comes from one ``git ls-files --cached`` call, cached per
+ticket in ``aidd/.cache/research/<ticket>.langs.json`` until HEAD or the index changes.  Untracked
+(non-ignored) files are not covered by that key, so they are listed fresh on every call and added
+on top; trees outside git fall back to a bounded directory walk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from aidd_runtime.rlm_config import ext_histogram
+
+LANG_CACHE_VERSION = 1
+
+
+def _git_listing_context(root: Path) -> Optional[tuple[Path, list[object]]]:
+    """Worktree top level plus a HEAD + index-stat key that changes whenever the tracked file list can."""
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir", "HEAD"],
+            cwd=str(root),
+            capture_output=True,
+            text=True,
+            timeout=3,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = proc.stdout.splitlines()
+    if len(lines) < 2:
+        return None
+    # An unborn HEAD makes rev-parse exit non-zero after printing the top level and git dir.
+    head = lines[2].strip() if len(lines) > 2 and lines[2].strip() != "HEAD" else ""
+    toplevel = Path(lines[0])
+    try:
+        index_stat = (Path(lines[1]) / "index").stat()
+        index_key: list[object] = [index_stat.st_mtime_ns, index_stat.st_size]
+    except OSError:
+        index_key = [None, None]
+    return toplevel, [head, *index_key]
+
+
+def _ls_files(toplevel: Path, pathspecs: list[str], *flags: str) -> Optional[list[str]]:
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-z", *flags, "--", *(spec or "." for spec in pathspecs)],
+            cwd=str(toplevel),
+            capture_output=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return [item for item in proc.stdout.decode("utf-8", errors="replace").split("\0") if item]
+
+
+def _tracked_histogram(
+    root: Path, ticket: str, toplevel: Path, key: list[object], pathspecs: list[str]
+) -> Optional[dict[str, int]]:
+    """Tracked-file histogram, cached per ticket until HEAD/index change."""
+    cache_path = root / ".cache" / "research" / f"{ticket}.langs.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = {}
+    if (
+        isinstance(cached, dict)
+        and cached.get("version") == LANG_CACHE_VERSION
+        and cached.get("key") == key
+        and cached.get("paths") == pathspecs
+        and isinstance(cached.get("histogram"), dict)
+    ):
+        return {str(ext): int(count) for ext, count in cached["histogram"].items()}
+    tracked = _ls_files(toplevel, pathspecs, "--cached")
+    if tracked is None:
+        return None
+    histogram = ext_histogram(tracked)
+    payload = {"version": LANG_CACHE_VERSION, "key": key, "paths": pathspecs, "histogram": histogram}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+    return histogram
+
+
+def git_ext_histogram(root: Path, ticket: str, candidates: list[Path]) -> Optional[dict[str, int]]:
+    """Extension histogram of tracked plus untracked, non-ignored files under ``candidates``."""
+    context = _git_listing_context(root)
+    if context is None:
+        return None
+    toplevel, key = context
+    pathspecs: list[str] = []
+    for candidate in candidates:
+        try:
+            rel = candidate.resolve().relative_to(toplevel.resolve()).as_posix()
+        except (OSError, ValueError):
+            return None
+        pathspecs.append(rel if rel != "." else "")
+    pathspecs = sorted(set(pathspecs))
+    histogram = _tracked_histogram(root, ticket, toplevel, key, pathspecs)
+    if histogram is None:
+        return None
+    untracked = _ls_files(toplevel, pathspecs, "--others", "--exclude-standard")
+    if untracked is None:
+        return None
+    merged = dict(histogram)
+    for ext, count in ext_histogram(untracked).items():
+        merged[ext] = merged.get(ext, 0) + count
+    return dict(sorted(merged.items()))
+
+
+def walk_ext_histogram(candidates: list[Path], *, max_files: int = 5000) -> dict[str, int]:
+    """Bounded directory-walk histogram for trees outside git."""
+    names: list[str] = []
+    for candidate in candidates:
+        if len(names) >= max_files:
+            break
+        if candidate.is_file():
+            names.append(candidate.name)
+            continue
+        for _base, _, files in os.walk(candidate):
+            names.extend(files[: max_files - len(names)])
+            if len(names) >= max_files:
+                break
+    return ext_histogram(names)
@@ -35,6 +35,7 @@ from aidd_runtime import runtime
 from aidd_runtime.rlm_config import (
     base_root_for_label,
     detect_lang,
+    ext_histogram,
     file_id_for_path,
     load_rlm_settings,
     normalize_path,
@@ -138,6 +139,7 @@ def build_manifest(
         "files": entries,
         "stats": {
             "files_total": len(entries),
+            "ext_histogram": ext_histogram(str(entry.get("path") or "") for entry in entries),
         },
     }
 
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+SCHEMA = "aidd.rlm_stats.v1"
+SECTION_NODES = "nodes"
+SECTION_LINKS = "links"
+_READ_CHUNK = 1 << 20
+
+
+def stats_path(root: Path, ticket: str) -> Path:
+    return root / "reports" / "research" / f"{ticket}-rlm.stats.json"
+
+
+def _utc_now() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _path_label(root: Path, path: Path) -> str:
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except (OSError, ValueError):
+        return path.as_posix()
+
+
+def describe_jsonl(path: Path, *, count_node_kinds: bool = False) -> Optional[Dict[str, object]]:
+    """Row counts, content hash and stat signature of a JSONL file in one streaming pass."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    digest = hashlib.sha256()
+    rows = 0
+    node_kinds: Dict[str, int] = {}
+    file_nodes = 0
+    pending = b""
+    try:
+        with path.open("rb") as handle:
+            while True:
+                chunk = handle.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    rows += 1
+                    if count_node_kinds:
+                        file_nodes += _count_node_kind(line, node_kinds)
+            if pending.strip():
+                rows += 1
+                if count_node_kinds:
+                    file_nodes += _count_node_kind(pending, node_kinds)
+    except OSError:
+        return None
+    entry: Dict[str, object] = {
+        "rows": rows,
+        "sha256": digest.hexdigest(),
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+    }
+    if count_node_kinds:
+        entry["node_kinds"] = dict(sorted(node_kinds.items()))
+        entry["file_nodes"] = file_nodes
+    return entry
+
+
+def _count_node_kind(line: bytes, node_kinds: Dict[str, int]) -> int:
+    """Tally ``node_kind``; returns 1 for rows counted as file nodes (kind ``file`` or unset)."""
+    try:
+        payload = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return 0
+    if not isinstance(payload, dict):
+        return 0
+    node_kind = str(payload.get("node_kind") or "").strip().lower()
+    label = node_kind or "file"
+    node_kinds[label] = node_kinds.get(label, 0) + 1
+    return 1 if label == "file" else 0
+
+
+def load_stats(root: Path, ticket: str) -> Dict[str, object]:
+    path = stats_path(root, ticket)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema") != SCHEMA:
+        return {}
+    return payload
+
+
+def record(root: Path, ticket: str, *, nodes_path: Optional[Path] = None, links_path: Optional[Path] = None) -> Path:
+    """Refresh the nodes and/or links sections of the sidecar after a producer rewrote those files."""
+    payload = load_stats(root, ticket)
+    payload.update({"schema": SCHEMA, "ticket": ticket, "generated_at": _utc_now()})
+    sections = (
+        (SECTION_NODES, nodes_path, True),
+        (SECTION_LINKS, links_path, False),
+    )
+    for section, path, count_node_kinds in sections:
+        if path is None:
+            continue
+        entry = describe_jsonl(path, count_node_kinds=count_node_kinds)
+        if entry is None:
+            payload.pop(section, None)
+            continue
+        entry["path"] = _path_label(root, path)
+        payload[section] = entry
+    output = stats_path(root, ticket)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(output)
+    return output
+
+
+def fresh_section(stats: Dict[str, object], section: str, *, root: Path, path: Path) -> Optional[Dict[str, object]]:
+    """Sidecar entry for ``path`` when its recorded size/mtime still match the file, else None."""
+    entry = stats.get(section)
+    if not isinstance(entry, dict) or entry.get("path") != _path_label(root, path):
+        return None
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    if entry.get("size") != stat_result.st_size or entry.get("mtime_ns") != stat_result.st_mtime_ns:
+        return None
+    return entry
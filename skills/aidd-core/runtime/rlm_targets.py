@@ -38,6 +38,7 @@ from aidd_runtime import research_hints
 from aidd_runtime.rlm_config import (
     base_label,
     detect_lang,
+    ext_histogram,
     load_rlm_settings,
     normalize_ignore_dirs,
     normalize_path,
@@ -440,6 +441,7 @@ def build_targets(
         "stats": {
             "files_total": len(files),
             "keyword_hits": len(hit_files),
+            "ext_histogram": ext_histogram(files),
         },
     }
 
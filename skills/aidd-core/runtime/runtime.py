@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from aidd_runtime import active_state as _active_state
+from aidd_runtime import config_cache
 from aidd_runtime import stage_lexicon
 from aidd_runtime.feature_ids import FeatureIdentifiers, read_active_state, resolve_identifiers
 from aidd_runtime.resources import DEFAULT_PROJECT_SUBDIR, resolve_project_root as resolve_workspace_root
@@ -628,10 +629,9 @@ def maybe_sync_index(
 
 
 def load_gates_config(target: Path) -> dict:
-    config_path = target / "config" / "gates.json"
     try:
-        return json.loads(config_path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError):
+        return config_cache.gates_config(target)
+    except ValueError:
         return {}
 
 
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import os
 
@@ -68,6 +70,13 @@ LEGACY_PREFLIGHT_FILES = (
 )
 
 
+# Bump whenever validate_contract_data rules change so cached verdicts are discarded.
+VALIDATOR_VERSION = 1
+CACHE_SCHEMA = "aidd.skill_contract_cache.v1"
+PARALLEL_MIN_CONTRACTS = 8
+MAX_CACHE_ENTRIES = 256
+
+
 class ValidationError(ValueError):
     pass
 
@@ -92,7 +101,10 @@ def load_contract(path: Path) -> dict[str, Any]:
         text = path.read_text(encoding="utf-8")
     except OSError as exc:
         raise ValidationError(f"cannot read contract: {path}") from exc
+    return parse_contract_text(text)
 
+
+def parse_contract_text(text: str) -> dict[str, Any]:
     normalized = text.strip()
     if normalized.startswith("---"):
         lines = text.splitlines()
@@ -279,6 +291,16 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--contract", help="Path to CONTRACT.yaml file")
     parser.add_argument("--all", action="store_true", help="Validate all skills/*/CONTRACT.yaml")
     parser.add_argument("--quiet", action="store_true", help="Suppress OK output")
+    parser.add_argument(
+        "--cache-file",
+        help="Reuse verdicts stored in this JSON file (keyed by contract content hash and validator version).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Worker processes for cold validation (default: CPU count; used from {PARALLEL_MIN_CONTRACTS} contracts).",
+    )
     parser.add_argument(
         "--print-supported-versions",
         action="store_true",
@@ -287,9 +309,110 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def _validate_one(path: Path) -> List[str]:
-    payload = load_contract(path)
-    return validate_contract_data(payload, contract_path=path)
+ContractVerdict = Tuple[Optional[str], List[str]]
+_MEMORY_CACHE: Dict[str, ContractVerdict] = {}
+
+
+def _verdict_key(path: Path, data: bytes) -> str:
+    # The stage/directory-name rule makes the verdict depend on where the contract lives, not only on its bytes.
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{VALIDATOR_VERSION}:{path.name}:{path.parent.name}:{digest}"
+
+
+def _validate_text(path: Path, text: str) -> ContractVerdict:
+    try:
+        payload = parse_contract_text(text)
+    except ValidationError as exc:
+        return str(exc), []
+    return None, validate_contract_data(payload, contract_path=path)
+
+
+def _validate_text_job(job: Tuple[str, str]) -> ContractVerdict:
+    return _validate_text(Path(job[0]), job[1])
+
+
+def _load_cache_entries(cache_file: Optional[Path]) -> Dict[str, ContractVerdict]:
+    if cache_file is None:
+        return {}
+    try:
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema") != CACHE_SCHEMA:
+        return {}
+    if payload.get("validator_version") != VALIDATOR_VERSION:
+        return {}
+    entries: Dict[str, ContractVerdict] = {}
+    for key, value in (payload.get("entries") or {}).items():
+        if isinstance(value, dict) and isinstance(value.get("errors"), list):
+            load_error = value.get("load_error")
+            entries[str(key)] = (str(load_error) if load_error else None, [str(item) for item in value["errors"]])
+    return entries
+
+
+def _write_cache_entries(cache_file: Path, entries: Dict[str, ContractVerdict]) -> None:
+    payload = {
+        "schema": CACHE_SCHEMA,
+        "validator_version": VALIDATOR_VERSION,
+        "entries": {
+            key: {"load_error": load_error, "errors": errors}
+            for key, (load_error, errors) in entries.items()
+        },
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_suffix(cache_file.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        tmp_path.replace(cache_file)
+    except OSError:
+        pass
+
+
+def validate_contract_files(
+    paths: Sequence[Path],
+    *,
+    cache_file: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Dict[Path, ContractVerdict]:
+    """(load_error, errors) per contract, reusing verdicts keyed by content hash and validator version.
+
+    Unreadable files raise ValidationError. Cold contracts are validated in a process pool once
+    there are at least PARALLEL_MIN_CONTRACTS of them; fewer are cheaper to validate inline.
+    """
+    stored = _load_cache_entries(cache_file)
+    results: Dict[Path, ContractVerdict] = {}
+    pending: List[Tuple[Path, str, str]] = []
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            raise ValidationError(f"cannot read contract: {path}") from exc
+        key = _verdict_key(path, data)
+        verdict = _MEMORY_CACHE.get(key) or stored.get(key)
+        if verdict is not None:
+            _MEMORY_CACHE[key] = verdict
+            results[path] = verdict
+            continue
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise ValidationError(f"cannot read contract: {path}") from exc
+        pending.append((path, key, text))
+
+    if pending:
+        max_workers = workers if workers is not None else min(len(pending), os.cpu_count() or 1)
+        if max_workers > 1 and len(pending) >= PARALLEL_MIN_CONTRACTS:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                verdicts = list(pool.map(_validate_text_job, [(str(path), text) for path, _, text in pending]))
+        else:
+            verdicts = [_validate_text(path, text) for path, _, text in pending]
+        for (path, key, _), verdict in zip(pending, verdicts):
+            _MEMORY_CACHE[key] = verdict
+            stored[key] = verdict
+            results[path] = verdict
+        if cache_file is not None:
+            _write_cache_entries(cache_file, dict(list(stored.items())[-MAX_CACHE_ENTRIES:]))
+    return results
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -311,19 +434,32 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     failed = False
+    ordered: list[Path] = []
     seen: set[Path] = set()
     for path in paths:
         if path in seen:
             continue
         seen.add(path)
+        ordered.append(path)
         if not path.exists():
             print(f"[skill-contract-validate] ERROR: missing contract: {path}", file=sys.stderr)
             failed = True
-            continue
-        try:
-            errors = _validate_one(path)
-        except ValidationError as exc:
-            print(f"[skill-contract-validate] ERROR: {path}: {exc}", file=sys.stderr)
+
+    existing = [path for path in ordered if path.exists()]
+    try:
+        verdicts = validate_contract_files(
+            existing,
+            cache_file=Path(args.cache_file).resolve() if args.cache_file else None,
+            workers=args.jobs,
+        )
+    except ValidationError as exc:
+        print(f"[skill-contract-validate] ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    for path in existing:
+        load_error, errors = verdicts[path]
+        if load_error:
+            print(f"[skill-contract-validate] ERROR: {path}: {load_error}", file=sys.stderr)
             failed = True
             continue
         if errors:
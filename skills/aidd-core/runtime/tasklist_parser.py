@@ -3,8 +3,37 @@ from __future__ import annotations
 import json
 import re
 import shlex
+import threading
+import time
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from aidd_runtime.config_cache import RACY_WINDOW_NS
+
+# Process-wide: loop-run keeps loop-step in-process, so iterations share tasklist reads.
+_LINES_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+_LINES_LOCK = threading.Lock()
+
+
+def read_lines(path: Path) -> List[str]:
+    """Lines of a tasklist, memoized per process by (mtime_ns, size).
+
+    Files written within the racy window are always re-read, so a same-size rewrite inside
+    one timestamp tick is never served stale. Raises ``OSError`` like ``read_text``.
+    """
+    key = str(path.absolute())
+    stat_result = path.stat()
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    with _LINES_LOCK:
+        cached = _LINES_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
+    lines = path.read_text(encoding="utf-8").splitlines()
+    if time.time_ns() - signature[0] >= RACY_WINDOW_NS:
+        with _LINES_LOCK:
+            _LINES_CACHE[key] = (signature, tuple(lines))
+    return lines
+
 
 def _strip_placeholder(value: str) -> Optional[str]:
     stripped = value.strip()
@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
@@ -34,6 +33,7 @@ _ensure_plugin_root_on_path()
 
 from aidd_runtime import runtime
 from aidd_runtime import context_map_validate
+from aidd_runtime import loop_pack
 from aidd_runtime.io_utils import append_jsonl, utc_timestamp, write_json
 
 ALWAYS_ALLOW_REPORTS = ["aidd/reports/**", "aidd/reports/actions/**"]
@@ -219,23 +219,18 @@ def _regenerate_loop_pack(target: Path, *, ticket: str, stage: str, work_item_ke
         loop_stage = "review"
     else:
         loop_stage = "implement"
-    plugin_root = runtime.require_plugin_root()
-    cmd = [
-        sys.executable,
-        str(plugin_root / "skills" / "aidd-loop" / "runtime" / "loop_pack.py"),
-        "--ticket",
-        ticket,
-        "--stage",
-        loop_stage,
-        "--work-item",
-        work_item_key,
-    ]
-    env = os.environ.copy()
-    env["CLAUDE_PLUGIN_ROOT"] = str(plugin_root)
-    env["PYTHONPATH"] = str(plugin_root) if not env.get("PYTHONPATH") else f"{plugin_root}:{env['PYTHONPATH']}"
-    proc = subprocess.run(cmd, cwd=target, text=True, capture_output=True, env=env)
-    output = (proc.stdout or "").strip() or (proc.stderr or "").strip()
-    return proc.returncode == 0, output
+    # Readmap/writemap deltas only touch the active work item, so the NEXT_3 prewarm packs are left as-is.
+    try:
+        result = loop_pack.generate_loop_pack(
+            target,
+            ticket=ticket,
+            stage=loop_stage,
+            work_item=work_item_key,
+            prewarm=False,
+        )
+    except Exception as exc:
+        return False, str(exc) or "loop-pack failed"
+    return result.exit_code == 0, result.message
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
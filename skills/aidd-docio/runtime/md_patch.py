@@ -32,7 +32,7 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
-from aidd_runtime import runtime
+from aidd_runtime import md_outline, runtime
 from aidd_runtime.md_slice import parse_ref
 
 
@@ -40,21 +40,11 @@ def _extract_content(path: Path) -> List[str]:
     return path.read_text(encoding="utf-8").splitlines()
 
 
-def _patch_section(lines: List[str], section_name: str, content: List[str]) -> List[str]:
-    heading = f"## {section_name}"
-    start = -1
-    for idx, line in enumerate(lines):
-        if line.strip() == heading:
-            start = idx
-            break
-    if start < 0:
+def _patch_section(lines: List[str], outline: md_outline.Outline, section_name: str, content: List[str]) -> List[str]:
+    span = outline.section(f"## {section_name}")
+    if span is None:
         raise ValueError(f"section not found: {section_name}")
-
-    end = len(lines)
-    for idx in range(start + 1, len(lines)):
-        if lines[idx].startswith("## "):
-            end = idx
-            break
+    start, end, _, _ = span
 
     replacement = list(content)
     if replacement and replacement[0].strip().startswith("## "):
@@ -62,27 +52,14 @@ def _patch_section(lines: List[str], section_name: str, content: List[str]) -> L
     return lines[: start + 1] + replacement + lines[end:]
 
 
-def _patch_handoff(lines: List[str], handoff_id: str, content: List[str]) -> List[str]:
-    start = -1
-    end = -1
-    start_marker = f"<!-- handoff:{handoff_id} start"
-    end_marker = f"<!-- handoff:{handoff_id} end"
-
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if start < 0 and stripped.startswith(start_marker):
-            start = idx
-            continue
-        if start >= 0 and stripped.startswith(end_marker):
-            end = idx
-            break
-
-    if start < 0:
+def _patch_handoff(lines: List[str], outline: md_outline.Outline, handoff_id: str, content: List[str]) -> List[str]:
+    start, end = outline.handoff(handoff_id)
+    if start is None:
         raise ValueError(f"handoff start marker not found: {handoff_id}")
-    if end < 0:
+    if end is None:
         raise ValueError(f"handoff end marker not found: {handoff_id}")
 
-    return lines[: start + 1] + content + lines[end:]
+    return lines[: start.line + 1] + content + lines[end.line :]
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -107,14 +84,16 @@ def main(argv: list[str] | None = None) -> int:
         if not content_path.exists():
             raise FileNotFoundError(f"content file not found: {runtime.rel_path(content_path, target)}")
 
-        lines = source_path.read_text(encoding="utf-8").splitlines()
+        data = source_path.read_bytes()
+        lines = data.decode("utf-8").splitlines()
+        outline = md_outline.parse_outline(data)
         content_lines = _extract_content(content_path)
 
         if ref.kind == "section":
-            updated = _patch_section(lines, ref.selector, content_lines)
+            updated = _patch_section(lines, outline, ref.selector, content_lines)
             selector_label = f"#{ref.selector}"
         else:
-            updated = _patch_handoff(lines, ref.selector, content_lines)
+            updated = _patch_handoff(lines, outline, ref.selector, content_lines)
             selector_label = f"@handoff:{ref.selector}"
 
         source_path.write_text("\n".join(updated).rstrip() + "\n", encoding="utf-8")
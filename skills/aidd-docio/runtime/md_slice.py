@@ -35,7 +35,7 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
-from aidd_runtime import runtime
+from aidd_runtime import md_outline, runtime
 from aidd_runtime.io_utils import utc_timestamp
 
 
@@ -71,43 +71,21 @@ def parse_ref(raw: str) -> SliceRef:
     raise ValueError("unsupported ref format; use path.md#AIDD:SECTION or path.md@handoff:<id>")
 
 
-def _extract_section(lines: List[str], section_name: str) -> List[str]:
-    start = -1
-    heading = f"## {section_name}"
-    for idx, line in enumerate(lines):
-        if line.strip() == heading:
-            start = idx
-            break
-    if start < 0:
+def _extract_section(outline: md_outline.Outline, path: Path, section_name: str) -> List[str]:
+    span = outline.section(f"## {section_name}")
+    if span is None:
         raise ValueError(f"section not found: {section_name}")
+    _, _, start_offset, end_offset = span
+    return md_outline.read_lines(path, start_offset, end_offset)
 
-    end = len(lines)
-    for idx in range(start + 1, len(lines)):
-        if lines[idx].startswith("## "):
-            end = idx
-            break
-    return lines[start:end]
-
-
-def _extract_handoff(lines: List[str], handoff_id: str) -> List[str]:
-    start = -1
-    end = -1
-    start_marker = f"<!-- handoff:{handoff_id} start"
-    end_marker = f"<!-- handoff:{handoff_id} end"
-
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if start < 0 and stripped.startswith(start_marker):
-            start = idx
-            continue
-        if start >= 0 and stripped.startswith(end_marker):
-            end = idx
-            break
-    if start < 0:
+
+def _extract_handoff(outline: md_outline.Outline, path: Path, handoff_id: str) -> List[str]:
+    start, end = outline.handoff(handoff_id)
+    if start is None:
         raise ValueError(f"handoff start marker not found: {handoff_id}")
-    if end < 0:
+    if end is None:
         raise ValueError(f"handoff end marker not found: {handoff_id}")
-    return lines[start : end + 1]
+    return md_outline.read_lines(path, start.offset, end.end_offset)
 
 
 def _slice_output_path(target: Path, ticket: str, source_path: Path, selector: str) -> Path:
@@ -151,12 +129,12 @@ def main(argv: list[str] | None = None) -> int:
         if not source_path.exists():
             raise FileNotFoundError(f"source markdown not found: {runtime.rel_path(source_path, target)}")
 
-        lines = source_path.read_text(encoding="utf-8").splitlines()
+        outline = md_outline.load_outline(source_path, cache_dir=md_outline.outline_cache_dir(target))
         if ref.kind == "section":
-            body = _extract_section(lines, ref.selector)
+            body = _extract_section(outline, source_path, ref.selector)
             selector_label = f"#{ref.selector}"
         else:
-            body = _extract_handoff(lines, ref.selector)
+            body = _extract_handoff(outline, source_path, ref.selector)
             selector_label = f"@handoff:{ref.selector}"
 
         ticket = (args.ticket or runtime.read_active_ticket(target) or "_global").strip() or "_global"
@@ -3,13 +3,14 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import fnmatch
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
 def _ensure_plugin_root_on_path() -> None:
@@ -33,6 +34,7 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import gates
+from aidd_runtime import git_objects
 from aidd_runtime import runtime
 from aidd_runtime.feature_ids import resolve_identifiers
 
@@ -98,10 +100,14 @@ DEFAULT_CODE_SUFFIXES = {
 DEFAULT_OVERRIDE_ENV = "CLAUDE_SKIP_TASKLIST_PROGRESS"
 DEFAULT_SOURCES: Tuple[str, ...] = ()
 TASKLIST_DIR = Path("docs") / "tasklist"
+# Runtime caches (this module's included) live under aidd/.cache and are never code changes.
+RUNTIME_CACHE_PREFIXES = (".cache/", "aidd/.cache/")
 PROGRESS_LOG_MAX_LINES = 20
 PROGRESS_LOG_MAX_LEN = 240
 PROGRESS_LOG_SOURCES = {"implement", "review", "qa", "research", "normalize"}
 PROGRESS_LOG_KINDS = {"iteration", "handoff"}
+PROGRESS_CACHE_VERSION = 1
+PROGRESS_CACHE_MAX_ENTRIES = 16
 PROGRESS_LOG_RE = re.compile(
     r"^\s*-\s*(?P<date>\d{4}-\d{2}-\d{2})\s+"
     r"source=(?P<source>[A-Za-z0-9_-]+)\s+"
@@ -227,20 +233,7 @@ class ProgressCheckResult:
 
 
 def _is_git_repository(root: Path) -> bool:
-    try:
-        proc = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=root,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True,
-            check=False,
-        )
-    except (FileNotFoundError, OSError):
-        return False
-    if proc.returncode != 0:
-        return False
-    return proc.stdout.strip().lower() == "true"
+    return git_objects.toplevel(root) is not None
 
 
 def _run_git(root: Path, args: Sequence[str]) -> List[str]:
@@ -260,13 +253,6 @@ def _run_git(root: Path, args: Sequence[str]) -> List[str]:
     return [line.strip() for line in proc.stdout.splitlines() if line.strip()]
 
 
-def _git_toplevel(root: Path) -> Optional[Path]:
-    lines = _run_git(root, ["rev-parse", "--show-toplevel"])
-    if not lines:
-        return None
-    return Path(lines[0]).expanduser().resolve()
-
-
 def _collect_changed_files(root: Path) -> Tuple[List[str], bool]:
     if not _is_git_repository(root):
         return ([], False)
@@ -288,40 +274,12 @@ def _collect_changed_files(root: Path) -> Tuple[List[str], bool]:
     return ordered, True
 
 
-def _read_git_file(root: Path, relative: Path) -> str:
-    rel = str(relative).replace("\\", "/")
-    repo_root = _git_toplevel(root)
-    if repo_root is not None:
-        try:
-            target = (root / relative).resolve()
-        except OSError:
-            target = root / relative
-        try:
-            rel = str(target.relative_to(repo_root)).replace("\\", "/")
-        except ValueError:
-            rel = str(relative).replace("\\", "/")
-    try:
-        proc = subprocess.run(
-            ["git", "show", f"HEAD:{rel}"],
-            cwd=root,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True,
-            check=False,
-        )
-    except (FileNotFoundError, OSError):
-        return ""
-    if proc.returncode != 0:
-        return ""
-    return proc.stdout
-
-
-
-
 def _is_code_file(path: str, config: ProgressConfig) -> bool:
     normalized = path.replace("\\", "/")
     if normalized.startswith(str(TASKLIST_DIR)):
         return False
+    if normalized.startswith(RUNTIME_CACHE_PREFIXES):
+        return False
     for prefix in config.code_prefixes:
         if normalized.startswith(prefix):
             return True
@@ -430,55 +388,107 @@ def normalize_progress_log(
 
 
 def _normalize_checkbox_line(line: str) -> str:
-    normalized = " ".join(line.strip().split())
-    return normalized.lower().replace("[x]", "[x]")
+    return " ".join(line.strip().split()).lower()
 
 
-def _ordered_task_lines(content: str, *, checked: bool) -> List[Tuple[str, str]]:
-    marker = "- [x]" if checked else "- [ ]"
-    result: List[Tuple[str, str]] = []
-    seen: set[str] = set()
+@dataclasses.dataclass(frozen=True)
+class TasklistCheckboxes:
+    """Checkbox lines keyed by their normalized text; the first occurrence of a key wins."""
+
+    checked: Dict[str, str]
+    open: Dict[str, str]
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckboxDiff:
+    checked: List[str]
+    open_with_reference: List[str]
+
+
+def parse_checkboxes(content: str) -> TasklistCheckboxes:
+    checked: Dict[str, str] = {}
+    open_items: Dict[str, str] = {}
     for raw in content.splitlines():
         stripped = raw.strip()
-        if not stripped:
-            continue
-        if not stripped.lower().startswith(marker):
+        if not stripped.startswith("- ["):
             continue
-        normalized = _normalize_checkbox_line(stripped) if checked else " ".join(stripped.split()).lower()
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        result.append((normalized, stripped))
-    return result
-
+        marker = stripped[:5].lower()
+        if marker == "- [x]":
+            checked.setdefault(_normalize_checkbox_line(stripped), stripped)
+        elif marker == "- [ ]":
+            open_items.setdefault(_normalize_checkbox_line(stripped), stripped)
+    return TasklistCheckboxes(checked=checked, open=open_items)
+
+
+def diff_checkboxes(old_text: str, new_text: str) -> CheckboxDiff:
+    """New ``- [x]`` lines, and new ``- [ ]`` lines that cite ``reports/`` (handoff tasks), in one parse per side."""
+    old = parse_checkboxes(old_text)
+    new = parse_checkboxes(new_text)
+    return CheckboxDiff(
+        checked=[original for key, original in new.checked.items() if key not in old.checked],
+        open_with_reference=[
+            original
+            for key, original in new.open.items()
+            if key not in old.open and "reports/" in original
+        ],
+    )
 
-def _ordered_checked_lines(content: str) -> List[Tuple[str, str]]:
-    return _ordered_task_lines(content, checked=True)
 
+def _progress_cache_path(root: Path, ticket: str) -> Path:
+    return root / ".cache" / "progress" / f"{ticket}.json"
 
-def _ordered_open_lines(content: str) -> List[Tuple[str, str]]:
-    return _ordered_task_lines(content, checked=False)
 
+def _load_progress_cache(path: Path) -> Dict[str, dict]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != PROGRESS_CACHE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
 
-def _diff_checked(old_text: str, new_text: str) -> List[str]:
-    old_map = dict(_ordered_checked_lines(old_text))
-    additions: List[str] = []
-    for key, original in _ordered_checked_lines(new_text):
-        if key not in old_map:
-            additions.append(original)
-    return additions
 
+def _write_progress_cache(path: Path, entries: Dict[str, dict]) -> None:
+    payload = {"version": PROGRESS_CACHE_VERSION, "entries": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def _cached_checkbox_diff(root: Path, ticket: str, tasklist_rel: Path, new_text: str) -> CheckboxDiff:
+    """Diff against HEAD keyed by (HEAD blob id, worktree content hash); repeated Stops skip the HEAD read and parse."""
+    objects = git_objects.reader(root)
+    repo_rel = git_objects.repo_relative(root, tasklist_rel)
+    head = objects.info(f"HEAD:{repo_rel}") if objects is not None and repo_rel else None
+    head_oid = head.oid if head is not None and head.kind == "blob" else ""
+    key = f"{head_oid}:{hashlib.sha256(new_text.encode('utf-8')).hexdigest()}"
+
+    cache_path = _progress_cache_path(root, ticket)
+    entries = _load_progress_cache(cache_path)
+    cached = entries.get(key)
+    if isinstance(cached, dict):
+        try:
+            return CheckboxDiff(
+                checked=[str(item) for item in cached["checked"]],
+                open_with_reference=[str(item) for item in cached["open_with_reference"]],
+            )
+        except (KeyError, TypeError):
+            pass
 
-def _diff_open_tasks(old_text: str, new_text: str, *, require_reference: bool = False) -> List[str]:
-    old_map = dict(_ordered_open_lines(old_text))
-    additions: List[str] = []
-    for key, original in _ordered_open_lines(new_text):
-        if key in old_map:
-            continue
-        if require_reference and "reports/" not in original:
-            continue
-        additions.append(original)
-    return additions
+    old_text = ""
+    if head_oid and objects is not None:
+        data = objects.read_blob(head_oid)
+        old_text = data.decode("utf-8", errors="replace") if data is not None else ""
+    diff = diff_checkboxes(old_text, new_text)
+    entries.pop(key, None)
+    entries[key] = dataclasses.asdict(diff)
+    _write_progress_cache(cache_path, dict(list(entries.items())[-PROGRESS_CACHE_MAX_ENTRIES:]))
+    return diff
 
 
 def check_progress(
@@ -615,8 +625,8 @@ def check_progress(
             message=f"Не удалось прочитать {tasklist_rel}: {exc}.",
         )
 
-    old_text = _read_git_file(root, tasklist_rel)
-    new_items = _diff_checked(old_text, new_text)
+    diff = _cached_checkbox_diff(root, ticket, tasklist_rel, new_text)
+    new_items = diff.checked
     if new_items:
         return ProgressCheckResult(
             status="ok",
@@ -629,7 +639,7 @@ def check_progress(
         )
 
     if context == "handoff":
-        open_items = _diff_open_tasks(old_text, new_text, require_reference=True)
+        open_items = diff.open_with_reference
         if open_items:
             return ProgressCheckResult(
                 status="ok",
@@ -1008,8 +1008,8 @@ def check_tasklist(
     return check_tasklist_text(root, ticket, text, normalize_fix_mode=normalize_fix_mode)
 
 
-def run_check(args: argparse.Namespace) -> int:
-    root = resolve_aidd_root(Path.cwd())
+def run_check(args: argparse.Namespace, *, target: Optional[Path] = None) -> int:
+    root = resolve_aidd_root(target or Path.cwd())
     config_path = Path(args.config)
     if not config_path.is_absolute():
         config_path = root / config_path
@@ -0,0 +1,144 @@
+"""Persistent index of the tasklist handoff sections maintained by ``tasks-derive``.
+
+``aidd/.cache/tasks-derive/<ticket>.json`` remembers, for the tasklist as last seen:
+
+- its stat signature and, per handoff source, the character range of the
+  ``<!-- handoff:<source> ... -->`` section, so the next derivation slices the section out
+  directly instead of scanning the whole tasklist for its markers;
+- per task key (id or signature), the content hashes of an existing block and a derived
+  block whose merge was a no-op, so unchanged blocks skip field merging entirely.
+
+Ranges are trusted only while the signature matches and the markers are still at both
+ends of the range; the merge memo is keyed by content hashes and never goes stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CACHE_VERSION = 1
+
+
+def block_hash(lines: Sequence[str]) -> str:
+    return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+class HandoffIndex:
+    def __init__(self, root: Path, ticket: str, tasklist_path: Path) -> None:
+        self.path = root / ".cache" / "tasks-derive" / f"{ticket}.json"
+        self.tasklist_path = tasklist_path
+        self._signature: Optional[List[int]] = None
+        self._sections: Dict[str, Dict[str, object]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return
+        sections = payload.get("sections")
+        if isinstance(sections, dict):
+            self._sections = {str(key): value for key, value in sections.items() if isinstance(value, dict)}
+        signature = payload.get("tasklist")
+        if isinstance(signature, list) and signature == _signature(self.tasklist_path):
+            self._signature = signature
+
+    def _section(self, source: str) -> Dict[str, object]:
+        return self._sections.setdefault(source, {})
+
+    def locate(self, source: str, text: str) -> Optional[Tuple[int, int]]:
+        """Character range of the ``source`` handoff section, if the index still describes ``text``."""
+        if self._signature is None:
+            return None
+        entry = self._sections.get(source) or {}
+        start, end = entry.get("start"), entry.get("end")
+        if not isinstance(start, int) or not isinstance(end, int) or not 0 <= start < end <= len(text):
+            return None
+        if start and text[start - 1] != "\n":
+            return None
+        section = text[start:end]
+        if "\r" in section:
+            return None
+        first, _, _ = section.partition("\n")
+        last = section.rsplit("\n", 1)[-1]
+        label = f"handoff:{source}"
+        if not (first.strip().startswith("<!--") and label in first):
+            return None
+        if section.count("\n") and not (label in last and last.strip().endswith("-->")):
+            return None
+        if end < len(text) and text[end] != "\n":
+            return None
+        return start, end
+
+    def record_range(self, source: str, start: int, end: int, *, old: Optional[Tuple[int, int]] = None) -> None:
+        """Store the section range; ranges of other sections after a resized one are shifted."""
+        if old is not None:
+            delta = (end - start) - (old[1] - old[0])
+            for other, entry in self._sections.items():
+                other_start = entry.get("start")
+                if other == source or not isinstance(other_start, int) or other_start < old[1]:
+                    continue
+                entry["start"] = other_start + delta
+                entry["end"] = int(entry.get("end") or 0) + delta
+        section = self._section(source)
+        section["start"] = start
+        section["end"] = end
+
+    def forget_range(self, source: str) -> None:
+        entry = self._sections.get(source)
+        if entry is not None:
+            entry.pop("start", None)
+            entry.pop("end", None)
+
+    def sources(self) -> List[str]:
+        return list(self._sections)
+
+    def merge_is_noop(self, source: str, key: str, existing: Sequence[str], derived: Sequence[str]) -> bool:
+        memo = self._sections.get(source, {}).get("noop")
+        if not key or not isinstance(memo, dict):
+            return False
+        return memo.get(key) == [block_hash(existing), block_hash(derived)]
+
+    def record_merge(
+        self,
+        source: str,
+        key: str,
+        existing: Sequence[str],
+        derived: Sequence[str],
+        merged: Sequence[str],
+    ) -> None:
+        if not key:
+            return
+        memo = self._section(source).setdefault("noop", {})
+        if list(merged) == list(existing):
+            memo[key] = [block_hash(existing), block_hash(derived)]
+        else:
+            # The merged block becomes the next "existing" one; it is confirmed on the next run.
+            memo.pop(key, None)
+
+    def save(self) -> None:
+        payload = {
+            "version": CACHE_VERSION,
+            "tasklist": _signature(self.tasklist_path),
+            "sections": self._sections,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            pass
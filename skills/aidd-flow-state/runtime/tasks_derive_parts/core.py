@@ -31,7 +31,9 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
+from aidd_runtime import columnar
 from aidd_runtime import runtime
+from aidd_runtime.tasklist_handoff_index import HandoffIndex
 
 
 _TASK_ID_RE = re.compile(r"\bid:\s*([A-Za-z0-9_.:-]+)")
@@ -233,13 +235,9 @@ _HANDOFF_SECTION_HINTS: Dict[str, Tuple[str, ...]] = {
 
 
 def _derive_tasks_from_findings(prefix: str, payload: Dict, report_label: str) -> List[List[str]]:
-    raw_findings = payload.get("findings") or []
-    findings = _inflate_columnar(raw_findings) if isinstance(raw_findings, dict) else raw_findings
     blocks: List[List[str]] = []
     source = _canonical_source(prefix.lower())
-    for finding in findings:
-        if not isinstance(finding, dict):
-            continue
+    for finding in columnar.iter_records(payload.get("findings") or []):
         severity = str(finding.get("severity") or "").strip().lower() or "info"
         scope = str(finding.get("scope") or "").strip() or "n/a"
         title = str(finding.get("title") or "").strip() or "issue"
@@ -279,7 +277,6 @@ def _derive_tasks_from_tests(payload: Dict, report_label: str) -> List[List[str]
     blocks: List[List[str]] = []
     summary = str(payload.get("tests_summary") or "").strip().lower() or "not-run"
     raw_executed = payload.get("tests_executed") or []
-    executed = _inflate_columnar(raw_executed) if isinstance(raw_executed, dict) else raw_executed
     source = "qa"
     if summary == "fail":
         task_id = _canonical_task_id(source, f"qa-tests:{_stable_task_id('qa-tests', 'summary', summary)}")
@@ -313,12 +310,15 @@ def _derive_tasks_from_tests(payload: Dict, report_label: str) -> List[List[str]
             report_label=report_label,
         )
         blocks.append(_task_block(spec))
-    for entry in executed:
-        if not isinstance(entry, dict):
-            continue
-        status = str(entry.get("status") or "").strip().lower()
-        if status != "fail":
-            continue
+    def _failed(status: object) -> bool:
+        return str(status or "").strip().lower() == "fail"
+
+    table = columnar.ColumnarTable.from_section(raw_executed)
+    if table is not None:
+        failed = table.where("status", _failed)
+    else:
+        failed = (entry for entry in columnar.iter_records(raw_executed) if _failed(entry.get("status")))
+    for entry in failed:
         command = str(entry.get("command") or "").strip()
         log_path = str(entry.get("log") or entry.get("log_path") or "").strip()
         task_id = _canonical_task_id(source, _stable_task_id("qa-tests", "fail", command, log_path))
@@ -359,27 +359,6 @@ def _derive_tasks_from_tests(payload: Dict, report_label: str) -> List[List[str]
     return blocks
 
 
-def _inflate_columnar(section: object) -> List[Dict]:
-    if not isinstance(section, dict):
-        return []
-    cols = section.get("cols")
-    rows = section.get("rows")
-    if not isinstance(cols, list) or not isinstance(rows, list):
-        return []
-    items: List[Dict] = []
-    for row in rows:
-        if not isinstance(row, list):
-            continue
-        record: Dict[str, object] = {}
-        for idx, col in enumerate(cols):
-            if idx >= len(row):
-                break
-            record[str(col)] = row[idx]
-        if record:
-            items.append(record)
-    return items
-
-
 def _derive_tasks_from_rlm_pack(payload: Dict, report_label: str) -> List[List[str]]:
     blocks: List[List[str]] = []
     source = "research"
@@ -759,7 +738,14 @@ def _apply_status_to_block(block: Sequence[str], checkbox: str, status: str) ->
     return updated
 
 
-def _merge_handoff_tasks(existing: Sequence[str], new_tasks: Sequence[str], *, append: bool) -> List[str]:
+def _merge_handoff_tasks(
+    existing: Sequence[str],
+    new_tasks: Sequence[str],
+    *,
+    append: bool,
+    index: Optional[HandoffIndex] = None,
+    source: str = "",
+) -> List[str]:
     if not append:
         return list(new_tasks)
 
@@ -794,13 +780,17 @@ def _merge_handoff_tasks(existing: Sequence[str], new_tasks: Sequence[str], *, a
             idx = len(merged_blocks) - 1
         else:
             existing_block = merged_blocks[idx]
-            existing_checkbox = _block_checkbox_state(existing_block)
-            existing_status = _block_status_value(existing_block)
-            desired_status = existing_status or ("done" if existing_checkbox == "done" else "open")
-            desired_checkbox = "done" if existing_status == "done" else existing_checkbox
-            merged = _apply_status_to_block(block, desired_checkbox or "open", desired_status or "open")
-            merged = _merge_block_fields(existing_block, merged)
-            merged_blocks[idx] = merged
+            key = task_id or signature
+            if index is None or not index.merge_is_noop(source, key, existing_block, block):
+                existing_checkbox = _block_checkbox_state(existing_block)
+                existing_status = _block_status_value(existing_block)
+                desired_status = existing_status or ("done" if existing_checkbox == "done" else "open")
+                desired_checkbox = "done" if existing_status == "done" else existing_checkbox
+                merged = _apply_status_to_block(block, desired_checkbox or "open", desired_status or "open")
+                merged = _merge_block_fields(existing_block, merged)
+                if index is not None:
+                    index.record_merge(source, key, existing_block, block, merged)
+                merged_blocks[idx] = merged
 
         if task_id:
             by_id[task_id] = idx
@@ -844,6 +834,21 @@ def _find_section(lines: List[str], candidates: Sequence[str]) -> tuple[int, Opt
     return -1, None
 
 
+def _reindex_sections(index: Optional[HandoffIndex], source: str, new_lines: List[str]) -> None:
+    """Record the offsets of every known handoff section in the re-joined tasklist."""
+    if index is None:
+        return
+    offsets = [0]
+    for line in new_lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+    for name in {source, *index.sources()}:
+        start, end, _ = _extract_handoff_block(new_lines, name)
+        if start == -1:
+            index.forget_range(name)
+            continue
+        index.record_range(name, offsets[start], offsets[end] - 1)
+
+
 def _apply_handoff_tasks(
     text: str,
     *,
@@ -852,12 +857,26 @@ def _apply_handoff_tasks(
     tasks: Sequence[str],
     append: bool,
     section_candidates: Sequence[str],
+    index: Optional[HandoffIndex] = None,
 ) -> tuple[str, Optional[str], bool]:
     source = _canonical_source(source)
+    located = index.locate(source, text) if index is not None else None
+    if located is not None:
+        # Indexed section: merge only its lines and splice the result into the untouched text.
+        section_start, section_end = located
+        block = text[section_start:section_end].split("\n")
+        new_tasks = _merge_handoff_tasks(block[1:-1], tasks, append=append, index=index, source=source)
+        new_section = "\n".join([block[0], *new_tasks, block[-1]])
+        new_text = text[:section_start] + new_section + text[section_end:]
+        if not new_text.endswith("\n"):
+            new_text += "\n"
+        index.record_range(source, section_start, section_start + len(new_section), old=located)
+        return new_text, None, new_text != text
+
     lines = text.splitlines()
     handoff_start, handoff_end, block = _extract_handoff_block(lines, source)
     block_lines = block[1:-1] if len(block) >= 2 else []
-    new_tasks = _merge_handoff_tasks(block_lines, tasks, append=append)
+    new_tasks = _merge_handoff_tasks(block_lines, tasks, append=append, index=index, source=source)
 
     if handoff_start != -1:
         start_marker = block[0] if block else f"<!-- handoff:{source} start -->"
@@ -867,6 +886,7 @@ def _apply_handoff_tasks(
         new_text = "\n".join(new_lines)
         if not new_text.endswith("\n"):
             new_text += "\n"
+        _reindex_sections(index, source, new_lines)
         return new_text, None, new_text != text
 
     insert_at, heading_label = _find_section(lines, section_candidates)
@@ -883,6 +903,7 @@ def _apply_handoff_tasks(
     new_text = "\n".join(new_lines)
     if not new_text.endswith("\n"):
         new_text += "\n"
+    _reindex_sections(index, source, new_lines)
     changed = new_text != text
     return new_text, heading_label, changed
 
@@ -1017,11 +1038,13 @@ def main(argv: list[str] | None = None) -> int:
         raise FileNotFoundError(
             f"tasklist not found at {tasklist_rel}; create it via /feature-dev-aidd:tasks-new {ticket}."
         )
+    handoff_index = HandoffIndex(target, ticket, tasklist_path)
     tasklist_text = tasklist_path.read_text(encoding="utf-8")
     if source == "research" and not derived_tasks:
-        existing_start, _, _ = _extract_handoff_block(tasklist_text.splitlines(), source)
-        if existing_start == -1:
-            return 0
+        if handoff_index.locate(source, tasklist_text) is None:
+            existing_start, _, _ = _extract_handoff_block(tasklist_text.splitlines(), source)
+            if existing_start == -1:
+                return 0
 
     updated_text, heading_label, changed = _apply_handoff_tasks(
         tasklist_text,
@@ -1030,6 +1053,7 @@ def main(argv: list[str] | None = None) -> int:
         tasks=derived_tasks,
         append=bool(args.append),
         section_candidates=_HANDOFF_SECTION_HINTS.get(source, ()),
+        index=handoff_index,
     )
 
     section_display = heading_label or "end of file"
@@ -1044,10 +1068,14 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if not changed:
+        handoff_index.save()
         print(f"[aidd] tasklist already up to date for {source} report ({report_label}).")
         return 0
 
-    tasklist_path.write_text(updated_text, encoding="utf-8")
+    tmp_path = tasklist_path.with_name(f".{tasklist_path.name}.tmp")
+    tmp_path.write_text(updated_text, encoding="utf-8")
+    tmp_path.replace(tasklist_path)
+    handoff_index.save()
     print(
         f"[aidd] added {len(derived_blocks)} task(s) "
         f"from {source} report ({report_label}) to {tasklist_rel} "
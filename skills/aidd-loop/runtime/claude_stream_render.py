@@ -4,12 +4,23 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
+import time
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, TextIO
+from typing import Any, Iterable, List, Optional, TextIO
 
 
 MAX_ARG_CHARS = 200
+FLUSH_INTERVAL_SECONDS = 0.05
+# Event kinds that never carry text or tool markers; sniffed from the raw line and not parsed.
+SKIP_KINDS = frozenset(
+    {"ping", "system", "usage", "message_start", "message_delta", "message_stop", "content_block_stop", "user", "result"}
+)
+# Block/message boundaries: pending output is flushed here so text never lingers while a tool runs.
+BOUNDARY_KINDS = frozenset({"content_block_stop", "message_delta", "message_stop", "result"})
+_KIND_RE = re.compile(r'\s*\{\s*"type"\s*:\s*"([a-z_]+)"')
+_NON_SPACE_RE = re.compile(r"\S")
 HELP_EPILOG = """Examples:
   python3 ${CLAUDE_PLUGIN_ROOT}/skills/aidd-loop/runtime/claude_stream_render.py --help
   cat stream.jsonl | python3 ${CLAUDE_PLUGIN_ROOT}/skills/aidd-loop/runtime/claude_stream_render.py --mode text+tools
@@ -26,6 +37,46 @@ Exit codes:
 @dataclass
 class RenderState:
     line_start: bool = True
+    # 0 flushes after every line; otherwise output is batched and flushed at most this often,
+    # on boundary events and when the caller calls :func:`flush`.
+    flush_interval: float = 0.0
+    last_flush: float = 0.0
+    pending: bool = False
+
+
+def sniff_kind(raw: str) -> str:
+    """Event ``type`` when the line starts with it (the Claude stream-json layout), else ``""``."""
+    match = _KIND_RE.match(raw)
+    return match.group(1) if match else ""
+
+
+def _clip(value: Any, budget: List[int], limit: int) -> Any:
+    """Copy of ``value`` cut down to what can show in the first ``limit`` serialized characters.
+
+    ``budget`` holds a lower bound of the characters still to emit; once it is spent the
+    remaining items are dropped, which only changes output past the truncation point.
+    """
+    if isinstance(value, str):
+        budget[0] -= len(value) + 2
+        return value[: limit + 1]
+    if isinstance(value, dict):
+        clipped = {}
+        for key, item in value.items():
+            if budget[0] <= 0:
+                break
+            budget[0] -= 1
+            clipped[key] = _clip(item, budget, limit)
+        return clipped
+    if isinstance(value, (list, tuple)):
+        items = []
+        for item in value:
+            if budget[0] <= 0:
+                break
+            budget[0] -= 1
+            items.append(_clip(item, budget, limit))
+        return items
+    budget[0] -= 1
+    return value
 
 
 def _shorten(value: Any, *, limit: int = MAX_ARG_CHARS) -> str:
@@ -36,10 +87,16 @@ def _shorten(value: Any, *, limit: int = MAX_ARG_CHARS) -> str:
         text = value
     else:
         try:
-            text = json.dumps(value, ensure_ascii=False)
+            text = json.dumps(_clip(value, [limit + 1], limit), ensure_ascii=False)
         except (TypeError, ValueError):
             text = str(value)
-    cleaned = " ".join(text.splitlines()).strip()
+    head = text.lstrip()
+    cut = limit * 2 + 2
+    if len(head) > cut and _NON_SPACE_RE.search(head, cut):
+        # Only the head survives truncation; a line break (at most two characters) becomes one space.
+        cleaned = " ".join(head[:cut].splitlines())
+    else:
+        cleaned = " ".join(head.splitlines()).strip()
     if len(cleaned) > limit:
         return cleaned[: limit - 3] + "..."
     return cleaned
@@ -145,6 +202,21 @@ def render_event(event: Any, *, writer: TextIO, mode: str, state: RenderState) -
         _write_line(writer, state, payload)
 
 
+def flush(writer: TextIO, state: RenderState) -> None:
+    if state.pending:
+        writer.flush()
+        state.pending = False
+    state.last_flush = time.monotonic()
+
+
+def _maybe_flush(writer: TextIO, state: RenderState, *, boundary: bool = False) -> None:
+    if state.flush_interval <= 0:
+        writer.flush()
+        return
+    if state.pending and (boundary or time.monotonic() - state.last_flush >= state.flush_interval):
+        flush(writer, state)
+
+
 def render_line(
     line: str,
     *,
@@ -159,15 +231,23 @@ def render_line(
         return True
     if state is None:
         state = RenderState()
+    kind = sniff_kind(raw)
+    if kind in SKIP_KINDS and raw.rstrip().endswith("}"):
+        # A truncated line does not end with "}", so strict mode still sees it below.
+        if state.flush_interval > 0:
+            _maybe_flush(writer, state, boundary=kind in BOUNDARY_KINDS)
+        return True
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError as exc:
         if warn_stream:
+            flush(writer, state)
             warn_stream.write(f"[stream] WARN: invalid json line ({exc})\n")
             warn_stream.flush()
         return not strict
     render_event(payload, writer=writer, mode=mode, state=state)
-    writer.flush()
+    state.pending = True
+    _maybe_flush(writer, state, boundary=state.line_start)
     return True
 
 
@@ -193,19 +273,21 @@ def _strict_enabled() -> bool:
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
     strict = _strict_enabled()
-    state = RenderState()
-    ok = True
-    for line in sys.stdin:
-        ok = render_line(
-            line,
-            writer=sys.stdout,
-            mode=args.mode,
-            strict=strict,
-            warn_stream=sys.stderr,
-            state=state,
-        )
-        if not ok and strict:
-            return 1
+    state = RenderState(flush_interval=FLUSH_INTERVAL_SECONDS, last_flush=time.monotonic())
+    try:
+        for line in sys.stdin:
+            ok = render_line(
+                line,
+                writer=sys.stdout,
+                mode=args.mode,
+                strict=strict,
+                warn_stream=sys.stderr,
+                state=state,
+            )
+            if not ok and strict:
+                return 1
+    finally:
+        flush(sys.stdout, state)
     return 0
 
 
@@ -7,6 +7,7 @@ import argparse
 import json
 import re
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -35,6 +36,7 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import runtime
+from aidd_runtime.config_cache import RACY_WINDOW_NS
 from aidd_runtime import loop_step_stage_result as _loop_stage_result
 from aidd_runtime.feature_ids import write_active_state
 from aidd_runtime.io_utils import dump_yaml, parse_front_matter, utc_timestamp
@@ -755,7 +757,9 @@ def write_pack_for_item(
     )
     output_dir.mkdir(parents=True, exist_ok=True)
     pack_path = output_dir / f"{work_item.scope_key}.loop.pack.md"
-    pack_path.write_text(pack_text, encoding="utf-8")
+    tmp_path = pack_path.with_name(f".{pack_path.name}.tmp")
+    tmp_path.write_text(pack_text, encoding="utf-8")
+    tmp_path.replace(pack_path)
     return pack_path, boundaries, commands_required, tests_required, updated_at, reason_code
 
 
@@ -786,10 +790,74 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = parse_args(argv)
-    _, target = runtime.require_workflow_root()
-    context = runtime.resolve_feature_context(target, ticket=args.ticket, slug_hint=args.slug_hint)
+@dataclass(frozen=True)
+class ParsedTasklist:
+    sections: Dict[str, List[str]]
+    context_allowed_paths: List[str]
+    iterations: List[WorkItem]
+    handoffs: List[WorkItem]
+
+
+@dataclass
+class LoopPackResult:
+    exit_code: int
+    payload: Dict[str, object]
+    message: str
+
+
+_TASKLIST_CACHE: Dict[str, Tuple[Tuple[int, int], ParsedTasklist]] = {}
+
+
+def load_tasklist(path: Path) -> ParsedTasklist:
+    """Parse the tasklist once per (mtime, size) so in-process callers reuse sections and work items.
+
+    Tasklists written within the racy window are re-parsed every time: a same-length checkbox
+    toggle inside one timestamp tick leaves the signature unchanged.
+    """
+    try:
+        stat_result = path.stat()
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    except OSError:
+        signature = (-1, -1)
+    cache_key = str(path)
+    cached = _TASKLIST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    sections = parse_sections(read_text(path).splitlines())
+    parsed = ParsedTasklist(
+        sections=sections,
+        context_allowed_paths=parse_context_allowed_paths(sections.get("AIDD:CONTEXT_PACK", [])),
+        iterations=parse_iteration_items(sections.get("AIDD:ITERATIONS_FULL", [])),
+        handoffs=parse_handoff_items(sections.get("AIDD:HANDOFF_INBOX", [])),
+    )
+    if signature[0] >= 0 and time.time_ns() - signature[0] >= RACY_WINDOW_NS:
+        _TASKLIST_CACHE[cache_key] = (signature, parsed)
+    return parsed
+
+
+def _blocked(ticket: str, stage: str, reason: str, message: str) -> LoopPackResult:
+    payload: Dict[str, object] = {
+        "schema": "aidd.loop_pack.v1",
+        "status": "blocked",
+        "ticket": ticket,
+        "stage": stage,
+        "reason": reason,
+    }
+    return LoopPackResult(exit_code=2, payload=payload, message=message)
+
+
+def generate_loop_pack(
+    target: Path,
+    *,
+    ticket: Optional[str] = None,
+    slug_hint: Optional[str] = None,
+    stage: str = "implement",
+    work_item: Optional[str] = None,
+    pick_next: bool = False,
+    prewarm: bool = True,
+) -> LoopPackResult:
+    """Select a work item and write its loop pack; ``prewarm=False`` skips the AIDD:NEXT_3 packs."""
+    context = runtime.resolve_feature_context(target, ticket=ticket, slug_hint=slug_hint)
     ticket = (context.resolved_ticket or "").strip()
     if not ticket:
         raise ValueError("feature ticket is required; pass --ticket or set docs/.active.json via /feature-dev-aidd:idea-new.")
@@ -798,12 +866,11 @@ def main(argv: list[str] | None = None) -> int:
     if not tasklist_path.exists():
         raise FileNotFoundError(f"tasklist not found at {runtime.rel_path(tasklist_path, target)}")
 
-    tasklist_lines = read_text(tasklist_path).splitlines()
-    sections = parse_sections(tasklist_lines)
-    context_allowed_paths = parse_context_allowed_paths(sections.get("AIDD:CONTEXT_PACK", []))
-    iterations = parse_iteration_items(sections.get("AIDD:ITERATIONS_FULL", []))
-    handoffs = parse_handoff_items(sections.get("AIDD:HANDOFF_INBOX", []))
-    all_items = iterations + handoffs
+    tasklist = load_tasklist(tasklist_path)
+    sections = tasklist.sections
+    context_allowed_paths = tasklist.context_allowed_paths
+    handoffs = tasklist.handoffs
+    all_items = tasklist.iterations + handoffs
 
     active_ticket = runtime.read_active_ticket(target)
     active_work_item = runtime.read_active_work_item(target)
@@ -811,65 +878,23 @@ def main(argv: list[str] | None = None) -> int:
     selection_reason = ""
     review_meta = (
         read_review_pack_meta(target, ticket)
-        if args.stage == "implement"
+        if stage == "implement"
         else ReviewPackMeta("", "", "", tuple())
     )
     open_handoffs = [item for item in handoffs if is_open_item(item) and is_review_handoff_id(item.item_id)]
-    revise_mode = args.stage == "implement" and review_meta.verdict == "REVISE" and not args.pick_next
+    revise_mode = stage == "implement" and review_meta.verdict == "REVISE" and not pick_next
 
-    if args.stage == "review" and not args.work_item:
+    if stage == "review" and not work_item:
         if active_ticket and active_ticket != ticket:
-            message = "BLOCKED: review active ticket mismatch"
-            reason = "review_active_ticket_mismatch"
-            if args.format:
-                payload = {
-                    "schema": "aidd.loop_pack.v1",
-                    "status": "blocked",
-                    "ticket": ticket,
-                    "stage": args.stage,
-                    "reason": reason,
-                }
-                output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                print(output)
-            else:
-                print(message)
-            return 2
+            return _blocked(ticket, stage, "review_active_ticket_mismatch", "BLOCKED: review active ticket mismatch")
         if not active_work_item:
-            message = "BLOCKED: review active work item missing"
-            reason = "review_active_work_item_missing"
-            if args.format:
-                payload = {
-                    "schema": "aidd.loop_pack.v1",
-                    "status": "blocked",
-                    "ticket": ticket,
-                    "stage": args.stage,
-                    "reason": reason,
-                }
-                output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                print(output)
-            else:
-                print(message)
-            return 2
-
-    if args.stage == "implement" and review_meta.schema == "aidd.review_pack.v1" and review_pack_v2_required(target):
-        message = "BLOCKED: review pack v2 required"
-        reason = "review_pack_v2_required"
-        if args.format:
-            payload = {
-                "schema": "aidd.loop_pack.v1",
-                "status": "blocked",
-                "ticket": ticket,
-                "stage": args.stage,
-                "reason": reason,
-            }
-            output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-            print(output)
-        else:
-            print(message)
-        return 2
+            return _blocked(ticket, stage, "review_active_work_item_missing", "BLOCKED: review active work item missing")
 
-    if args.work_item:
-        raw = args.work_item.strip()
+    if stage == "implement" and review_meta.schema == "aidd.review_pack.v1" and review_pack_v2_required(target):
+        return _blocked(ticket, stage, "review_pack_v2_required", "BLOCKED: review pack v2 required")
+
+    if work_item:
+        raw = work_item.strip()
         if raw.startswith("iteration_id="):
             ref = WorkItemRef("iteration_id", raw.split("=", 1)[1].strip())
         elif raw.startswith("id="):
@@ -880,7 +905,7 @@ def main(argv: list[str] | None = None) -> int:
         if not selected_item:
             raise ValueError(f"work item {raw} not found in tasklist")
         selection_reason = "override"
-    elif args.stage == "implement":
+    elif stage == "implement":
         if revise_mode:
             if active_ticket == ticket and active_work_item:
                 candidate = find_work_item(all_items, runtime.sanitize_scope_key(active_work_item))
@@ -888,53 +913,26 @@ def main(argv: list[str] | None = None) -> int:
                     selected_item = candidate
                     selection_reason = "active-revise"
                 elif candidate:
-                    message = "BLOCKED: review pack requires revise but active work item is closed"
-                    reason = "review_revise_closed_item"
-                    if args.format:
-                        payload = {
-                            "schema": "aidd.loop_pack.v1",
-                            "status": "blocked",
-                            "ticket": ticket,
-                            "stage": args.stage,
-                            "reason": reason,
-                        }
-                        output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                        print(output)
-                    else:
-                        print(message)
-                    return 2
+                    return _blocked(
+                        ticket,
+                        stage,
+                        "review_revise_closed_item",
+                        "BLOCKED: review pack requires revise but active work item is closed",
+                    )
                 else:
-                    message = "BLOCKED: review pack requires revise but active work item is missing"
-                    reason = "review_revise_missing_active"
-                    if args.format:
-                        payload = {
-                            "schema": "aidd.loop_pack.v1",
-                            "status": "blocked",
-                            "ticket": ticket,
-                            "stage": args.stage,
-                            "reason": reason,
-                        }
-                        output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                        print(output)
-                    else:
-                        print(message)
-                    return 2
+                    return _blocked(
+                        ticket,
+                        stage,
+                        "review_revise_missing_active",
+                        "BLOCKED: review pack requires revise but active work item is missing",
+                    )
             else:
-                message = "BLOCKED: review pack requires revise but active work item is missing"
-                reason = "review_revise_missing_active"
-                if args.format:
-                    payload = {
-                        "schema": "aidd.loop_pack.v1",
-                        "status": "blocked",
-                        "ticket": ticket,
-                        "stage": args.stage,
-                        "reason": reason,
-                    }
-                    output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                    print(output)
-                else:
-                    print(message)
-                return 2
+                return _blocked(
+                    ticket,
+                    stage,
+                    "review_revise_missing_active",
+                    "BLOCKED: review pack requires revise but active work item is missing",
+                )
         else:
             if review_meta.scope_key:
                 candidate = find_work_item(all_items, review_meta.scope_key)
@@ -945,7 +943,7 @@ def main(argv: list[str] | None = None) -> int:
                 selected_item = select_first_open_handoff(review_meta.handoff_ids, handoffs)
                 if selected_item:
                     selection_reason = "review-handoff"
-            if not selected_item and active_ticket == ticket and active_work_item and not args.pick_next:
+            if not selected_item and active_ticket == ticket and active_work_item and not pick_next:
                 selected_item = find_work_item(all_items, runtime.sanitize_scope_key(active_work_item))
                 if selected_item:
                     if is_open_item(selected_item):
@@ -962,7 +960,7 @@ def main(argv: list[str] | None = None) -> int:
                 selected_item = open_handoffs[0]
                 selection_reason = "handoff"
     else:
-        if args.pick_next:
+        if pick_next:
             next3_refs = parse_next3_refs(sections.get("AIDD:NEXT_3", []))
             if next3_refs:
                 selected_item = select_first_matching(next3_refs, all_items)
@@ -981,50 +979,31 @@ def main(argv: list[str] | None = None) -> int:
                     selection_reason = "progress"
 
     if not selected_item:
-        message = "BLOCKED: work item not found for loop pack selection"
-        reason = "work_item_not_found"
         if revise_mode:
-            message = "BLOCKED: review pack requires revise but no open review handoff item"
-            reason = "review_revise_missing_handoff"
-        if args.format:
-            payload = {
-                "schema": "aidd.loop_pack.v1",
-                "status": "blocked",
-                "ticket": ticket,
-                "stage": args.stage,
-                "reason": reason,
-            }
-            output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-            print(output)
-        else:
-            print(message)
-        return 2
+            return _blocked(
+                ticket,
+                stage,
+                "review_revise_missing_handoff",
+                "BLOCKED: review pack requires revise but no open review handoff item",
+            )
+        return _blocked(ticket, stage, "work_item_not_found", "BLOCKED: work item not found for loop pack selection")
 
-    if args.stage == "review" and not args.work_item and active_work_item:
+    if stage == "review" and not work_item and active_work_item:
         active_scope = runtime.sanitize_scope_key(active_work_item)
         if selected_item.scope_key != active_scope:
-            message = "BLOCKED: review work item mismatch with active_work_item"
-            reason = "review_work_item_mismatch"
-            if args.format:
-                payload = {
-                    "schema": "aidd.loop_pack.v1",
-                    "status": "blocked",
-                    "ticket": ticket,
-                    "stage": args.stage,
-                    "reason": reason,
-                }
-                output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
-                print(output)
-            else:
-                print(message)
-            return 2
+            return _blocked(
+                ticket,
+                stage,
+                "review_work_item_mismatch",
+                "BLOCKED: review work item mismatch with active_work_item",
+            )
 
     write_active_state(target, ticket=ticket, work_item=selected_item.work_item_key)
 
     output_dir = target / "reports" / "loops" / ticket
 
     prewarm_items: List[WorkItem] = []
-    if args.stage == "implement":
+    if stage == "implement" and prewarm:
         next3_refs = parse_next3_refs(sections.get("AIDD:NEXT_3", []))
         if next3_refs:
             for ref in next3_refs:
@@ -1063,11 +1042,11 @@ def main(argv: list[str] | None = None) -> int:
 
     rel_path = runtime.rel_path(selected_pack_path, target)
 
-    payload = {
+    payload: Dict[str, object] = {
         "schema": "aidd.loop_pack.v1",
         "updated_at": updated_at,
         "ticket": ticket,
-        "stage": args.stage,
+        "stage": stage,
         "work_item_id": selected_item.item_id,
         "work_item_key": selected_item.work_item_key,
         "scope_key": selected_item.scope_key,
@@ -1080,15 +1059,34 @@ def main(argv: list[str] | None = None) -> int:
     }
     if selected_reason_code:
         payload["reason_code"] = selected_reason_code
+    return LoopPackResult(
+        exit_code=0,
+        payload=payload,
+        message=f"[loop-pack] saved {rel_path} ({selected_item.work_item_key})",
+    )
+
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    _, target = runtime.require_workflow_root()
+    result = generate_loop_pack(
+        target,
+        ticket=args.ticket,
+        slug_hint=args.slug_hint,
+        stage=args.stage,
+        work_item=args.work_item,
+        pick_next=args.pick_next,
+    )
     if args.format:
+        payload = result.payload
         output = json.dumps(payload, ensure_ascii=False, indent=2) if args.format == "json" else "\n".join(dump_yaml(payload))
         print(output)
-        print(f"[loop-pack] saved {rel_path} ({selected_item.work_item_key})", file=sys.stderr)
-        return 0
+        if result.exit_code == 0:
+            print(result.message, file=sys.stderr)
+        return result.exit_code
 
-    print(f"[loop-pack] saved {rel_path} ({selected_item.work_item_key})")
-    return 0
+    print(result.message)
+    return result.exit_code
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -4,18 +4,21 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import signal
 import subprocess
 import shlex
+import threading
 import time
+import traceback
 import sys
 import datetime as dt
 import re
-from contextlib import suppress
+from contextlib import contextmanager, nullcontext, redirect_stderr, redirect_stdout, suppress
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from aidd_runtime import runtime
 from aidd_runtime import stage_result_contract
@@ -31,6 +34,7 @@ from aidd_runtime.loop_pack import (
     select_first_open,
 )
 from aidd_runtime.io_utils import dump_yaml, utc_timestamp
+from aidd_runtime.reports import loop_telemetry
 
 DONE_CODE = 0
 CONTINUE_CODE = 10
@@ -99,7 +103,14 @@ _SCOPE_STALE_HINT_RE = re.compile(
     re.IGNORECASE,
 )
 DEFAULT_LOOP_STEP_TIMEOUT_SECONDS = 3600
+STEP_MODE_IN_PROCESS = "in-process"
+STEP_MODE_SUBPROCESS = "subprocess"
+STEP_MODE_VALUES = {STEP_MODE_IN_PROCESS, STEP_MODE_SUBPROCESS}
 DEFAULT_SILENT_STALL_SECONDS = 1200
+STEP_LIVENESS_POLL_SECONDS = 1.0
+STEP_TERMINATE_GRACE_SECONDS = 5.0
+WATCHDOG_FIRED_TIMEOUT = "timeout"
+WATCHDOG_FIRED_SILENT_STALL = "silent_stall"
 DEFAULT_STAGE_BUDGET_SECONDS = 3600
 DEFAULT_RECOVERABLE_BLOCK_RETRIES = 2
 DEFAULT_LOOP_RESEARCH_GATE_MODE = "auto"
@@ -189,7 +200,7 @@ def select_next_work_item(target: Path, ticket: str, current_work_item: str) ->
     tasklist_path = target / "docs" / "tasklist" / f"{ticket}.md"
     if not tasklist_path.exists():
         return "", 0
-    lines = tasklist_path.read_text(encoding="utf-8").splitlines()
+    lines = tasklist_parser.read_lines(tasklist_path)
     sections = parse_sections(lines)
     iterations = parse_iteration_items(sections.get("AIDD:ITERATIONS_FULL", []))
     open_items = [
@@ -212,7 +223,7 @@ def _has_executable_test_entries(target: Path, ticket: str) -> bool:
     if not tasklist_path.exists():
         return False
     try:
-        lines = tasklist_path.read_text(encoding="utf-8").splitlines()
+        lines = tasklist_parser.read_lines(tasklist_path)
     except OSError:
         return False
     section_lines = tasklist_parser.extract_section(lines, "AIDD:TEST_EXECUTION")
@@ -775,6 +786,252 @@ def _latest_loop_step_stream_artifact(
     return newest[1] if newest else None
 
 
+def _resolve_step_mode(raw: str | None) -> str:
+    value = str(raw or os.environ.get("AIDD_LOOP_STEP_MODE") or "").strip().lower()
+    if value in STEP_MODE_VALUES:
+        return value
+    return STEP_MODE_SUBPROCESS
+
+
+def _effective_step_mode(step_mode: str, *, timeout_seconds: int, silent_stall_seconds: int) -> str:
+    """In-process steps cannot be interrupted, so any step deadline forces the subprocess boundary."""
+    if step_mode == STEP_MODE_IN_PROCESS and (timeout_seconds > 0 or silent_stall_seconds > 0):
+        return STEP_MODE_SUBPROCESS
+    return step_mode
+
+
+def _loop_step_argv(
+    ticket: str,
+    runner: str | None,
+    blocked_policy: str | None,
+    *,
+    from_qa: str | None,
+    work_item_key: str | None,
+    select_qa_handoff: bool,
+    stream_mode: str | None,
+) -> List[str]:
+    argv = ["--ticket", ticket, "--format", "json"]
+    if runner:
+        argv.extend(["--runner", runner])
+    if blocked_policy:
+        argv.extend(["--blocked-policy", blocked_policy])
+    if from_qa:
+        argv.extend(["--from-qa", from_qa])
+    if work_item_key:
+        argv.extend(["--work-item-key", work_item_key])
+    if select_qa_handoff:
+        argv.append("--select-qa-handoff")
+    if stream_mode:
+        argv.extend(["--stream", stream_mode])
+    return argv
+
+
+def _loop_step_env_overrides(plugin_root: Path, blocked_policy: str | None) -> Dict[str, str]:
+    current_pythonpath = os.environ.get("PYTHONPATH")
+    overrides = {
+        "CLAUDE_PLUGIN_ROOT": str(plugin_root),
+        "PYTHONPATH": str(plugin_root) if not current_pythonpath else f"{plugin_root}:{current_pythonpath}",
+    }
+    if blocked_policy:
+        overrides["AIDD_LOOP_BLOCKED_POLICY"] = str(blocked_policy)
+    return overrides
+
+
+@contextmanager
+def _scoped_process_state(cwd: Path, env_overrides: Dict[str, str]) -> Iterator[None]:
+    previous_cwd = os.getcwd()
+    previous_env = {key: os.environ.get(key) for key in env_overrides}
+    os.environ.update(env_overrides)
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for key, value in previous_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _runner_state_path(target: Path, ticket: str) -> Path:
+    return target / ".cache" / "loop-run" / f"{ticket}.runner"
+
+
+def _step_output_signature(target: Path, ticket: str) -> Dict[str, Tuple[int, int]]:
+    """Size/mtime of loop-step/runner logs (cli.*, excluding loop-run's own log) used as the liveness signal."""
+    signature: Dict[str, Tuple[int, int]] = {}
+    try:
+        entries = list(os.scandir(target / "reports" / "loops" / ticket))
+    except OSError:
+        return signature
+    for entry in entries:
+        name = entry.name
+        if not name.startswith("cli.") or name.startswith("cli.loop-run."):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            stat_result = entry.stat()
+        except OSError:
+            continue
+        signature[name] = (int(stat_result.st_size), int(stat_result.st_mtime_ns))
+    return signature
+
+
+class _StepWatchdog:
+    """Enforce the hard step deadline and the silent-stall (no output growth) deadline for one loop-step.
+
+    The silent-stall clock only runs while loop-step reports its external runner as running:
+    preflight, stage-chain commands and postflight write their logs when they finish, so they
+    are bounded by the hard deadline alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        target: Path,
+        ticket: str,
+        timeout_seconds: int,
+        silent_stall_seconds: int,
+        on_fire: Callable[[str], None],
+        poll_seconds: float = STEP_LIVENESS_POLL_SECONDS,
+    ) -> None:
+        self._target = target
+        self._ticket = ticket
+        self._timeout_seconds = max(int(timeout_seconds or 0), 0)
+        self._silent_stall_seconds = max(int(silent_stall_seconds or 0), 0)
+        self._on_fire = on_fire
+        self._poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+        self._runner_state = _runner_state_path(target, ticket)
+        self._thread = threading.Thread(target=self._watch, name="loop-step-watchdog", daemon=True)
+        self.fired = ""
+
+    def __enter__(self) -> "_StepWatchdog":
+        with suppress(OSError):
+            # A step killed mid-run leaves "running" behind.
+            self._runner_state.unlink()
+        if self._timeout_seconds or self._silent_stall_seconds:
+            self._thread.start()
+        return self
+
+    def _runner_running(self) -> bool:
+        from aidd_runtime import loop_step_stage_chain
+
+        try:
+            state = self._runner_state.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        return state == loop_step_stage_chain.RUNNER_STATE_RUNNING
+
+    def __exit__(self, *_exc: object) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _watch(self) -> None:
+        started = time.monotonic()
+        hard_deadline = started + self._timeout_seconds if self._timeout_seconds else None
+        signature = _step_output_signature(self._target, self._ticket) if self._silent_stall_seconds else {}
+        last_output_at = started
+        while not self._stopped.wait(self._poll_seconds):
+            now = time.monotonic()
+            if self._silent_stall_seconds:
+                current = _step_output_signature(self._target, self._ticket)
+                if current != signature or not self._runner_running():
+                    signature = current
+                    last_output_at = now
+                elif now - last_output_at >= self._silent_stall_seconds:
+                    self._fire(WATCHDOG_FIRED_SILENT_STALL)
+                    return
+            if hard_deadline is not None and now >= hard_deadline:
+                self._fire(WATCHDOG_FIRED_TIMEOUT)
+                return
+
+    def _fire(self, reason: str) -> None:
+        self.fired = reason
+        self._on_fire(reason)
+
+
+def _terminate_step_process(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    with suppress(OSError):
+        proc.terminate()
+    deadline = time.monotonic() + STEP_TERMINATE_GRACE_SECONDS
+    while proc.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    if proc.poll() is None:
+        with suppress(OSError):
+            proc.kill()
+
+
+def _run_loop_step_subprocess(
+    cmd: List[str],
+    *,
+    target: Path,
+    ticket: str,
+    workspace_root: Path,
+    env: Dict[str, str],
+    stream_mode: str | None,
+    timeout_seconds: int,
+    silent_stall_seconds: int,
+) -> tuple[subprocess.CompletedProcess[str], str]:
+    proc = subprocess.Popen(
+        cmd,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=None if stream_mode else subprocess.PIPE,
+        cwd=workspace_root,
+        env=env,
+    )
+    watchdog = _StepWatchdog(
+        target=target,
+        ticket=ticket,
+        timeout_seconds=timeout_seconds,
+        silent_stall_seconds=silent_stall_seconds,
+        on_fire=lambda _reason: _terminate_step_process(proc),
+    )
+    with watchdog:
+        stdout, stderr = proc.communicate()
+    completed = subprocess.CompletedProcess(args=cmd, returncode=proc.returncode, stdout=stdout, stderr=stderr)
+    return completed, watchdog.fired
+
+
+def _run_loop_step_in_process(
+    argv: List[str],
+    *,
+    workspace_root: Path,
+    env_overrides: Dict[str, str],
+    stream_mode: str | None,
+) -> subprocess.CompletedProcess[str]:
+    """Run loop-step.main in this interpreter; only used when no step deadline is set."""
+    from aidd_runtime import loop_step as loop_step_module
+
+    stdout_buffer = io.StringIO()
+    stderr_buffer = None if stream_mode else io.StringIO()
+    returncode = ERROR_CODE
+    with _scoped_process_state(workspace_root, env_overrides):
+        with redirect_stdout(stdout_buffer), (
+            redirect_stderr(stderr_buffer) if stderr_buffer is not None else nullcontext()
+        ):
+            try:
+                returncode = loop_step_module.main(argv)
+            except SystemExit as exc:
+                code = exc.code
+                returncode = code if isinstance(code, int) else (0 if code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    return subprocess.CompletedProcess(
+        args=["loop_step", *argv],
+        returncode=int(returncode or 0),
+        stdout=stdout_buffer.getvalue(),
+        stderr=stderr_buffer.getvalue() if stderr_buffer is not None else None,
+    )
+
+
 def run_loop_step(
     plugin_root: Path,
     workspace_root: Path,
@@ -792,168 +1049,230 @@ def run_loop_step(
     stage_budget_remaining_seconds: int = 0,
     budget_exhausted_on_timeout: bool = False,
     silent_stall_seconds: int = 0,
+    step_mode: str = STEP_MODE_SUBPROCESS,
+    telemetry_env: Dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    cmd = [
-        sys.executable,
-        str(plugin_root / "skills" / "aidd-loop" / "runtime" / "loop_step.py"),
-        "--ticket",
+    argv = _loop_step_argv(
         ticket,
-        "--format",
-        "json",
-    ]
-    if runner:
-        cmd.extend(["--runner", runner])
-    if blocked_policy:
-        cmd.extend(["--blocked-policy", blocked_policy])
-    if from_qa:
-        cmd.extend(["--from-qa", from_qa])
-    if work_item_key:
-        cmd.extend(["--work-item-key", work_item_key])
-    if select_qa_handoff:
-        cmd.append("--select-qa-handoff")
-    if stream_mode:
-        cmd.extend(["--stream", stream_mode])
-    env = os.environ.copy()
-    env["CLAUDE_PLUGIN_ROOT"] = str(plugin_root)
-    if blocked_policy:
-        env["AIDD_LOOP_BLOCKED_POLICY"] = str(blocked_policy)
-    env["PYTHONPATH"] = str(plugin_root) if not env.get("PYTHONPATH") else f"{plugin_root}:{env['PYTHONPATH']}"
+        runner,
+        blocked_policy,
+        from_qa=from_qa,
+        work_item_key=work_item_key,
+        select_qa_handoff=select_qa_handoff,
+        stream_mode=stream_mode,
+    )
+    from aidd_runtime import loop_step_stage_chain
+
+    env_overrides = _loop_step_env_overrides(plugin_root, blocked_policy)
+    env_overrides.update(telemetry_env or {})
+    env_overrides[loop_step_stage_chain.ENV_RUNNER_STATE] = str(_runner_state_path(target, ticket))
+    cmd = [sys.executable, str(plugin_root / "skills" / "aidd-loop" / "runtime" / "loop_step.py"), *argv]
+    timeout_kwargs = {
+        "target": target,
+        "ticket": ticket,
+        "timeout_seconds": timeout_seconds,
+        "stage_budget_seconds": stage_budget_seconds,
+        "stage_budget_remaining_seconds": stage_budget_remaining_seconds,
+        "budget_exhausted_on_timeout": budget_exhausted_on_timeout,
+        "silent_stall_seconds": silent_stall_seconds,
+    }
     run_started_at = time.time()
+    step_mode = _effective_step_mode(
+        step_mode,
+        timeout_seconds=timeout_seconds,
+        silent_stall_seconds=silent_stall_seconds,
+    )
+    if step_mode == STEP_MODE_IN_PROCESS:
+        return _run_loop_step_in_process(
+            argv,
+            workspace_root=workspace_root,
+            env_overrides=env_overrides,
+            stream_mode=stream_mode,
+        )
+    env = os.environ.copy()
+    env.update(env_overrides)
+    loop_telemetry.note_subprocess()
+    completed, fired = _run_loop_step_subprocess(
+        cmd,
+        target=target,
+        ticket=ticket,
+        workspace_root=workspace_root,
+        env=env,
+        stream_mode=stream_mode,
+        timeout_seconds=timeout_seconds,
+        silent_stall_seconds=silent_stall_seconds,
+    )
+    if not fired:
+        return completed
+    if fired == WATCHDOG_FIRED_SILENT_STALL:
+        stderr = f"loop-step produced no output for {silent_stall_seconds}s"
+    else:
+        stderr = f"loop-step watchdog fired after {timeout_seconds}s"
+    return _watchdog_timeout_result(
+        cmd=cmd,
+        run_started_at=run_started_at,
+        stderr=stderr,
+        silent_stall_detected=fired == WATCHDOG_FIRED_SILENT_STALL,
+        **timeout_kwargs,
+    )
+
+
+def _backoff_sleep(seconds: float, *, telemetry_file: Path, run_id: str, iteration: int) -> None:
+    with loop_telemetry.phase("sleep", path=telemetry_file, run_id=run_id, iteration=iteration) as record:
+        record["sleep_seconds"] = seconds
+        time.sleep(seconds)
+
+
+def _iteration_telemetry_fields(result: subprocess.CompletedProcess[str], step_mode: str) -> Dict[str, object]:
     try:
-        if stream_mode:
-            return subprocess.run(
-                cmd,
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=None,
-                cwd=workspace_root,
-                env=env,
-                timeout=timeout_seconds if timeout_seconds > 0 else None,
+        step_payload = json.loads(result.stdout or "")
+    except (TypeError, json.JSONDecodeError):
+        step_payload = {}
+    if not isinstance(step_payload, dict):
+        step_payload = {}
+    return {
+        "exit_code": result.returncode,
+        "status": str(step_payload.get("status") or "").strip().lower() or None,
+        "reason_code": str(step_payload.get("reason_code") or "").strip().lower() or None,
+        "stage": str(step_payload.get("stage") or "").strip().lower() or None,
+        "step_mode": step_mode,
+    }
+
+
+def _watchdog_timeout_result(
+    *,
+    cmd: List[str],
+    target: Path,
+    ticket: str,
+    run_started_at: float,
+    timeout_seconds: int,
+    stage_budget_seconds: int,
+    stage_budget_remaining_seconds: int,
+    budget_exhausted_on_timeout: bool,
+    silent_stall_seconds: int,
+    stderr: str,
+    silent_stall_detected: bool = False,
+) -> subprocess.CompletedProcess[str]:
+    active_stage = str(runtime.read_active_stage(target) or "").strip().lower()
+    active_work_item = str(runtime.read_active_work_item(target) or "").strip()
+    if active_stage == "qa":
+        scope_key = runtime.resolve_scope_key("", ticket)
+    else:
+        scope_key = runtime.resolve_scope_key(active_work_item, ticket)
+    expected_stage_result_path = ""
+    if active_stage in {"implement", "review", "qa"} and scope_key:
+        expected_stage_result_path = f"aidd/reports/loops/{ticket}/{scope_key}/stage.{active_stage}.result.json"
+    last_stage_result_path, last_stage_result_updated_at = _latest_valid_stage_result_candidate(
+        target,
+        ticket,
+        active_stage,
+    )
+    diagnostics = {
+        "active_stage": active_stage or None,
+        "active_work_item": active_work_item or None,
+        "scope_key": scope_key or None,
+        "stall_timeout_seconds": timeout_seconds,
+        "last_valid_stage_result_path": last_stage_result_path or None,
+        "last_valid_stage_result_updated_at": last_stage_result_updated_at or None,
+        "expected_stage_result_path": expected_stage_result_path or None,
+    }
+    stream_log_path = _latest_loop_step_stream_artifact(
+        target,
+        ticket,
+        "log",
+        min_mtime=max(run_started_at - 1.0, 0.0),
+    )
+    stream_jsonl_path = _latest_loop_step_stream_artifact(
+        target,
+        ticket,
+        "jsonl",
+        min_mtime=max(run_started_at - 1.0, 0.0),
+    )
+    stream_log_rel = runtime.rel_path(stream_log_path, target) if stream_log_path else ""
+    stream_jsonl_rel = runtime.rel_path(stream_jsonl_path, target) if stream_jsonl_path else ""
+    stream_liveness = {
+        "main_log_bytes": 0,
+        "main_log_updated_at": "",
+        "step_stream_log_bytes": _safe_size(stream_log_path),
+        "step_stream_log_updated_at": _safe_updated_at(stream_log_path),
+        "step_stream_jsonl_bytes": _safe_size(stream_jsonl_path),
+        "step_stream_jsonl_updated_at": _safe_updated_at(stream_jsonl_path),
+        "observability_degraded": False,
+    }
+    stream_active = bool(
+        stream_liveness["step_stream_jsonl_bytes"] > 0 or stream_liveness["step_stream_log_bytes"] > 0
+    )
+    budget_exhausted = bool(budget_exhausted_on_timeout) and not silent_stall_detected
+    if silent_stall_detected:
+        stream_liveness["active_source"] = "stream" if stream_active else "none"
+        reason_code = "seed_stage_silent_stall"
+        reason = f"loop-step produced no output for {silent_stall_seconds}s; terminated before the stage budget"
+    elif stream_active:
+        stream_liveness["active_source"] = "stream"
+        if budget_exhausted:
+            reason_code = "seed_stage_budget_exhausted"
+            reason = (
+                f"loop-step reached stage budget after {timeout_seconds}s while stream artifacts remained active"
             )
-        return subprocess.run(
-            cmd,
-            text=True,
-            capture_output=True,
-            cwd=workspace_root,
-            env=env,
-            timeout=timeout_seconds if timeout_seconds > 0 else None,
-        )
-    except subprocess.TimeoutExpired as exc:
-        active_stage = str(runtime.read_active_stage(target) or "").strip().lower()
-        active_work_item = str(runtime.read_active_work_item(target) or "").strip()
-        if active_stage == "qa":
-            scope_key = runtime.resolve_scope_key("", ticket)
         else:
-            scope_key = runtime.resolve_scope_key(active_work_item, ticket)
-        expected_stage_result_path = ""
-        if active_stage in {"implement", "review", "qa"} and scope_key:
-            expected_stage_result_path = f"aidd/reports/loops/{ticket}/{scope_key}/stage.{active_stage}.result.json"
-        last_stage_result_path, last_stage_result_updated_at = _latest_valid_stage_result_candidate(
-            target,
-            ticket,
-            active_stage,
-        )
-        diagnostics = {
-            "active_stage": active_stage or None,
-            "active_work_item": active_work_item or None,
-            "scope_key": scope_key or None,
-            "stall_timeout_seconds": timeout_seconds,
-            "last_valid_stage_result_path": last_stage_result_path or None,
-            "last_valid_stage_result_updated_at": last_stage_result_updated_at or None,
-            "expected_stage_result_path": expected_stage_result_path or None,
-        }
-        stream_log_path = _latest_loop_step_stream_artifact(
-            target,
-            ticket,
-            "log",
-            min_mtime=max(run_started_at - 1.0, 0.0),
-        )
-        stream_jsonl_path = _latest_loop_step_stream_artifact(
-            target,
-            ticket,
-            "jsonl",
-            min_mtime=max(run_started_at - 1.0, 0.0),
-        )
-        stream_log_rel = runtime.rel_path(stream_log_path, target) if stream_log_path else ""
-        stream_jsonl_rel = runtime.rel_path(stream_jsonl_path, target) if stream_jsonl_path else ""
-        stream_liveness = {
-            "main_log_bytes": 0,
-            "main_log_updated_at": "",
-            "step_stream_log_bytes": _safe_size(stream_log_path),
-            "step_stream_log_updated_at": _safe_updated_at(stream_log_path),
-            "step_stream_jsonl_bytes": _safe_size(stream_jsonl_path),
-            "step_stream_jsonl_updated_at": _safe_updated_at(stream_jsonl_path),
-            "observability_degraded": False,
-        }
-        stream_active = bool(
-            stream_liveness["step_stream_jsonl_bytes"] > 0 or stream_liveness["step_stream_log_bytes"] > 0
-        )
-        budget_exhausted = bool(budget_exhausted_on_timeout)
-        if stream_active:
-            stream_liveness["active_source"] = "stream"
-            if budget_exhausted:
-                reason_code = "seed_stage_budget_exhausted"
-                reason = (
-                    f"loop-step reached stage budget after {timeout_seconds}s while stream artifacts remained active"
-                )
-            else:
-                reason_code = "seed_stage_active_stream_timeout"
-                reason = (
-                    f"loop-step watchdog timeout after {timeout_seconds}s while stream artifacts remain active"
-                )
+            reason_code = "seed_stage_active_stream_timeout"
+            reason = (
+                f"loop-step watchdog timeout after {timeout_seconds}s while stream artifacts remain active"
+            )
+    else:
+        stream_liveness["active_source"] = "none"
+        if budget_exhausted:
+            reason_code = "seed_stage_budget_exhausted"
+            reason = f"loop-step reached stage budget after {timeout_seconds}s without completion"
         else:
-            stream_liveness["active_source"] = "none"
-            if budget_exhausted:
-                reason_code = "seed_stage_budget_exhausted"
-                reason = f"loop-step reached stage budget after {timeout_seconds}s without completion"
-            else:
-                reason_code = "seed_stage_silent_stall"
-                reason = f"loop-step watchdog timeout after {timeout_seconds}s without completion"
-        diagnostics["stream_log_path"] = stream_log_rel or None
-        diagnostics["stream_jsonl_path"] = stream_jsonl_rel or None
-        diagnostics["stream_liveness"] = stream_liveness
-        diagnostics["budget_exhausted"] = budget_exhausted
-        diagnostics["stage_budget_seconds"] = stage_budget_seconds or None
-        diagnostics["stage_budget_remaining_seconds"] = stage_budget_remaining_seconds or None
-        diagnostics["silent_stall_seconds"] = silent_stall_seconds or None
-        watchdog_marker = True
-        termination_attribution = _build_termination_attribution(
-            exit_code=143,
-            classification=(
-                "watchdog_terminated"
-                if watchdog_marker and budget_exhausted
-                else "watchdog_no_convergence_yet"
-            ),
-            killed_flag=True,
-            watchdog_marker=watchdog_marker,
-        )
-        payload = {
-            "status": "blocked",
-            "stage": active_stage or None,
-            "scope_key": scope_key or None,
-            "work_item_key": active_work_item or None,
-            "reason_code": reason_code,
-            "reason": reason,
-            "stage_result_path": expected_stage_result_path or last_stage_result_path or "",
-            "stage_result_diagnostics": json.dumps(diagnostics, ensure_ascii=False),
-            "stall_timeout_seconds": timeout_seconds,
-            "silent_stall_seconds": silent_stall_seconds or timeout_seconds,
-            "stage_budget_seconds": stage_budget_seconds or None,
-            "stage_budget_remaining_seconds": stage_budget_remaining_seconds or None,
-            "budget_exhausted": budget_exhausted,
-            "killed_flag": 1,
-            "watchdog_marker": 1,
-            "termination_attribution": termination_attribution,
-            "stream_log_path": stream_log_rel,
-            "stream_jsonl_path": stream_jsonl_rel,
-            "stream_liveness": stream_liveness,
-        }
-        return subprocess.CompletedProcess(
-            args=cmd,
-            returncode=BLOCKED_CODE,
-            stdout=json.dumps(payload, ensure_ascii=False),
-            stderr=str(exc),
-        )
+            reason_code = "seed_stage_silent_stall"
+            reason = f"loop-step watchdog timeout after {timeout_seconds}s without completion"
+    diagnostics["stream_log_path"] = stream_log_rel or None
+    diagnostics["stream_jsonl_path"] = stream_jsonl_rel or None
+    diagnostics["stream_liveness"] = stream_liveness
+    diagnostics["budget_exhausted"] = budget_exhausted
+    diagnostics["stage_budget_seconds"] = stage_budget_seconds or None
+    diagnostics["stage_budget_remaining_seconds"] = stage_budget_remaining_seconds or None
+    diagnostics["silent_stall_seconds"] = silent_stall_seconds or None
+    diagnostics["silent_stall_detected"] = silent_stall_detected
+    watchdog_marker = True
+    termination_attribution = _build_termination_attribution(
+        exit_code=143,
+        classification=(
+            "watchdog_terminated"
+            if watchdog_marker and budget_exhausted
+            else "watchdog_no_convergence_yet"
+        ),
+        killed_flag=True,
+        watchdog_marker=watchdog_marker,
+    )
+    payload = {
+        "status": "blocked",
+        "stage": active_stage or None,
+        "scope_key": scope_key or None,
+        "work_item_key": active_work_item or None,
+        "reason_code": reason_code,
+        "reason": reason,
+        "stage_result_path": expected_stage_result_path or last_stage_result_path or "",
+        "stage_result_diagnostics": json.dumps(diagnostics, ensure_ascii=False),
+        "stall_timeout_seconds": timeout_seconds,
+        "silent_stall_seconds": silent_stall_seconds or timeout_seconds,
+        "stage_budget_seconds": stage_budget_seconds or None,
+        "stage_budget_remaining_seconds": stage_budget_remaining_seconds or None,
+        "budget_exhausted": budget_exhausted,
+        "killed_flag": 1,
+        "watchdog_marker": 1,
+        "termination_attribution": termination_attribution,
+        "stream_log_path": stream_log_rel,
+        "stream_jsonl_path": stream_jsonl_rel,
+        "stream_liveness": stream_liveness,
+    }
+    return subprocess.CompletedProcess(
+        args=cmd,
+        returncode=BLOCKED_CODE,
+        stdout=json.dumps(payload, ensure_ascii=False),
+        stderr=stderr,
+    )
 
 
 def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
@@ -1006,7 +1325,7 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--silent-stall-seconds",
         type=int,
-        help="Silent stall watchdog window (seconds) when stream liveness is unavailable (default from env or 1200).",
+        help="Terminate loop-step after this many seconds without runner/stream log growth (default from env or 1200; 0 disables).",
     )
     parser.add_argument(
         "--stage-budget-seconds",
@@ -1016,6 +1335,15 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
             "(default: implement/review/qa=3600; override via env or this flag)."
         ),
     )
+    parser.add_argument(
+        "--step-mode",
+        choices=sorted(STEP_MODE_VALUES),
+        help=(
+            "How loop-step is executed: subprocess (default; killable at the step deadline) or in-process "
+            "(reuses the interpreter and its caches; only when --step-timeout-seconds and "
+            "--silent-stall-seconds are both 0, otherwise subprocess is used). Env: AIDD_LOOP_STEP_MODE."
+        ),
+    )
     parser.add_argument(
         "--blocked-policy",
         choices=("strict", "ralph"),
@@ -1133,10 +1461,16 @@ def main(argv: List[str] | None = None) -> int:
     sleep_seconds = max(0.0, float(args.sleep_seconds))
     stamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%S")
     cli_log_path = target / "reports" / "loops" / ticket / f"cli.loop-run.{stamp}.log"
+    telemetry_file = loop_telemetry.telemetry_path(target, ticket)
     runner_label = resolve_runner_label(args.runner_label)
     stream_mode = resolve_stream_mode(getattr(args, "stream", None))
     step_timeout_seconds = _resolve_step_timeout_seconds(getattr(args, "step_timeout_seconds", None))
     silent_stall_seconds = _resolve_silent_stall_seconds(getattr(args, "silent_stall_seconds", None))
+    step_mode = _effective_step_mode(
+        _resolve_step_mode(getattr(args, "step_mode", None)),
+        timeout_seconds=step_timeout_seconds,
+        silent_stall_seconds=silent_stall_seconds,
+    )
     blocked_policy = loop_block_policy.resolve_blocked_policy(
         getattr(args, "blocked_policy", None),
         target=target,
@@ -1171,7 +1505,7 @@ def main(argv: List[str] | None = None) -> int:
             f"{utc_timestamp()} event=start ticket={ticket} max_iterations={max_iterations} runner={runner_label} "
             f"blocked_policy={blocked_policy} recoverable_retry_budget={recoverable_retry_budget} "
             f"research_gate={research_gate_mode} step_timeout_seconds={step_timeout_seconds} "
-            f"silent_stall_seconds={silent_stall_seconds}"
+            f"silent_stall_seconds={silent_stall_seconds} step_mode={step_mode}"
         ),
     )
 
@@ -1537,10 +1871,8 @@ def main(argv: List[str] | None = None) -> int:
             _emit_payload(payload)
             return BLOCKED_CODE
 
-        if stream_mode:
-            watchdog_timeout_seconds = max(step_timeout_seconds, 1)
-        else:
-            watchdog_timeout_seconds = max(silent_stall_seconds or step_timeout_seconds, 1)
+        # silent_stall_seconds is enforced separately by the step watchdog as a no-output deadline.
+        watchdog_timeout_seconds = max(step_timeout_seconds, 1)
 
         if stage_budget_seconds > 0:
             budget_timeout_seconds = max(stage_budget_remaining_seconds, 1)
@@ -1551,23 +1883,33 @@ def main(argv: List[str] | None = None) -> int:
             budget_exhausted_on_timeout = False
 
         iteration_started_at = time.time()
-        result = run_loop_step(
-            plugin_root,
-            workspace_root,
-            target,
-            ticket,
-            args.runner,
-            blocked_policy,
-            from_qa=args.from_qa,
-            work_item_key=args.work_item_key,
-            select_qa_handoff=args.select_qa_handoff,
-            stream_mode=stream_mode,
-            timeout_seconds=timeout_seconds,
-            stage_budget_seconds=stage_budget_seconds,
-            stage_budget_remaining_seconds=stage_budget_remaining_seconds,
-            budget_exhausted_on_timeout=budget_exhausted_on_timeout,
-            silent_stall_seconds=silent_stall_seconds,
-        )
+        with loop_telemetry.phase(
+            "loop_step",
+            kind=loop_telemetry.KIND_ITERATION,
+            path=telemetry_file,
+            run_id=stamp,
+            iteration=iteration,
+        ) as iteration_record:
+            result = run_loop_step(
+                plugin_root,
+                workspace_root,
+                target,
+                ticket,
+                args.runner,
+                blocked_policy,
+                from_qa=args.from_qa,
+                work_item_key=args.work_item_key,
+                select_qa_handoff=args.select_qa_handoff,
+                stream_mode=stream_mode,
+                timeout_seconds=timeout_seconds,
+                stage_budget_seconds=stage_budget_seconds,
+                stage_budget_remaining_seconds=stage_budget_remaining_seconds,
+                budget_exhausted_on_timeout=budget_exhausted_on_timeout,
+                silent_stall_seconds=silent_stall_seconds,
+                step_mode=step_mode,
+                telemetry_env=loop_telemetry.telemetry_env(telemetry_file, run_id=stamp, iteration=iteration),
+            )
+            iteration_record.update(_iteration_telemetry_fields(result, step_mode))
         if result.returncode not in {DONE_CODE, CONTINUE_CODE, BLOCKED_CODE}:
             unexpected_payload: Dict[str, object] = {}
             parse_error = ""
@@ -2313,7 +2655,7 @@ def main(argv: List[str] | None = None) -> int:
                     ),
                 )
                 if sleep_seconds:
-                    time.sleep(sleep_seconds)
+                    _backoff_sleep(sleep_seconds, telemetry_file=telemetry_file, run_id=stamp, iteration=iteration)
                 continue
             if warn_continue_blocked:
                 step_payload = dict(step_payload)
@@ -2341,7 +2683,7 @@ def main(argv: List[str] | None = None) -> int:
                     ),
                 )
                 if sleep_seconds:
-                    time.sleep(sleep_seconds)
+                    _backoff_sleep(sleep_seconds, telemetry_file=telemetry_file, run_id=stamp, iteration=iteration)
                 continue
             scope_drift_probe_allowed = True
             if log_reason_code == "scope_drift_recoverable":
@@ -2390,7 +2732,7 @@ def main(argv: List[str] | None = None) -> int:
                     ),
                 )
                 if sleep_seconds:
-                    time.sleep(sleep_seconds)
+                    _backoff_sleep(sleep_seconds, telemetry_file=telemetry_file, run_id=stamp, iteration=iteration)
                 continue
             if log_reason_code == "scope_drift_recoverable" and not scope_drift_probe_allowed:
                 append_log(
@@ -2476,7 +2818,7 @@ def main(argv: List[str] | None = None) -> int:
             _emit_payload(payload)
             return BLOCKED_CODE
         if sleep_seconds:
-            time.sleep(sleep_seconds)
+            _backoff_sleep(sleep_seconds, telemetry_file=telemetry_file, run_id=stamp, iteration=iteration)
 
     payload = {
         "status": "max-iterations",
@@ -11,7 +11,7 @@ import re
 import shlex
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, TextIO
+from typing import Callable, Dict, List, Tuple, Optional, TextIO
 
 
 
@@ -38,8 +38,10 @@ _ensure_plugin_root_on_path()
 from aidd_runtime import marker_semantics
 from aidd_runtime import runtime
 from aidd_runtime import stage_result_contract
+from aidd_runtime import tasklist_parser
 from aidd_runtime.feature_ids import write_active_state
 from aidd_runtime.io_utils import dump_yaml, utc_timestamp
+from aidd_runtime.reports import loop_telemetry
 
 DONE_CODE = 0
 CONTINUE_CODE = 10
@@ -442,14 +444,17 @@ def load_stage_result(
 ) -> Tuple[Dict[str, object] | None, Path, str, str, str, str]:
     from aidd_runtime import loop_step_stage_result as _stage_result
 
-    return _stage_result.load_stage_result(
-        root,
-        ticket,
-        scope_key,
-        stage,
-        started_at=started_at,
-        finished_at=finished_at,
-    )
+    with loop_telemetry.phase("stage_result_load") as record:
+        loaded = _stage_result.load_stage_result(
+            root,
+            ticket,
+            scope_key,
+            stage,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+        record.update(stage=stage, status="ok" if loaded[0] is not None else "missing")
+    return loaded
 
 
 def normalize_stage_result(result: str, reason_code: str) -> str:
@@ -628,12 +633,15 @@ def validate_review_pack(
 ) -> Tuple[bool, str, str]:
     from aidd_runtime import loop_step_stage_result as _stage_result
 
-    return _stage_result.validate_review_pack(
-        root,
-        ticket=ticket,
-        slug_hint=slug_hint,
-        scope_key=scope_key,
-    )
+    with loop_telemetry.phase("review_pack") as record:
+        ok, message, reason_code = _stage_result.validate_review_pack(
+            root,
+            ticket=ticket,
+            slug_hint=slug_hint,
+            scope_key=scope_key,
+        )
+        record.update(status="ok" if ok else "invalid", reason_code=reason_code)
+    return ok, message, reason_code
 
 
 def resolve_runner(args_runner: str | None, plugin_root: Path) -> Tuple[List[str], str, str]:
@@ -749,18 +757,23 @@ def run_stage_chain(
 ) -> Tuple[bool, Dict[str, str], str]:
     from aidd_runtime import loop_step_stage_chain as _stage_chain
 
-    return _stage_chain.run_stage_chain(
-        plugin_root=plugin_root,
-        workspace_root=workspace_root,
-        stage=stage,
-        kind=kind,
-        ticket=ticket,
-        scope_key=scope_key,
-        work_item_key=work_item_key,
-        actions_path=actions_path,
-        result=result,
-        verdict=verdict,
-    )
+    with loop_telemetry.phase(f"stage_chain_{kind}") as record:
+        ok, details, message = _stage_chain.run_stage_chain(
+            plugin_root=plugin_root,
+            workspace_root=workspace_root,
+            stage=stage,
+            kind=kind,
+            ticket=ticket,
+            scope_key=scope_key,
+            work_item_key=work_item_key,
+            actions_path=actions_path,
+            result=result,
+            verdict=verdict,
+        )
+        record.update(stage=stage, status="ok" if ok else "failed")
+        if not ok:
+            record["reason_code"] = _extract_stage_chain_reason_code(message, f"{kind}_failed")
+    return ok, details, message
 
 
 def _canonical_actions_log_rel(ticket: str, scope_key: str, stage: str) -> str:
@@ -827,7 +840,10 @@ def run_command(
 ) -> int:
     from aidd_runtime import loop_step_stage_chain as _stage_chain
 
-    return _stage_chain.run_command(command, cwd, log_path, env=env)
+    with loop_telemetry.phase("runner") as record:
+        returncode = _stage_chain.run_command(command, cwd, log_path, env=env)
+        record.update(exit_code=returncode, bytes_streamed=loop_telemetry.file_size(log_path))
+    return returncode
 
 
 def run_stream_command(
@@ -841,20 +857,29 @@ def run_stream_command(
     output_stream: TextIO,
     header_lines: Optional[List[str]] = None,
     env: Optional[Dict[str, str]] = None,
+    line_sink: Optional[Callable[[str], None]] = None,
 ) -> int:
     from aidd_runtime import loop_step_stage_chain as _stage_chain
 
-    return _stage_chain.run_stream_command(
-        command=command,
-        cwd=cwd,
-        log_path=log_path,
-        stream_mode=stream_mode,
-        stream_jsonl_path=stream_jsonl_path,
-        stream_log_path=stream_log_path,
-        output_stream=output_stream,
-        header_lines=header_lines,
-        env=env,
-    )
+    with loop_telemetry.phase("runner") as record:
+        returncode = _stage_chain.run_stream_command(
+            command=command,
+            cwd=cwd,
+            log_path=log_path,
+            stream_mode=stream_mode,
+            stream_jsonl_path=stream_jsonl_path,
+            stream_log_path=stream_log_path,
+            output_stream=output_stream,
+            header_lines=header_lines,
+            env=env,
+            line_sink=line_sink,
+        )
+        record.update(
+            exit_code=returncode,
+            stream_mode=stream_mode,
+            bytes_streamed=loop_telemetry.file_size(log_path),
+        )
+    return returncode
 
 
 def append_cli_log(log_path: Path, payload: Dict[str, object]) -> None:
@@ -1382,7 +1407,7 @@ def main(argv: list[str] | None = None) -> int:
                                 stage_requested_result=stage_requested_result,
                                 cli_log_path=cli_log_path,
                             )
-                        tasklist_lines = tasklist_path.read_text(encoding="utf-8").splitlines()
+                        tasklist_lines = tasklist_parser.read_lines(tasklist_path)
 
                     work_item_key, select_code, select_reason, labels = _select_qa_repair_work_item(
                         tasklist_lines=tasklist_lines,
@@ -1642,6 +1667,8 @@ def main(argv: list[str] | None = None) -> int:
     question_answers_compact = ""
     question_questions_path = ""
     question_answers_path = ""
+    # Streamed runs feed their raw log into an output-contract scanner as it is written.
+    contract_scanners: Dict[Path, object] = {}
 
     def _execute_stage_command(
         compact_answers: str,
@@ -1679,6 +1706,10 @@ def main(argv: list[str] | None = None) -> int:
             ]
             if retry_attempt:
                 header_lines.append(f"==> question-retry attempt={retry_attempt}")
+            from aidd_runtime import output_contract as _output_contract
+
+            scanner = _output_contract.ContractScanner()
+            contract_scanners[current_log_path] = scanner
             returncode = run_stream_command(
                 command=command,
                 cwd=workspace_root,
@@ -1689,6 +1720,7 @@ def main(argv: list[str] | None = None) -> int:
                 output_stream=sys.stderr,
                 header_lines=header_lines,
                 env=command_env,
+                line_sink=scanner.feed,
             )
         else:
             returncode = run_command(command, workspace_root, current_log_path, env=command_env)
@@ -1912,10 +1944,8 @@ def main(argv: list[str] | None = None) -> int:
             reason_code=initial_reason_code,
             material=question_material,
         ):
-            from aidd_runtime import tasklist_parser as _tasklist_parser
-
             question_retry_attempt = 1
-            question_answers_compact = _tasklist_parser.build_compact_answers(question_material)
+            question_answers_compact = tasklist_parser.build_compact_answers(question_material)
             if not question_answers_compact:
                 blocker_reason = (
                     "stage requested compact AIDD:ANSWERS but question extraction failed; "
@@ -2264,9 +2294,13 @@ def main(argv: list[str] | None = None) -> int:
                 **question_retry_kwargs,
                 **stage_sync_kwargs,
             )
+    contract_scanner = contract_scanners.get(log_path)
     if next_stage in {"implement", "review", "qa"} and actions_log_rel:
+        actions_line = f"AIDD:ACTIONS_LOG: {actions_log_rel}"
         with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(f"\nAIDD:ACTIONS_LOG: {actions_log_rel}\n")
+            handle.write(f"\n{actions_line}\n")
+        if contract_scanner is not None:
+            contract_scanner.feed(actions_line)
     if next_stage == "review" and result in {"continue", "done"}:
         ok, message, code = validate_review_pack(
             target,
@@ -2309,32 +2343,35 @@ def main(argv: list[str] | None = None) -> int:
     output_contract_path = ""
     output_contract_status = ""
     output_contract_warnings: list[str] = []
-    try:
-        from aidd_runtime import output_contract as _output_contract
+    with loop_telemetry.phase("output_contract") as telemetry_record:
+        try:
+            from aidd_runtime import output_contract as _output_contract
 
-        report = _output_contract.check_output_contract(
-            target=target,
-            ticket=ticket,
-            stage=next_stage,
-            scope_key=next_scope_key,
-            work_item_key=next_work_item_key,
-            log_path=log_path,
-            stage_result_path=result_path,
-            max_read_items=3,
-        )
-        output_contract_status = str(report.get("status") or "")
-        output_contract_warnings = [
-            str(item).strip()
-            for item in (report.get("warnings") if isinstance(report.get("warnings"), list) else [])
-            if str(item).strip()
-        ]
-        output_dir = target / "reports" / "loops" / ticket / next_scope_key
-        output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / "output.contract.json"
-        report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        output_contract_path = runtime.rel_path(report_path, target)
-    except Exception as exc:
-        print(f"[loop-step] WARN: output contract check failed: {exc}", file=sys.stderr)
+            report = _output_contract.check_output_contract(
+                target=target,
+                ticket=ticket,
+                stage=next_stage,
+                scope_key=next_scope_key,
+                work_item_key=next_work_item_key,
+                log_path=log_path,
+                stage_result_path=result_path,
+                max_read_items=3,
+                scanner=contract_scanner,
+            )
+            output_contract_status = str(report.get("status") or "")
+            output_contract_warnings = [
+                str(item).strip()
+                for item in (report.get("warnings") if isinstance(report.get("warnings"), list) else [])
+                if str(item).strip()
+            ]
+            output_dir = target / "reports" / "loops" / ticket / next_scope_key
+            output_dir.mkdir(parents=True, exist_ok=True)
+            report_path = output_dir / "output.contract.json"
+            report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            output_contract_path = runtime.rel_path(report_path, target)
+        except Exception as exc:
+            print(f"[loop-step] WARN: output contract check failed: {exc}", file=sys.stderr)
+        telemetry_record.update(stage=next_stage, status=output_contract_status or "error")
     contract_policy, contract_reason_code = evaluate_output_contract_policy(
         output_contract_status,
         blocked_policy=blocked_policy,
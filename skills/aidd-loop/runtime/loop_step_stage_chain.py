@@ -10,17 +10,27 @@ import shlex
 import subprocess
 import sys
 import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from aidd_runtime import claude_stream_render
 from aidd_runtime import runtime
+from aidd_runtime.reports import loop_telemetry
 
 _APPROVAL_ALLOW_VALUES = {"1", "true", "yes", "on"}
 _CLAUDE_COMMANDS = {"claude", "claude.exe"}
 _DIFF_BOUNDARY_OUT_OF_SCOPE_RE = re.compile(r"^OUT_OF_SCOPE\s+(.+)$", re.MULTILINE)
 _DIFF_BOUNDARY_FORBIDDEN_RE = re.compile(r"^FORBIDDEN\s+(.+)$", re.MULTILINE)
 _DIFF_BOUNDARY_EPHEMERAL_PREFIXES = (".aidd_audit/",)
+# File loop-run's watchdog polls to learn whether the external runner is up.
+ENV_RUNNER_STATE = "AIDD_LOOP_RUNNER_STATE"
+RUNNER_STATE_RUNNING = "running"
+RUNNER_STATE_IDLE = "idle"
+
+# Process-wide state shared across loop-step invocations when loop-run keeps loop-step in-process.
+_RUNNER_HELP_CACHE: Dict[str, Optional[str]] = {}
 
 
 def _normalize_boundary_path(path: str) -> str:
@@ -38,7 +48,39 @@ def _is_ephemeral_boundary_path(path: str) -> bool:
     return any(normalized.startswith(prefix) for prefix in _DIFF_BOUNDARY_EPHEMERAL_PREFIXES)
 
 
-def runner_supports_flag(command: str, flag: str) -> bool:
+@contextmanager
+def _tracked_process(proc: subprocess.Popen) -> Iterator[subprocess.Popen]:
+    loop_telemetry.note_subprocess()
+    yield proc
+
+
+def _write_runner_state(state: str) -> None:
+    raw = os.environ.get(ENV_RUNNER_STATE, "").strip()
+    if not raw:
+        return
+    path = Path(raw)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(state, encoding="utf-8")
+    except OSError:
+        return
+
+
+@contextmanager
+def _runner_running() -> Iterator[None]:
+    """Publish the runner's lifetime; loop-run only runs its silent-stall clock inside it."""
+    _write_runner_state(RUNNER_STATE_RUNNING)
+    try:
+        yield
+    finally:
+        _write_runner_state(RUNNER_STATE_IDLE)
+
+
+def _runner_help_text(command: str) -> Optional[str]:
+    if command in _RUNNER_HELP_CACHE:
+        return _RUNNER_HELP_CACHE[command]
+    help_text: Optional[str] = None
+    loop_telemetry.note_subprocess()
     try:
         proc = subprocess.run(
             [command, "--help"],
@@ -48,10 +90,18 @@ def runner_supports_flag(command: str, flag: str) -> bool:
             check=False,
         )
     except OSError:
+        proc = None
+    if proc is not None and proc.returncode == 0:
+        help_text = proc.stdout or ""
+    _RUNNER_HELP_CACHE[command] = help_text
+    return help_text
+
+
+def runner_supports_flag(command: str, flag: str) -> bool:
+    help_text = _runner_help_text(command)
+    if help_text is None:
         return False
-    if proc.returncode != 0:
-        return False
-    return flag in (proc.stdout or "")
+    return flag in help_text
 
 
 def _strip_flag_with_value(tokens: List[str], flag: str) -> Tuple[List[str], bool]:
@@ -242,17 +292,18 @@ def _run_runtime_command(
     env: Dict[str, str],
     log_path: Path,
 ) -> Tuple[int, str, str]:
-    proc = subprocess.run(
+    proc = subprocess.Popen(
         command,
         cwd=cwd,
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        check=False,
         env=env,
     )
-    stdout = proc.stdout or ""
-    stderr = proc.stderr or ""
+    with _tracked_process(proc):
+        stdout, stderr = proc.communicate()
+    stdout = stdout or ""
+    stderr = stderr or ""
     _append_stage_chain_log(log_path, command, stdout, stderr)
     return proc.returncode, stdout, stderr
 
@@ -674,11 +725,18 @@ class MultiWriter:
             stream.flush()
 
 
-def _drain_stream(pipe: Optional[TextIO], writer: MultiWriter, raw_log: TextIO) -> None:
+def _drain_stream(
+    pipe: Optional[TextIO],
+    writer: MultiWriter,
+    raw_log: TextIO,
+    line_sink: Optional[Callable[[str], None]] = None,
+) -> None:
     if pipe is None:
         return
     for line in pipe:
         raw_log.write(line)
+        if line_sink is not None:
+            line_sink(line)
         writer.write(line)
         raw_log.flush()
         writer.flush()
@@ -687,7 +745,7 @@ def _drain_stream(pipe: Optional[TextIO], writer: MultiWriter, raw_log: TextIO)
 def run_command(command: List[str], cwd: Path, log_path: Path, env: Optional[Dict[str, str]] = None) -> int:
     log_path.parent.mkdir(parents=True, exist_ok=True)
     with log_path.open("w", encoding="utf-8") as handle:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             cwd=cwd,
             text=True,
@@ -695,7 +753,8 @@ def run_command(command: List[str], cwd: Path, log_path: Path, env: Optional[Dic
             stderr=subprocess.STDOUT,
             env=env,
         )
-    return result.returncode
+        with _tracked_process(proc), _runner_running():
+            return proc.wait()
 
 
 def run_stream_command(
@@ -709,6 +768,7 @@ def run_stream_command(
     output_stream: TextIO,
     header_lines: Optional[List[str]] = None,
     env: Optional[Dict[str, str]] = None,
+    line_sink: Optional[Callable[[str], None]] = None,
 ) -> int:
     log_path.parent.mkdir(parents=True, exist_ok=True)
     stream_jsonl_path.parent.mkdir(parents=True, exist_ok=True)
@@ -736,30 +796,39 @@ def run_stream_command(
             bufsize=1,
             env=env,
         )
-        drain_thread = threading.Thread(
-            target=_drain_stream,
-            args=(proc.stderr, writer, raw_log),
-            daemon=True,
-        )
-        drain_thread.start()
-        for line in proc.stdout or []:
-            raw_log.write(line)
-            stream_jsonl.write(line)
-            raw_log.flush()
-            stream_jsonl.flush()
-            if stream_mode == "raw":
-                writer.write(line)
-                writer.flush()
-                continue
-            claude_stream_render.render_line(
-                line,
-                writer=writer,
-                mode="text+tools" if stream_mode == "tools" else "text-only",
-                strict=False,
-                warn_stream=writer,
+        with _tracked_process(proc), _runner_running():
+            drain_thread = threading.Thread(
+                target=_drain_stream,
+                args=(proc.stderr, writer, raw_log, line_sink),
+                daemon=True,
+            )
+            drain_thread.start()
+            render_state = claude_stream_render.RenderState(
+                flush_interval=claude_stream_render.FLUSH_INTERVAL_SECONDS,
+                last_flush=time.monotonic(),
             )
-        if proc.stdout:
-            proc.stdout.close()
-        returncode = proc.wait()
-        drain_thread.join(timeout=1)
-        return returncode
+            for line in proc.stdout or []:
+                raw_log.write(line)
+                stream_jsonl.write(line)
+                if line_sink is not None:
+                    line_sink(line)
+                raw_log.flush()
+                stream_jsonl.flush()
+                if stream_mode == "raw":
+                    writer.write(line)
+                    writer.flush()
+                    continue
+                claude_stream_render.render_line(
+                    line,
+                    writer=writer,
+                    mode="text+tools" if stream_mode == "tools" else "text-only",
+                    strict=False,
+                    warn_stream=writer,
+                    state=render_state,
+                )
+            claude_stream_render.flush(writer, render_state)
+            if proc.stdout:
+                proc.stdout.close()
+            returncode = proc.wait()
+            drain_thread.join(timeout=1)
+            return returncode
@@ -15,6 +15,7 @@ from typing import Dict, List, Tuple
 from aidd_runtime import runtime
 from aidd_runtime import stage_result_contract
 from aidd_runtime.io_utils import parse_front_matter
+from aidd_runtime.reports import loop_telemetry
 from aidd_runtime import loop_step as core
 
 _ITERATION_SCOPE_ALIAS_RE = re.compile(r"^[IM]\d+$", re.IGNORECASE)
@@ -295,16 +296,18 @@ def _maybe_regen_review_pack(
     loop_pack_path = root / "reports" / "loops" / ticket / f"{scope_key}.loop.pack.md"
     if not loop_pack_path.exists():
         return False, "loop pack missing"
-    try:
-        from aidd_runtime import review_pack as review_pack_module
-
-        args = ["--ticket", ticket]
-        if slug_hint:
-            args.extend(["--slug-hint", slug_hint])
-        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-            review_pack_module.main(args)
-    except Exception as exc:
-        return False, f"review pack regen failed: {exc}"
+    with loop_telemetry.phase("review_pack_regen") as telemetry_record:
+        try:
+            from aidd_runtime import review_pack as review_pack_module
+
+            args = ["--ticket", ticket]
+            if slug_hint:
+                args.extend(["--slug-hint", slug_hint])
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                review_pack_module.main(args)
+        except Exception as exc:
+            telemetry_record["status"] = "failed"
+            return False, f"review pack regen failed: {exc}"
     pack_path = root / "reports" / "loops" / ticket / scope_key / "review.latest.pack.md"
     if not pack_path.exists():
         return False, "review pack missing"
@@ -6,6 +6,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -55,29 +56,80 @@ FULL_DOC_PREFIXES = (
 )
 
 
+# Contract lines are "<label>: <value>"; one anchored pattern covers every label.
+FIELD_LABELS = {
+    "status": "status",
+    "work item key": "work_item_key",
+    "artifacts updated": "artifacts",
+    "tests": "tests",
+    "blockers/handoff": "blockers",
+    "next actions": "next_actions",
+    "aidd:read_log": "read_log",
+    "aidd:actions_log": "actions_log",
+}
+FIELD_LINE_RE = re.compile(
+    r"^(?P<label>" + "|".join(re.escape(label) for label in FIELD_LABELS) + r"):\s*(?P<value>.+)$",
+    re.IGNORECASE,
+)
+READ_LOG_REASON_RE = re.compile(r"\(reason:\s*([^)]+)\)", re.IGNORECASE)
+
+
 def _normalize_line(line: str) -> str:
     return line.strip()
 
 
-def _parse_fields(text: str) -> Dict[str, str]:
-    fields: Dict[str, str] = {}
-    patterns = {
-        "status": re.compile(r"^Status:\s*(.+)$", re.IGNORECASE),
-        "work_item_key": re.compile(r"^Work item key:\s*(.+)$", re.IGNORECASE),
-        "artifacts": re.compile(r"^Artifacts updated:\s*(.+)$", re.IGNORECASE),
-        "tests": re.compile(r"^Tests:\s*(.+)$", re.IGNORECASE),
-        "blockers": re.compile(r"^Blockers/Handoff:\s*(.+)$", re.IGNORECASE),
-        "next_actions": re.compile(r"^Next actions:\s*(.+)$", re.IGNORECASE),
-        "read_log": re.compile(r"^AIDD:READ_LOG:\s*(.+)$", re.IGNORECASE),
-        "actions_log": re.compile(r"^AIDD:ACTIONS_LOG:\s*(.+)$", re.IGNORECASE),
-    }
-    for raw in text.splitlines():
-        line = _normalize_line(raw)
-        for key, pattern in patterns.items():
-            match = pattern.match(line)
-            if match:
-                fields[key] = match.group(1).strip()
-    return fields
+class ContractScanner:
+    """Incremental contract parser fed one log line at a time.
+
+    The loop runner feeds every line it writes to the raw log, so the verdict needs no
+    post-run re-read of the log. As with a whole-file parse, a later field line replaces
+    an earlier one. ``feed`` is safe to call from the stdout and stderr drain threads.
+    """
+
+    def __init__(self) -> None:
+        self._fields: Dict[str, str] = {}
+        self._read_log: Optional[List[Dict[str, str]]] = None
+        self._lock = threading.Lock()
+        self.lines = 0
+
+    def feed(self, line: str) -> None:
+        normalized = _normalize_line(line)
+        match = FIELD_LINE_RE.match(normalized) if ":" in normalized else None
+        with self._lock:
+            self.lines += 1
+            if match is None:
+                return
+            key = FIELD_LABELS[match.group("label").lower()]
+            self._fields[key] = match.group("value").strip()
+            if key == "read_log":
+                self._read_log = None
+
+    def feed_text(self, text: str) -> "ContractScanner":
+        for raw in text.splitlines():
+            self.feed(raw)
+        return self
+
+    @property
+    def fields(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._fields)
+
+    @property
+    def read_log(self) -> List[Dict[str, str]]:
+        with self._lock:
+            if self._read_log is None:
+                self._read_log = _parse_read_log(self._fields.get("read_log", ""))
+            return [dict(entry) for entry in self._read_log]
+
+
+def scan_log(log_path: Path) -> ContractScanner:
+    """Scan a finished log line by line (for runs that did not feed a scanner)."""
+    scanner = ContractScanner()
+    if log_path.exists():
+        with log_path.open(encoding="utf-8", errors="replace") as handle:
+            for raw in handle:
+                scanner.feed(raw)
+    return scanner
 
 
 def _parse_read_log(raw: str) -> List[Dict[str, str]]:
@@ -91,7 +143,7 @@ def _parse_read_log(raw: str) -> List[Dict[str, str]]:
         cleaned = part.lstrip("-").strip()
         reason = ""
         path = cleaned
-        match = re.search(r"\(reason:\s*([^)]+)\)", cleaned, re.IGNORECASE)
+        match = READ_LOG_REASON_RE.search(cleaned)
         if match:
             reason = match.group(1).strip()
             path = cleaned[: match.start()].strip()
@@ -152,13 +204,15 @@ def check_output_contract(
     log_path: Path,
     stage_result_path: Optional[Path] = None,
     max_read_items: int = 3,
+    scanner: Optional[ContractScanner] = None,
 ) -> Dict[str, object]:
-    text = log_path.read_text(encoding="utf-8", errors="replace") if log_path.exists() else ""
-    fields = _parse_fields(text)
+    if scanner is None:
+        scanner = scan_log(log_path)
+    fields = scanner.fields
     missing = sorted(REQUIRED_FIELDS - set(fields.keys()))
     warnings: List[str] = []
 
-    read_entries = _parse_read_log(fields.get("read_log", ""))
+    read_entries = scanner.read_log
     if not read_entries:
         warnings.append("read_log_missing")
     if max_read_items and len(read_entries) > max_read_items:
@@ -7,7 +7,6 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
@@ -35,6 +34,7 @@ _ensure_plugin_root_on_path()
 
 from aidd_runtime import actions_validate
 from aidd_runtime import context_map_validate
+from aidd_runtime import loop_pack
 from aidd_runtime import preflight_result_validate
 from aidd_runtime import runtime
 from aidd_runtime import skill_contract_validate
@@ -315,36 +315,20 @@ def _run_loop_pack(target: Path, *, ticket: str, stage: str, work_item_key: str)
         loop_stage = "review"
     else:
         loop_stage = "implement"
-    plugin_root = runtime.require_plugin_root()
-    cmd = [
-        sys.executable,
-        str(plugin_root / "skills" / "aidd-loop" / "runtime" / "loop_pack.py"),
-        "--ticket",
-        ticket,
-        "--stage",
-        loop_stage,
-        "--work-item",
-        work_item_key,
-        "--format",
-        "json",
-    ]
-    env = os.environ.copy()
-    env["CLAUDE_PLUGIN_ROOT"] = str(plugin_root)
-    env["PYTHONPATH"] = str(plugin_root) if not env.get("PYTHONPATH") else f"{plugin_root}:{env['PYTHONPATH']}"
-    proc = subprocess.run(cmd, cwd=target, text=True, capture_output=True, env=env)
-    raw = (proc.stdout or "").strip()
-    payload: Dict[str, Any] = {}
-    if raw:
-        try:
-            maybe = json.loads(raw)
-            if isinstance(maybe, dict):
-                payload = maybe
-        except json.JSONDecodeError:
-            payload = {}
+    try:
+        result = loop_pack.generate_loop_pack(
+            target,
+            ticket=ticket,
+            stage=loop_stage,
+            work_item=work_item_key,
+        )
+    except Exception as exc:
+        raise PreflightBlocked("loop_pack_failed", str(exc) or "loop-pack failed") from exc
+    payload: Dict[str, Any] = dict(result.payload)
 
-    if proc.returncode != 0:
+    if result.exit_code != 0:
         reason_code = str(payload.get("reason") or "loop_pack_failed").strip() or "loop_pack_failed"
-        reason = str(payload.get("message") or payload.get("reason") or proc.stderr or proc.stdout).strip()
+        reason = str(payload.get("message") or payload.get("reason") or result.message).strip()
         raise PreflightBlocked(reason_code, reason or "loop-pack failed")
 
     if payload.get("status") == "blocked":
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict
+
+
+def _ensure_plugin_root_on_path() -> None:
+    env_root = os.environ.get("CLAUDE_PLUGIN_ROOT", "").strip()
+    if env_root:
+        root = Path(env_root).resolve()
+        if (root / "aidd_runtime").is_dir():
+            if str(root) not in sys.path:
+                sys.path.insert(0, str(root))
+            return
+
+    probe = Path(__file__).resolve()
+    for parent in (probe.parent, *probe.parents):
+        if (parent / "aidd_runtime").is_dir():
+            os.environ.setdefault("CLAUDE_PLUGIN_ROOT", str(parent))
+            if str(parent) not in sys.path:
+                sys.path.insert(0, str(parent))
+            return
+
+
+_ensure_plugin_root_on_path()
+
+from aidd_runtime import runtime
+from aidd_runtime.reports import context_snapshots
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Prune context-GC snapshots (aidd/reports/context) and their unreferenced content blobs.",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=14.0,
+        help="Drop snapshots written more than N days ago (0 = no age limit, default: 14).",
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=0.0,
+        help="Then drop the oldest snapshots until their blobs fit in N MiB (0 = no size limit).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be removed without deleting anything.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format (default: text).",
+    )
+    return parser.parse_args(argv)
+
+
+def _render_text(report: Dict[str, object], dry_run: bool) -> str:
+    verb = "would remove" if dry_run else "removed"
+    removed = list(report.get("removed_snapshots") or [])
+    lines = [
+        f"{verb} snapshots={len(removed)} blobs={report['removed_blobs']} bytes={report['freed_bytes']}",
+        f"kept snapshots={report['kept_snapshots']} blob_bytes={report['kept_blob_bytes']}",
+    ]
+    lines.extend(f"- {item}" for item in removed)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    _, target = runtime.require_workflow_root()
+    result = context_snapshots.prune(
+        target,
+        max_age_days=max(0.0, float(args.max_age_days)),
+        max_bytes=int(max(0.0, float(args.max_mb)) * 1024 * 1024),
+        dry_run=bool(args.dry_run),
+    )
+    report = result.to_dict()
+    report["dry_run"] = bool(args.dry_run)
+    if args.format == "json":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(_render_text(report, bool(args.dry_run)))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+def _ensure_plugin_root_on_path() -> None:
+    env_root = os.environ.get("CLAUDE_PLUGIN_ROOT", "").strip()
+    if env_root:
+        root = Path(env_root).resolve()
+        if (root / "aidd_runtime").is_dir():
+            if str(root) not in sys.path:
+                sys.path.insert(0, str(root))
+            return
+
+    probe = Path(__file__).resolve()
+    for parent in (probe.parent, *probe.parents):
+        if (parent / "aidd_runtime").is_dir():
+            os.environ.setdefault("CLAUDE_PLUGIN_ROOT", str(parent))
+            if str(parent) not in sys.path:
+                sys.path.insert(0, str(parent))
+            return
+
+
+_ensure_plugin_root_on_path()
+
+from aidd_runtime import runtime
+from aidd_runtime.io_utils import read_jsonl
+from aidd_runtime.reports import loop_telemetry
+
+REPORT_SCHEMA = "aidd.loop_telemetry_report.v1"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Aggregate loop-run telemetry (aidd/reports/loops/<ticket>/loop.telemetry.jsonl) per phase.",
+    )
+    parser.add_argument(
+        "--ticket",
+        dest="ticket",
+        help="Ticket identifier (defaults to docs/.active.json).",
+    )
+    parser.add_argument(
+        "--all-tickets",
+        action="store_true",
+        help="Aggregate telemetry across every ticket under reports/loops.",
+    )
+    parser.add_argument(
+        "--run-id",
+        action="append",
+        default=[],
+        help="Restrict to one or more loop-run ids (repeatable).",
+    )
+    parser.add_argument(
+        "--last-runs",
+        type=int,
+        default=0,
+        help="Restrict to the N most recent loop-run ids (0 = all runs).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format (default: text).",
+    )
+    return parser.parse_args(argv)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile over an unsorted sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _with_rotated(path: Path) -> List[Path]:
+    """The rotated previous generation (older records) first, then the live log."""
+    return [item for item in (loop_telemetry.rotated_path(path), path) if item.exists()]
+
+
+def _telemetry_files(target: Path, ticket: str, all_tickets: bool) -> List[Path]:
+    if not all_tickets:
+        return _with_rotated(loop_telemetry.telemetry_path(target, ticket))
+    loops_dir = target / "reports" / "loops"
+    if not loops_dir.is_dir():
+        return []
+    return [
+        item
+        for path in sorted(loops_dir.glob(f"*/{loop_telemetry.TELEMETRY_FILENAME}"))
+        for item in _with_rotated(path)
+    ]
+
+
+def load_records(paths: Iterable[Path]) -> List[Dict[str, object]]:
+    records: List[Dict[str, object]] = []
+    for path in paths:
+        for record in read_jsonl(path):
+            if record.get("schema") == loop_telemetry.SCHEMA:
+                records.append(record)
+    return records
+
+
+def _filter_runs(records: List[Dict[str, object]], run_ids: List[str], last_runs: int) -> List[Dict[str, object]]:
+    if run_ids:
+        wanted = set(run_ids)
+        records = [record for record in records if str(record.get("run_id") or "") in wanted]
+    if last_runs > 0:
+        ordered_runs: List[str] = []
+        for record in records:
+            run_id = str(record.get("run_id") or "")
+            if run_id not in ordered_runs:
+                ordered_runs.append(run_id)
+        recent = set(sorted(ordered_runs)[-last_runs:])
+        records = [record for record in records if str(record.get("run_id") or "") in recent]
+    return records
+
+
+def aggregate(records: List[Dict[str, object]]) -> Dict[str, object]:
+    durations: Dict[str, List[float]] = {}
+    bytes_streamed: Dict[str, int] = {}
+    subprocesses: Dict[str, int] = {}
+    reason_codes: Dict[str, Dict[str, int]] = {}
+    run_ids = set()
+    for record in records:
+        kind = str(record.get("kind") or loop_telemetry.KIND_PHASE)
+        phase = str(record.get("phase") or "unknown")
+        key = phase if kind == loop_telemetry.KIND_PHASE else f"{kind}:{phase}"
+        try:
+            duration = float(record.get("duration_ms") or 0.0)
+        except (TypeError, ValueError):
+            continue
+        durations.setdefault(key, []).append(duration)
+        bytes_streamed[key] = bytes_streamed.get(key, 0) + int(record.get("bytes_streamed") or 0)
+        subprocesses[key] = subprocesses.get(key, 0) + int(record.get("subprocess_count") or 0)
+        reason_code = str(record.get("reason_code") or "").strip()
+        if reason_code:
+            counts = reason_codes.setdefault(key, {})
+            counts[reason_code] = counts.get(reason_code, 0) + 1
+        if record.get("run_id"):
+            run_ids.add(str(record.get("run_id")))
+
+    phases = []
+    for key in sorted(durations, key=lambda item: -sum(durations[item])):
+        values = durations[key]
+        phases.append(
+            {
+                "phase": key,
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "max_ms": round(max(values), 3),
+                "total_ms": round(sum(values), 3),
+                "bytes_streamed": bytes_streamed.get(key, 0),
+                "subprocess_count": subprocesses.get(key, 0),
+                "reason_codes": dict(sorted(reason_codes.get(key, {}).items())),
+            }
+        )
+    return {
+        "schema": REPORT_SCHEMA,
+        "runs": len(run_ids),
+        "records": len(records),
+        "phases": phases,
+    }
+
+
+def _render_text(report: Dict[str, object]) -> str:
+    lines = [f"runs={report['runs']} records={report['records']}"]
+    phases = report.get("phases") or []
+    if not phases:
+        lines.append("no telemetry records")
+        return "\n".join(lines)
+    width = max(len(str(item["phase"])) for item in phases)
+    lines.append(
+        f"{'phase'.ljust(width)}  {'count':>6}  {'p50_ms':>10}  {'p95_ms':>10}  {'total_ms':>12}  {'bytes':>10}  {'procs':>6}"
+    )
+    for item in phases:
+        lines.append(
+            f"{str(item['phase']).ljust(width)}  {item['count']:>6}  {item['p50_ms']:>10.1f}  "
+            f"{item['p95_ms']:>10.1f}  {item['total_ms']:>12.1f}  {item['bytes_streamed']:>10}  "
+            f"{item['subprocess_count']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    _, target = runtime.require_workflow_root()
+    ticket = ""
+    if not args.all_tickets:
+        ticket, _ = runtime.require_ticket(target, ticket=getattr(args, "ticket", None), slug_hint=None)
+    records = load_records(_telemetry_files(target, ticket, args.all_tickets))
+    records = _filter_runs(records, list(args.run_id or []), max(0, int(args.last_runs)))
+    report = aggregate(records)
+    if ticket:
+        report["ticket"] = ticket
+    if args.format == "json":
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(_render_text(report))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -4,12 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
 
 def _repo_root() -> Path:
@@ -39,6 +40,14 @@ SKILL_RUNTIME_PATTERN = re.compile(
     r"(?:\$\{CLAUDE_PLUGIN_ROOT\}/)?skills/([A-Za-z0-9_.-]+)/runtime/([A-Za-z0-9_.-]+\.py)"
 )
 HOOK_PATTERN = re.compile(r"(?:\$\{CLAUDE_PLUGIN_ROOT\}/)?hooks/([A-Za-z0-9_.-]+\.sh)")
+# Single-pass alternation of TOOL_PATTERN / SKILL_RUNTIME_PATTERN / HOOK_PATTERN.
+CONSUMER_REF_RE = re.compile(
+    r"(?:\$\{CLAUDE_PLUGIN_ROOT\}/)?(?:"
+    r"tools/(?P<tool>[A-Za-z0-9_.-]+\.(?:sh|py))"
+    r"|skills/(?P<skill>[A-Za-z0-9_.-]+)/runtime/(?P<skill_runtime>[A-Za-z0-9_.-]+\.py)"
+    r"|hooks/(?P<hook>[A-Za-z0-9_.-]+\.sh)"
+    r")"
+)
 
 CANONICAL_EXEC_RE = re.compile(
     r'exec\s+"?\$\{CLAUDE_PLUGIN_ROOT\}/(skills/[A-Za-z0-9_.-]+/runtime/[A-Za-z0-9_.-]+\.py)"?'
@@ -82,6 +91,8 @@ EXCLUDED_DIRS = {
     "venv",
 }
 EXCLUDED_SUFFIXES = {".pyc", ".pyo"}
+SCAN_CACHE_NAME = "tools-inventory.scan.json"
+SCAN_CACHE_VERSION = 1
 
 
 def _should_skip_path(path: Path) -> bool:
@@ -112,39 +123,110 @@ def _collect_entrypoints(repo_root: Path) -> List[str]:
     return sorted(set(tools + skills + hooks))
 
 
-def _iter_scan_candidates(repo_root: Path) -> Iterable[Path]:
+def _iter_scan_candidates(repo_root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """Walk SCAN_PATHS once with os.scandir, pruning excluded dirs before descending."""
     for item in SCAN_PATHS:
         base = repo_root / item
-        if not base.exists():
+        try:
+            stat_result = base.stat()
+        except OSError:
             continue
-        if base.is_file():
-            yield base
+        if not base.is_dir():
+            if not _should_skip_path(Path(item)):
+                yield item, stat_result
             continue
-        yield from (path for path in base.rglob("*") if path.is_file())
+        pending = [item]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                entries = list(os.scandir(repo_root / rel_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            pending.append(rel_path)
+                        continue
+                    if not entry.is_file() or _should_skip_path(Path(rel_path)):
+                        continue
+                    yield rel_path, entry.stat()
+                except OSError:
+                    continue
+
+
+def _extract_consumer_refs(text: str) -> List[str]:
+    refs: Set[str] = set()
+    for match in CONSUMER_REF_RE.finditer(text):
+        if match.group("tool"):
+            refs.add(f"tools/{match.group('tool')}")
+        elif match.group("skill"):
+            refs.add(f"skills/{match.group('skill')}/runtime/{match.group('skill_runtime')}")
+        else:
+            refs.add(f"hooks/{match.group('hook')}")
+    return sorted(refs)
+
+
+def _scan_cache_key() -> str:
+    return hashlib.sha256(CONSUMER_REF_RE.pattern.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_scan_cache(cache_path: Path | None) -> Dict[str, Dict[str, object]]:
+    if cache_path is None:
+        return {}
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    if payload.get("version") != SCAN_CACHE_VERSION or payload.get("pattern") != _scan_cache_key():
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_scan_cache(cache_path: Path | None, files: Dict[str, Dict[str, object]]) -> None:
+    if cache_path is None:
+        return
+    payload = {"version": SCAN_CACHE_VERSION, "pattern": _scan_cache_key(), "files": files}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        return
 
 
-def _scan_consumers(repo_root: Path, entrypoints: Iterable[str]) -> Dict[str, List[str]]:
+def _scan_consumers(
+    repo_root: Path,
+    entrypoints: Iterable[str],
+    *,
+    cache_path: Path | None = None,
+) -> Dict[str, List[str]]:
     names = set(entrypoints)
     usage: Dict[str, List[str]] = {name: [] for name in names}
-    for path in _iter_scan_candidates(repo_root):
-        if _should_skip_path(path):
-            continue
-        try:
-            text = path.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
-            continue
-        for match in TOOL_PATTERN.finditer(text):
-            tool = f"tools/{match.group(1)}"
-            if tool in names:
-                usage[tool].append(path.relative_to(repo_root).as_posix())
-        for match in SKILL_RUNTIME_PATTERN.finditer(text):
-            runtime_path = f"skills/{match.group(1)}/runtime/{match.group(2)}"
-            if runtime_path in names:
-                usage[runtime_path].append(path.relative_to(repo_root).as_posix())
-        for match in HOOK_PATTERN.finditer(text):
-            hook_script = f"hooks/{match.group(1)}"
-            if hook_script in names:
-                usage[hook_script].append(path.relative_to(repo_root).as_posix())
+    cached_files = _load_scan_cache(cache_path)
+    scanned_files: Dict[str, Dict[str, object]] = {}
+    for rel_path, stat_result in _iter_scan_candidates(repo_root):
+        signature = [int(stat_result.st_mtime_ns), int(stat_result.st_size)]
+        cached = cached_files.get(rel_path)
+        if isinstance(cached, dict) and cached.get("sig") == signature:
+            refs = [str(ref) for ref in cached.get("refs") or []]
+        else:
+            try:
+                text = (repo_root / rel_path).read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            refs = _extract_consumer_refs(text)
+        scanned_files[rel_path] = {"sig": signature, "refs": refs}
+        for ref in refs:
+            if ref in names:
+                usage[ref].append(rel_path)
+    if scanned_files != cached_files:
+        _write_scan_cache(cache_path, scanned_files)
     for key, items in usage.items():
         usage[key] = sorted(set(items))
     return usage
@@ -306,9 +388,9 @@ def _runtime_classification(rel_path: str, *, python_shebang: bool, owners: List
     return "legacy_shell_wrapper"
 
 
-def _build_payload(repo_root: Path) -> Dict[str, object]:
+def _build_payload(repo_root: Path, *, scan_cache_path: Path | None = None) -> Dict[str, object]:
     entrypoints = _collect_entrypoints(repo_root)
-    usage = _scan_consumers(repo_root, entrypoints)
+    usage = _scan_consumers(repo_root, entrypoints, cache_path=scan_cache_path)
     meta = _build_wrapper_meta(repo_root, entrypoints)
     resolved_cache: Dict[str, Set[str]] = {}
     items: List[Dict[str, object]] = []
@@ -445,7 +527,8 @@ def main(argv: list[str] | None = None) -> int:
             workflow_root = repo_root / "aidd"
             workflow_root.mkdir(parents=True, exist_ok=True)
 
-    payload = _build_payload(repo_root)
+    scan_cache_path = workflow_root / ".cache" / SCAN_CACHE_NAME if workflow_root is not None else None
+    payload = _build_payload(repo_root, scan_cache_path=scan_cache_path)
 
     if args.output_json:
         output_json = Path(args.output_json)
@@ -148,10 +148,11 @@ def _compact_value(value: Any) -> Any:
         is_columnar = "cols" in value and "rows" in value
         compacted: Dict[str, Any] = {}
         for key, val in value.items():
-            cleaned = _compact_value(val)
             if is_columnar and key in {"cols", "rows"}:
-                compacted[key] = cleaned if cleaned is not None else []
+                # Cells are positional: dropping an empty one would shift the columns after it.
+                compacted[key] = val if val is not None else []
                 continue
+            cleaned = _compact_value(val)
             if _is_empty(cleaned):
                 continue
             compacted[key] = cleaned
@@ -30,6 +30,7 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import rlm_jsonl_helpers
+from aidd_runtime import rlm_stats
 from aidd_runtime import runtime
 from aidd_runtime.io_utils import read_jsonl, write_jsonl
 
@@ -86,6 +87,7 @@ def main(argv: List[str] | None = None) -> int:
         compacted = _compact_links(links)
         write_jsonl(links_path, compacted)
 
+    rlm_stats.record(target, ticket, nodes_path=nodes_path, links_path=links_path)
     print("[aidd] rlm jsonl compact complete.")
     return 0
 
@@ -24,7 +24,7 @@ for _root in _root_candidates:
             sys.path.insert(0, str(_root))
         break
 
-from aidd_runtime import rlm_targets, runtime
+from aidd_runtime import rlm_stats, rlm_targets, runtime
 from aidd_runtime.rlm_links_empty_reason import resolve_empty_reason
 from aidd_runtime.rlm_config import (
     base_root_for_label,
@@ -897,6 +897,7 @@ def main(argv: List[str] | None = None) -> int:
             symbols_source = f"{key_calls_source}+type_refs"
         stats_payload["symbols_source"] = symbols_source
     _write_stats(stats_path, stats_payload)
+    rlm_stats.record(project_root, ticket, links_path=output)
     rel_output = runtime.rel_path(output, project_root)
     suffix = " (truncated)" if truncated else ""
     print(f"[aidd] rlm links saved to {rel_output}{suffix}.")
@@ -33,6 +33,7 @@ _ensure_plugin_root_on_path()
 
 from aidd_runtime import rlm_targets, runtime
 from aidd_runtime import rlm_jsonl_helpers
+from aidd_runtime import rlm_stats
 from aidd_runtime.rlm_config import (
     base_root_for_label,
     file_id_for_path,
@@ -563,6 +564,7 @@ def main(argv: List[str] | None = None) -> int:
         dir_nodes = build_dir_nodes(existing_nodes, max_children=max_children, max_chars=max_chars)
         merged = rlm_jsonl_helpers.compact_nodes(existing_nodes + dir_nodes)
         rlm_jsonl_helpers.write_nodes(nodes_path, merged)
+        rlm_stats.record(target, ticket, nodes_path=nodes_path)
         rel_nodes = runtime.rel_path(nodes_path, target)
         print(f"[aidd] rlm dir nodes updated in {rel_nodes} ({len(dir_nodes)} dirs).")
         return 0
@@ -581,6 +583,7 @@ def main(argv: List[str] | None = None) -> int:
             merged = rlm_jsonl_helpers.compact_nodes(new_nodes)
         nodes_path.parent.mkdir(parents=True, exist_ok=True)
         rlm_jsonl_helpers.write_nodes(nodes_path, merged)
+        rlm_stats.record(target, ticket, nodes_path=nodes_path)
         rel_nodes = runtime.rel_path(nodes_path, target)
         print(
             f"[aidd] rlm bootstrap nodes saved to {rel_nodes} "
@@ -31,6 +31,7 @@ def _ensure_plugin_root_on_path() -> None:
 _ensure_plugin_root_on_path()
 
 from aidd_runtime import rlm_jsonl_helpers
+from aidd_runtime import rlm_stats
 from aidd_runtime import runtime
 from aidd_runtime.rlm_config import load_rlm_settings, resolve_source_path
 
@@ -168,6 +169,7 @@ def main(argv: List[str] | None = None) -> int:
     if not nodes_path.exists():
         raise SystemExit(f"rlm nodes not found: {nodes_path}")
     updated = verify_nodes(project_root, workspace_root, nodes_path, max_file_bytes=max_file_bytes)
+    rlm_stats.record(project_root, ticket, nodes_path=nodes_path)
     rel_nodes = runtime.rel_path(nodes_path, project_root)
     print(f"[aidd] rlm verify updated {updated} nodes in {rel_nodes}.")
     return 0
@@ -3,7 +3,12 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass
 import shlex
 import subprocess
 import sys
@@ -16,6 +21,7 @@ if str(_PLUGIN_ROOT) not in sys.path:
     sys.path.insert(0, str(_PLUGIN_ROOT))
 
 from aidd_runtime import qa_agent as _qa_agent
+from aidd_runtime import config_cache
 from aidd_runtime import gates
 from aidd_runtime import runtime
 from aidd_runtime import tasklist_parser
@@ -72,6 +78,113 @@ SKIP_MARKERS = (
     "nothing to test",
 )
 
+# Bytes carried between stream chunks so a skip marker split across two reads is still found.
+_SKIP_MARKER_OVERLAP = max(len(marker.encode("utf-8")) for marker in SKIP_MARKERS)
+_STREAM_CHUNK_BYTES = 64 * 1024
+_KILL_GRACE_SECONDS = 5.0
+TESTS_TIMEOUT_REASON_CODE = "tests_timeout"
+
+
+@dataclass
+class _PlanOutcome:
+    status: str
+    exit_code: Optional[int]
+    reason_code: str = ""
+    skip_detected: bool = False
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    # The whole session is signalled even when the leader already exited: orphaned grandchildren
+    # would otherwise keep the output pipe open and the stream reader waiting.
+    if os.name != "posix":
+        with suppress(OSError):
+            proc.kill()
+        return
+    with suppress(OSError):
+        os.killpg(proc.pid, signal.SIGTERM)
+    with suppress(subprocess.TimeoutExpired):
+        proc.wait(timeout=_KILL_GRACE_SECONDS)
+    with suppress(OSError):
+        os.killpg(proc.pid, signal.SIGKILL)
+
+
+def _run_test_plan(
+    plan_cmd: list[str],
+    plan_cwd: Path,
+    log_path: Path,
+    *,
+    command_timeout: float,
+    deadline: Optional[float],
+) -> _PlanOutcome:
+    """Run one plan, streaming combined output into ``log_path`` and watching for skip markers as it arrives."""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("wb") as log:
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            log.write(b"not started: QA tests total deadline exceeded\n")
+            return _PlanOutcome(status="fail", exit_code=None, reason_code=TESTS_TIMEOUT_REASON_CODE)
+        try:
+            proc = subprocess.Popen(
+                plan_cmd,
+                cwd=plan_cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                start_new_session=os.name == "posix",
+            )
+        except FileNotFoundError as exc:
+            log.write(f"command not found: {plan_cmd[0]} ({exc})".encode("utf-8"))
+            return _PlanOutcome(status="fail", exit_code=None, reason_code="tests_cwd_mismatch")
+
+        limits = [deadline] if deadline is not None else []
+        if command_timeout > 0:
+            limits.append(now + command_timeout)
+        timed_out = threading.Event()
+        killer: Optional[threading.Timer] = None
+        if limits:
+
+            def _expire() -> None:
+                timed_out.set()
+                _kill_process_group(proc)
+
+            killer = threading.Timer(max(0.0, min(limits) - now), _expire)
+            killer.daemon = True
+            killer.start()
+
+        skip_detected = False
+        carry = b""
+        try:
+            assert proc.stdout is not None
+            while True:
+                chunk = proc.stdout.read1(_STREAM_CHUNK_BYTES)
+                if not chunk:
+                    break
+                log.write(chunk)
+                if not skip_detected:
+                    window = (carry + chunk).decode("utf-8", errors="ignore").lower()
+                    skip_detected = any(marker in window for marker in SKIP_MARKERS)
+                    carry = (carry + chunk)[-_SKIP_MARKER_OVERLAP:]
+            proc.wait()
+        finally:
+            if killer is not None:
+                killer.cancel()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+        if timed_out.is_set():
+            log.write(b"\n[qa] command exceeded its deadline; process group killed\n")
+            return _PlanOutcome(status="fail", exit_code=proc.returncode, reason_code=TESTS_TIMEOUT_REASON_CODE)
+        status = "pass" if proc.returncode == 0 else "fail"
+        return _PlanOutcome(status=status, exit_code=proc.returncode, skip_detected=skip_detected)
+
+
+def _load_qa_tests_limits(root: Path) -> dict:
+    try:
+        config = gates.load_gates_config(root)
+    except ValueError:
+        config = {}
+    return gates.load_qa_tests_limits(config)
+
+
 def _strip_placeholder(value: str) -> str:
     text = value.strip()
     if not text:
@@ -212,11 +325,12 @@ def _command_execution_plans(
 
 
 def _load_qa_tests_config(root: Path) -> tuple[list[list[str]], str]:
-    config_path = root / "config" / "gates.json"
     commands: list[list[str]] = []
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError):
+        data = config_cache.load_json(root / "config" / "gates.json")
+    except ValueError:
+        data = None
+    if data is None:
         return commands, "project_contract_missing"
 
     contract, contract_errors = gates.load_qa_tests_contract(data)
@@ -250,6 +364,9 @@ def _run_qa_tests(
     report_path: Path,
     allow_missing: bool,
     commands_override: list[list[str]] | None = None,
+    max_workers: int | None = None,
+    command_timeout: float | None = None,
+    total_timeout: float | None = None,
 ) -> tuple[list[dict], str, str]:
     run_reason_code = ""
     if commands_override is not None:
@@ -280,10 +397,13 @@ def _run_qa_tests(
     base_name = report_path.stem
     summary = "not-run"
 
-    def _output_indicates_skip(text: str) -> bool:
-        lowered = text.lower()
-        return any(marker in lowered for marker in SKIP_MARKERS)
+    limits = _load_qa_tests_limits(target)
+    workers = max_workers if max_workers is not None else int(limits["max_workers"])
+    per_command = command_timeout if command_timeout is not None else float(limits["command_timeout_seconds"])
+    total = total_timeout if total_timeout is not None else float(limits["total_timeout_seconds"])
+    deadline = time.monotonic() + total if total > 0 else None
 
+    plans: list[tuple[list[str], Path, str, Path]] = []
     for index, cmd in enumerate(commands, start=1):
         execution_plans = _command_execution_plans(
             cmd,
@@ -296,54 +416,55 @@ def _run_qa_tests(
                 suffix = f"-{index}"
             if len(execution_plans) > 1:
                 suffix += f"-m{plan_index}"
-            log_path = logs_dir / f"{base_name}-tests{suffix}.log"
+            plans.append((plan_cmd, plan_cwd, display_cmd, logs_dir / f"{base_name}-tests{suffix}.log"))
+
+    def _execute(plan: tuple[list[str], Path, str, Path]) -> _PlanOutcome:
+        plan_cmd, plan_cwd, _, log_path = plan
+        if plan_cmd and _is_explicit_path_command(plan_cmd[0]) and not _command_head_exists(plan_cmd[0], plan_cwd):
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            status = "fail"
-            exit_code: Optional[int] = None
-            output = ""
-            if plan_cmd and _is_explicit_path_command(plan_cmd[0]) and not _command_head_exists(plan_cmd[0], plan_cwd):
-                status = "fail"
-                run_reason_code = run_reason_code or "tests_cwd_mismatch"
-                output = (
-                    f"command path not found in selected cwd: {plan_cmd[0]} "
-                    f"(cwd={plan_cwd.as_posix()}; "
-                    "use an existing executable path or adjust tasklist command cwd)"
-                )
-            else:
-                try:
-                    proc = subprocess.run(
-                        plan_cmd,
-                        cwd=plan_cwd,
-                        text=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        check=False,
-                    )
-                    output = proc.stdout or ""
-                    exit_code = proc.returncode
-                    status = "pass" if proc.returncode == 0 else "fail"
-                except FileNotFoundError as exc:
-                    status = "fail"
-                    run_reason_code = run_reason_code or "tests_cwd_mismatch"
-                    output = f"command not found: {plan_cmd[0]} ({exc})"
-            log_path.write_text(output, encoding="utf-8")
-            if status == "pass" and _output_indicates_skip(output):
-                status = "skipped"
-
-            try:
-                cwd_rel = plan_cwd.relative_to(workspace_root).as_posix()
-            except ValueError:
-                cwd_rel = plan_cwd.as_posix()
-            tests_executed.append(
-                {
-                    "command": display_cmd or " ".join(plan_cmd),
-                    "status": status,
-                    "cwd": cwd_rel or ".",
-                    "log": runtime.rel_path(log_path, target),
-                    "exit_code": exit_code,
-                    "reason_code": run_reason_code if status == "fail" and run_reason_code else "",
-                }
+            log_path.write_text(
+                f"command path not found in selected cwd: {plan_cmd[0]} "
+                f"(cwd={plan_cwd.as_posix()}; "
+                "use an existing executable path or adjust tasklist command cwd)",
+                encoding="utf-8",
             )
+            return _PlanOutcome(status="fail", exit_code=None, reason_code="tests_cwd_mismatch")
+        return _run_test_plan(plan_cmd, plan_cwd, log_path, command_timeout=per_command, deadline=deadline)
+
+    pool_size = max(1, min(workers, len(plans)))
+    if pool_size > 1:
+        with ThreadPoolExecutor(max_workers=pool_size) as pool:
+            outcomes = list(pool.map(_execute, plans))
+    else:
+        outcomes = [_execute(plan) for plan in plans]
+
+    for (plan_cmd, plan_cwd, display_cmd, log_path), outcome in zip(plans, outcomes):
+        status = outcome.status
+        if status == "pass" and outcome.skip_detected:
+            status = "skipped"
+        entry_reason = ""
+        if outcome.reason_code == TESTS_TIMEOUT_REASON_CODE:
+            entry_reason = TESTS_TIMEOUT_REASON_CODE
+        else:
+            if outcome.reason_code:
+                run_reason_code = run_reason_code or outcome.reason_code
+            if status == "fail" and run_reason_code:
+                entry_reason = run_reason_code
+
+        try:
+            cwd_rel = plan_cwd.relative_to(workspace_root).as_posix()
+        except ValueError:
+            cwd_rel = plan_cwd.as_posix()
+        tests_executed.append(
+            {
+                "command": display_cmd or " ".join(plan_cmd),
+                "status": status,
+                "cwd": cwd_rel or ".",
+                "log": runtime.rel_path(log_path, target),
+                "exit_code": outcome.exit_code,
+                "reason_code": entry_reason,
+            }
+        )
 
     if any(entry.get("status") == "fail" for entry in tests_executed):
         summary = "fail"
@@ -617,6 +738,12 @@ def main(argv: list[str] | None = None) -> int:
                     "(reason_code=tests_cwd_mismatch).",
                     file=sys.stderr,
                 )
+            elif any(entry.get("reason_code") == TESTS_TIMEOUT_REASON_CODE for entry in tests_executed):
+                print(
+                    "[aidd] QA tests exceeded their deadline (reason_code=tests_timeout); "
+                    "see aidd/reports/qa/*-tests.log or raise qa.tests.command_timeout_seconds.",
+                    file=sys.stderr,
+                )
             else:
                 print("[aidd] QA tests failed; see aidd/reports/qa/*-tests.log.", file=sys.stderr)
         elif tests_summary == "skipped":
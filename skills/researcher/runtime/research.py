@@ -18,7 +18,7 @@ if str(_PLUGIN_ROOT) not in sys.path:
     sys.path.insert(0, str(_PLUGIN_ROOT))
 
 from aidd_runtime import research_hints as prd_hints
-from aidd_runtime import rlm_finalize, rlm_manifest, rlm_nodes_build, rlm_targets, runtime, tasks_derive
+from aidd_runtime import rlm_finalize, rlm_manifest, rlm_nodes_build, rlm_stats, rlm_targets, runtime, tasks_derive
 from aidd_runtime.feature_ids import write_active_state
 from aidd_runtime.rlm_config import load_rlm_settings
 
@@ -250,7 +250,9 @@ def _rlm_bootstrap_cmd(ticket: str) -> str:
     return f"python3 ${{CLAUDE_PLUGIN_ROOT}}/skills/aidd-rlm/runtime/rlm_nodes_build.py --bootstrap --ticket {ticket}"
 
 
-def _jsonl_nonempty(path: Path) -> bool:
+def _jsonl_nonempty(path: Path, entry: dict | None = None) -> bool:
+    if entry is not None:
+        return int(entry.get("rows") or 0) > 0
     return path.exists() and path.stat().st_size > 0
 
 
@@ -265,8 +267,15 @@ def _evaluate_rlm_state(
     links_path = target / "reports" / "research" / f"{ticket}-rlm.links.jsonl"
     links_stats_path = target / "reports" / "research" / f"{ticket}-rlm.links.stats.json"
 
-    nodes_ready = _jsonl_nonempty(nodes_path)
-    links_ok = _jsonl_nonempty(links_path)
+    graph_stats = rlm_stats.load_stats(target, ticket)
+    nodes_ready = _jsonl_nonempty(
+        nodes_path,
+        rlm_stats.fresh_section(graph_stats, rlm_stats.SECTION_NODES, root=target, path=nodes_path),
+    )
+    links_ok = _jsonl_nonempty(
+        links_path,
+        rlm_stats.fresh_section(graph_stats, rlm_stats.SECTION_LINKS, root=target, path=links_path),
+    )
     links_total: int | None = None
     links_empty_reason = ""
     if links_stats_path.exists():
@@ -396,13 +405,14 @@ def _append_research_handoff(
     return code == 0, ""
 
 
-def _validate_json_file(path: Path, label: str) -> None:
+def _validate_json_file(path: Path, label: str) -> dict:
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except Exception as exc:
         raise RuntimeError(f"{label} invalid JSON at {path}: {exc}") from exc
     if not isinstance(payload, dict):
         raise RuntimeError(f"{label} invalid JSON payload at {path}: expected object.")
+    return payload
 
 
 def _enforce_research_artifacts(
@@ -424,21 +434,14 @@ def _enforce_research_artifacts(
             + ", ".join(missing)
             + " (reason_code=research_artifacts_missing)"
         )
-    for label, path in required:
-        _validate_json_file(path, label)
-    try:
-        targets_payload = json.loads(targets_path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        raise RuntimeError(f"rlm targets unreadable at {targets_path}: {exc}") from exc
+    payloads = {label: _validate_json_file(path, label) for label, path in required}
+    targets_payload = payloads["rlm targets"]
     if str(targets_payload.get("ticket") or "").strip() and str(targets_payload.get("ticket")) != ticket:
         raise RuntimeError(
             f"rlm targets ticket mismatch at {targets_path}: expected {ticket}, got {targets_payload.get('ticket')} "
             "(reason_code=research_artifacts_invalid)"
         )
-    try:
-        worklist_payload = json.loads(worklist_path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        raise RuntimeError(f"rlm worklist unreadable at {worklist_path}: {exc}") from exc
+    worklist_payload = payloads["rlm worklist"]
     if str(worklist_payload.get("schema") or "").strip() != "aidd.report.pack.v1":
         raise RuntimeError(
             f"rlm worklist schema mismatch at {worklist_path}: expected aidd.report.pack.v1 "
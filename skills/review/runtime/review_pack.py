@@ -8,7 +8,7 @@ import json
 from contextlib import suppress
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import os
 
@@ -33,6 +33,7 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
+from aidd_runtime import columnar
 from aidd_runtime import runtime
 from aidd_runtime.io_utils import dump_yaml, parse_front_matter, utc_timestamp
 
@@ -62,31 +63,10 @@ def load_loop_pack_meta(root: Path, ticket: str) -> Tuple[str, str, str]:
     return work_item_id, work_item_key, scope_key
 
 
-def inflate_columnar(section: object) -> List[Dict[str, object]]:
-    if not isinstance(section, dict):
-        return []
-    cols = section.get("cols")
-    rows = section.get("rows")
-    if not isinstance(cols, list) or not isinstance(rows, list):
-        return []
-    items: List[Dict[str, object]] = []
-    for row in rows:
-        if not isinstance(row, list):
-            continue
-        record: Dict[str, object] = {}
-        for idx, col in enumerate(cols):
-            if idx >= len(row):
-                break
-            record[str(col)] = row[idx]
-        if record:
-            items.append(record)
-    return items
-
-
-def extract_findings(payload: Dict[str, object]) -> List[Dict[str, object]]:
+def extract_findings(payload: Dict[str, object]) -> List[Mapping[str, object]]:
     findings = payload.get("findings")
     if isinstance(findings, dict) and findings.get("cols") and findings.get("rows"):
-        return inflate_columnar(findings)
+        return list(columnar.iter_records(findings))
     if isinstance(findings, dict):
         return [findings]
     if isinstance(findings, list):
@@ -98,7 +78,7 @@ def normalize_text(value: object) -> str:
     return " ".join(str(value or "").strip().split())
 
 
-def finding_summary(entry: Dict[str, object]) -> str:
+def finding_summary(entry: Mapping[str, object]) -> str:
     for key in ("summary", "title", "message", "details", "recommendation"):
         value = entry.get(key)
         if value:
@@ -106,7 +86,7 @@ def finding_summary(entry: Dict[str, object]) -> str:
     return "n/a"
 
 
-def normalize_links(entry: Dict[str, object]) -> List[str]:
+def normalize_links(entry: Mapping[str, object]) -> List[str]:
     links = entry.get("links")
     if isinstance(links, list):
         return [str(item).strip() for item in links if str(item).strip()]
@@ -116,7 +96,7 @@ def normalize_links(entry: Dict[str, object]) -> List[str]:
     return []
 
 
-def normalize_finding(entry: Dict[str, object]) -> Dict[str, object]:
+def normalize_finding(entry: Mapping[str, object]) -> Dict[str, object]:
     entry_id = str(entry.get("id") or "").strip() or "n/a"
     severity = normalize_severity(entry.get("severity"))
     blocking = entry.get("blocking") is True or severity in {"blocker", "critical", "blocking"}
@@ -32,6 +32,7 @@ def _ensure_plugin_root_on_path() -> None:
 
 _ensure_plugin_root_on_path()
 
+from aidd_runtime import columnar
 from aidd_runtime import runtime
 
 _STATUS_ALIASES = {
@@ -68,27 +69,6 @@ def _strip_updated_at(payload: Dict[str, Any]) -> Dict[str, Any]:
     return cleaned
 
 
-def _inflate_columnar(section: object) -> List[Dict]:
-    if not isinstance(section, dict):
-        return []
-    cols = section.get("cols")
-    rows = section.get("rows")
-    if not isinstance(cols, list) or not isinstance(rows, list):
-        return []
-    items: List[Dict] = []
-    for row in rows:
-        if not isinstance(row, list):
-            continue
-        record: Dict[str, Any] = {}
-        for idx, col in enumerate(cols):
-            if idx >= len(row):
-                break
-            record[str(col)] = row[idx]
-        if record:
-            items.append(record)
-    return items
-
-
 def _stable_finding_id(prefix: str, *parts: object) -> str:
     digest = hashlib.sha1()
     digest.update(prefix.encode("utf-8"))
@@ -264,7 +244,9 @@ def main(argv: list[str] | None = None) -> int:
         if isinstance(raw, dict) and "findings" in raw:
             raw = raw.get("findings")
         if isinstance(raw, dict) and raw.get("cols") and raw.get("rows"):
-            raw = _inflate_columnar(raw)
+            # Findings are merged and rewritten below, so columnar rows become real dicts here.
+            table = columnar.ColumnarTable.from_section(raw)
+            raw = table.to_dicts() if table is not None else []
         if isinstance(raw, dict):
             if any(key in raw for key in ("title", "severity", "details", "recommendation", "scope", "id")):
                 raw = [raw]
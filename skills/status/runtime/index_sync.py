@@ -6,8 +6,8 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
+import time
 from contextlib import suppress
-import re
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
@@ -37,10 +37,14 @@ _ensure_plugin_root_on_path()
 
 from aidd_runtime import runtime
 from aidd_runtime import artifact_truth
+from aidd_runtime import md_outline
+from aidd_runtime.config_cache import RACY_WINDOW_NS
 from aidd_runtime.prd_review_section import extract_prd_review_section
 
 SCHEMA = "aidd.ticket.v1"
 EVENTS_LIMIT = 5
+INDEX_CACHE_VERSION = 1
+EVENTS_HEAD_BYTES = 256
 REQUIRED_FIELDS = [
     "schema",
     "ticket",
@@ -56,8 +60,6 @@ REQUIRED_FIELDS = [
     "checks",
 ]
 
-SECTION_RE = re.compile(r"^##\s+(AIDD:[A-Z0-9_]+)\b", re.IGNORECASE)
-HEADING_RE = re.compile(r"^##\s+")
 
 
 def _read_text(path: Path) -> str:
@@ -67,24 +69,14 @@ def _read_text(path: Path) -> str:
         return ""
 
 
-def _extract_section(md: str, name: str) -> List[str]:
-    lines = md.splitlines()
-    start = None
-    target = name.strip().lower()
-    for idx, line in enumerate(lines):
-        match = SECTION_RE.match(line.strip())
-        if match and match.group(1).strip().lower() == target:
-            start = idx + 1
-            break
-    if start is None:
+def _extract_section(md: str, name: str, outline: Optional[md_outline.Outline] = None) -> List[str]:
+    if outline is None:
+        outline = md_outline.parse_outline(md.encode("utf-8"))
+    span = outline.aidd_section(name)
+    if span is None:
         return []
-    collected: List[str] = []
-    for line in lines[start:]:
-        if HEADING_RE.match(line):
-            break
-        if line.strip():
-            collected.append(line.strip())
-    return collected
+    start, end, _, _ = span
+    return [line.strip() for line in md.splitlines()[start + 1 : end] if line.strip()]
 
 
 def _first_nonempty(lines: Iterable[str]) -> str:
@@ -151,16 +143,70 @@ def _read_prd_review_status(root: Path, ticket: str) -> str:
     return status
 
 
-def _collect_events(root: Path, ticket: str, limit: int = EVENTS_LIMIT) -> List[Dict[str, object]]:
-    path = root / "reports" / "events" / f"{ticket}.jsonl"
-    if not path.exists():
-        return []
+def _index_cache_path(root: Path, ticket: str) -> Path:
+    return root / ".cache" / "index" / f"{ticket}.json"
+
+
+def _load_index_cache(root: Path, ticket: str) -> Dict[str, object]:
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        payload = json.loads(_index_cache_path(root, ticket).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_CACHE_VERSION:
+        return {}
+    return payload
+
+
+def _write_index_cache(root: Path, ticket: str, payload: Dict[str, object]) -> None:
+    path = _index_cache_path(root, ticket)
+    payload = {**payload, "version": INDEX_CACHE_VERSION}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
     except OSError:
-        return []
+        return
+
+
+def _tail_events(
+    path: Path,
+    cursor: Dict[str, object],
+    *,
+    collapse: bool,
+    window: int,
+) -> Optional[Dict[str, object]]:
+    """Fold events appended since ``cursor`` (byte offset + inode) into its bounded collapsed tail."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    offset = cursor.get("offset")
+    resumable = (
+        cursor.get("inode") == stat_result.st_ino
+        and cursor.get("collapse") == collapse
+        and int(cursor.get("window") or 0) >= window
+        and isinstance(offset, int)
+        and 0 <= offset <= stat_result.st_size
+        and isinstance(cursor.get("tail"), list)
+    )
+    try:
+        with path.open("rb") as handle:
+            # A truncated-and-rewritten file keeps its inode; the leading bytes catch that case.
+            head = handle.read(EVENTS_HEAD_BYTES).decode("latin-1")
+            if resumable and not head.startswith(str(cursor.get("head") or "")):
+                resumable = False
+            if resumable and offset == stat_result.st_size:
+                return cursor
+            start = int(offset) if resumable else 0
+            handle.seek(start)
+            chunk = handle.read()
+    except OSError:
+        return None
+    tail: List[Dict[str, object]] = list(cursor.get("tail") or []) if resumable else []
+    complete = chunk.rfind(b"\n") + 1
     events: List[Dict[str, object]] = []
-    for raw in lines:
+    for raw in chunk[:complete].decode("utf-8", errors="replace").splitlines():
         if not raw.strip():
             continue
         try:
@@ -169,11 +215,80 @@ def _collect_events(root: Path, ticket: str, limit: int = EVENTS_LIMIT) -> List[
             continue
         if isinstance(payload, dict):
             events.append(payload)
+    if collapse:
+        artifact_truth.extend_collapsed_events(tail, events)
+    else:
+        tail.extend(events)
+    return {
+        "inode": stat_result.st_ino,
+        "offset": start + complete,
+        "head": head,
+        "collapse": collapse,
+        "window": window,
+        "tail": tail[-window:],
+    }
+
+
+def _collect_events(
+    root: Path,
+    ticket: str,
+    limit: int = EVENTS_LIMIT,
+    *,
+    cache: Optional[Dict[str, object]] = None,
+) -> List[Dict[str, object]]:
+    path = root / "reports" / "events" / f"{ticket}.jsonl"
+    if not path.exists() or limit <= 0:
+        return []
     policy = artifact_truth.load_artifact_truth_config(root)
-    events = artifact_truth.collapse_events(events, enabled=bool(policy.get("collapse_event_noise", True)))
-    if limit <= 0:
+    collapse = bool(policy.get("collapse_event_noise", True))
+    state = cache if cache is not None else {}
+    cursor = state.get("events") if isinstance(state.get("events"), dict) else {}
+    # One extra collapsed entry lets the oldest visible event keep absorbing repeats.
+    updated = _tail_events(path, cursor, collapse=collapse, window=max(limit, EVENTS_LIMIT) + 1)
+    if updated is None:
         return []
-    return events[-max(limit, 0):]
+    state["events"] = updated
+    tail = list(updated.get("tail") or [])
+    if collapse:
+        tail = artifact_truth.finalize_collapsed_events(tail)
+    return tail[-limit:]
+
+
+def _sections_fingerprint(root: Path, ticket: str) -> List[object]:
+    """mtime/size of the files and report directories the artifact/report/check sections depend on."""
+    paths = [
+        root / "docs" / "prd" / f"{ticket}.prd.md",
+        root / "docs" / "plan" / f"{ticket}.md",
+        root / "docs" / "research" / f"{ticket}.md",
+        root / "docs" / "tasklist" / f"{ticket}.md",
+        root / "reports" / "research",
+        root / "reports" / "prd",
+        root / "reports" / "qa",
+        root / "reports" / "context",
+        root / "reports" / "reviewer",
+        root / "reports" / "tests",
+        root / "reports" / "reviewer" / ticket,
+        root / "reports" / "tests" / ticket,
+        root / "reports" / "prd" / f"{ticket}.json",
+        root / "reports" / "prd" / f"{ticket}.pack.json",
+        root / "reports" / "qa" / f"{ticket}.json",
+        root / "reports" / "qa" / f"{ticket}.pack.json",
+        root / "reports" / "reviewer" / f"{ticket}.json",
+    ]
+    fingerprint: List[object] = []
+    for path in paths:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append([stat_result.st_mtime_ns, stat_result.st_size])
+    return fingerprint
+
+
+def _fingerprint_is_racy(fingerprint: List[object]) -> bool:
+    now = time.time_ns()
+    return any(isinstance(entry, list) and now - entry[0] < RACY_WINDOW_NS for entry in fingerprint)
 
 
 def _find_report_variant(report_path: Path) -> Optional[Path]:
@@ -245,20 +360,23 @@ def build_index(root: Path, ticket: str, slug: str) -> Dict[str, object]:
     tasklist_text = _read_text(tasklist_path)
     prd_text = _read_text(prd_path)
 
-    next3 = _extract_section(tasklist_text, "AIDD:NEXT_3")
-    open_questions = _extract_section(tasklist_text, "AIDD:OPEN_QUESTIONS")
+    tasklist_outline = md_outline.parse_outline(tasklist_text.encode("utf-8"))
+    prd_outline = md_outline.parse_outline(prd_text.encode("utf-8"))
+
+    next3 = _extract_section(tasklist_text, "AIDD:NEXT_3", tasklist_outline)
+    open_questions = _extract_section(tasklist_text, "AIDD:OPEN_QUESTIONS", tasklist_outline)
     open_questions_source = "tasklist"
     if not open_questions:
-        open_questions = _extract_section(prd_text, "AIDD:OPEN_QUESTIONS")
+        open_questions = _extract_section(prd_text, "AIDD:OPEN_QUESTIONS", prd_outline)
         if open_questions:
             open_questions_source = "prd:aidd_open_questions"
     if not open_questions:
         open_questions_source = "none"
-    risks_top5 = _extract_section(tasklist_text, "AIDD:RISKS")
+    risks_top5 = _extract_section(tasklist_text, "AIDD:RISKS", tasklist_outline)
     if not risks_top5:
-        risks_top5 = _extract_section(prd_text, "AIDD:RISKS")
+        risks_top5 = _extract_section(prd_text, "AIDD:RISKS", prd_outline)
 
-    context_pack = _extract_section(tasklist_text, "AIDD:CONTEXT_PACK")
+    context_pack = _extract_section(tasklist_text, "AIDD:CONTEXT_PACK", tasklist_outline)
     summary = _first_nonempty(context_pack)
     if not summary:
         for line in prd_text.splitlines():
@@ -268,7 +386,27 @@ def build_index(root: Path, ticket: str, slug: str) -> Dict[str, object]:
     if not summary:
         summary = f"{ticket}"
 
-    reports = _collect_reports(root, ticket)
+    cache = _load_index_cache(root, ticket)
+    fingerprint = _sections_fingerprint(root, ticket)
+    sections = cache.get("sections") if isinstance(cache.get("sections"), dict) else {}
+    changed = False
+    if sections.get("fingerprint") != fingerprint:
+        sections = {
+            "fingerprint": fingerprint,
+            "artifacts": _collect_artifacts(root, ticket),
+            "reports": _collect_reports(root, ticket),
+            "checks": _collect_checks(root, ticket),
+        }
+        # A source rewritten within the racy window may change again without moving its
+        # mtime/size, so such sections are used for this call but not stored.
+        if not _fingerprint_is_racy(fingerprint):
+            cache["sections"] = sections
+            changed = True
+    events_cursor = cache.get("events")
+    events = _collect_events(root, ticket, cache=cache)
+    if changed or cache.get("events") != events_cursor:
+        _write_index_cache(root, ticket, cache)
+    reports = list(sections.get("reports") or [])
     truth = artifact_truth.evaluate_artifact_truth(
         root,
         ticket,
@@ -283,15 +421,15 @@ def build_index(root: Path, ticket: str, slug: str) -> Dict[str, object]:
         "stage": _detect_stage(root),
         "updated": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "summary": summary,
-        "artifacts": _collect_artifacts(root, ticket),
+        "artifacts": list(sections.get("artifacts") or []),
         "reports": reports,
         "next3": next3,
         "open_questions": open_questions,
         "open_questions_source": open_questions_source,
         "risks_top5": risks_top5,
-        "checks": _collect_checks(root, ticket),
+        "checks": list(sections.get("checks") or []),
         "context_pack": context_pack,
-        "events": _collect_events(root, ticket),
+        "events": events,
         "doc_statuses": truth.get("doc_statuses") or {},
         "expected_reports": truth.get("expected_reports") or [],
         "missing_expected_reports": truth.get("missing_expected_reports") or [],
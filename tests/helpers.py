@@ -236,6 +236,23 @@ def hook_path(name: str) -> pathlib.Path:
     return HOOKS_DIR / name
 
 
+def plugin_hook_commands(event: str) -> list[dict[str, Any]]:
+    """Hook entries registered for ``event``; the stop cascade is expanded into the gate scripts it runs."""
+    from hooks import stop_cascade
+
+    hooks = json.loads((HOOKS_DIR / "hooks.json").read_text(encoding="utf-8"))
+    expanded: list[dict[str, Any]] = []
+    for entry in hooks.get("hooks", {}).get(event, []):
+        for hook in entry.get("hooks", []):
+            command = str(hook.get("command", ""))
+            if "stop-cascade.sh" not in command:
+                expanded.append(hook)
+                continue
+            for gate in stop_cascade.GATES:
+                expanded.append({**hook, "command": command.replace("stop-cascade.sh", gate.script), "gate": gate})
+    return expanded
+
+
 def _project_root(base: pathlib.Path) -> pathlib.Path:
     """Return the project root inside the workspace (always <workspace>/aidd)."""
     if base.name == PROJECT_SUBDIR:
@@ -666,8 +683,10 @@ def cli_cmd(*args: str) -> list[str]:
         }
         observability_runtime_map = {
             "dag-export": "dag_export.py",
+            "context-snapshots-prune": "context_snapshots_prune.py",
             "doctor": "doctor.py",
             "identifiers": "identifiers.py",
+            "loop-telemetry-report": "loop_telemetry_report.py",
             "tests-log": "tests_log.py",
             "tools-inventory": "tools_inventory.py",
         }
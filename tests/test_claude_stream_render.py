@@ -0,0 +1,80 @@
+import io
+import json
+import unittest
+
+from aidd_runtime import claude_stream_render
+
+
+class _CountingWriter(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def _delta(text: str) -> str:
+    return json.dumps({"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}})
+
+
+class ClaudeStreamRenderTests(unittest.TestCase):
+    def test_sniff_kind_reads_leading_type_only(self) -> None:
+        self.assertEqual(claude_stream_render.sniff_kind('{"type":"ping"}'), "ping")
+        self.assertEqual(claude_stream_render.sniff_kind(' { "type" : "message_stop" }'), "message_stop")
+        self.assertEqual(claude_stream_render.sniff_kind('{"delta":{"type":"text_delta"},"type":"x"}'), "")
+
+    def test_skipped_kinds_render_nothing_but_truncated_lines_still_fail_strict(self) -> None:
+        writer = io.StringIO()
+        state = claude_stream_render.RenderState()
+        for line in (
+            '{"type":"ping"}',
+            '{"type":"message_delta","delta":{"stop_reason":"end_turn"},"usage":{"output_tokens":3}}',
+            '{"type":"user","message":{"content":[{"type":"tool_result","content":"' + "x" * 5000 + '"}]}}',
+        ):
+            self.assertTrue(
+                claude_stream_render.render_line(line, writer=writer, mode="text+tools", strict=True, state=state)
+            )
+        self.assertEqual(writer.getvalue(), "")
+        warn = io.StringIO()
+        ok = claude_stream_render.render_line(
+            '{"type":"user","message":{"content":[', writer=writer, mode="text-only", strict=True, warn_stream=warn
+        )
+        self.assertFalse(ok)
+        self.assertIn("invalid json line", warn.getvalue())
+
+    def test_batched_state_flushes_on_interval_boundaries_and_markers(self) -> None:
+        writer = _CountingWriter()
+        state = claude_stream_render.RenderState(flush_interval=3600, last_flush=0.0)
+        state.last_flush = float("inf")
+        for text in ("Hello ", "wor", "ld"):
+            claude_stream_render.render_line(_delta(text), writer=writer, mode="text+tools", strict=False, state=state)
+        self.assertEqual(writer.flushes, 0)
+        claude_stream_render.render_line(
+            '{"type":"content_block_stop","index":0}', writer=writer, mode="text+tools", strict=False, state=state
+        )
+        self.assertEqual(writer.flushes, 1)
+        tool = {"type": "content_block_start", "content_block": {"type": "tool_use", "name": "Bash", "input": {}}}
+        claude_stream_render.render_line(json.dumps(tool), writer=writer, mode="text+tools", strict=False, state=state)
+        self.assertEqual(writer.flushes, 2)
+        self.assertEqual(writer.getvalue(), "Hello world\n[tool:start] Bash\n")
+
+    def test_default_state_flushes_every_rendered_line(self) -> None:
+        writer = _CountingWriter()
+        for text in ("a", "b"):
+            claude_stream_render.render_line(_delta(text), writer=writer, mode="text-only", strict=False)
+        self.assertEqual(writer.flushes, 2)
+        self.assertEqual(writer.getvalue(), "ab")
+
+    def test_shorten_caps_huge_tool_payloads(self) -> None:
+        args = {"command": "cat", "files": [f"src/file_{idx}.py" for idx in range(100000)], "note": "y" * 10**6}
+        short = claude_stream_render._shorten(args)
+        full = " ".join(json.dumps(args, ensure_ascii=False).splitlines()).strip()
+        self.assertEqual(short, full[: claude_stream_render.MAX_ARG_CHARS - 3] + "...")
+        self.assertEqual(claude_stream_render._shorten("  a\r\nb  "), "a b")
+        self.assertEqual(claude_stream_render._shorten("a" + " " * 1000), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
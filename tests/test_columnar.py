@@ -0,0 +1,45 @@
+import unittest
+
+from aidd_runtime import columnar
+
+
+class ColumnarTableTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.section = {
+            "cols": ["id", "severity", "title", "scope"],
+            "rows": [
+                ["f-1", "major", "Missing tests", "tests"],
+                "not-a-row",
+                [],
+                ["f-2", "minor"],
+                ["f-3", "blocker", "Crash", "api"],
+            ],
+        }
+
+    def test_rows_are_mapping_views_over_packed_arrays(self) -> None:
+        table = columnar.ColumnarTable.from_section(self.section)
+        self.assertIsNotNone(table)
+        rows = list(table)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(rows[0]["title"], "Missing tests")
+        self.assertEqual(rows[1], {"id": "f-2", "severity": "minor"})
+        self.assertIsNone(rows[1].get("title"))
+        self.assertNotIn("scope", rows[1])
+        self.assertEqual(table.to_dicts()[2], {"id": "f-3", "severity": "blocker", "title": "Crash", "scope": "api"})
+
+    def test_columns_projections_and_filters(self) -> None:
+        table = columnar.ColumnarTable.from_section(self.section)
+        self.assertEqual(list(table.column("scope")), ["tests", None, "api"])
+        self.assertEqual(list(table.project("id", "missing")), [("f-1", None), ("f-2", None), ("f-3", None)])
+        blocking = table.where("severity", lambda value: value in {"blocker", "critical"})
+        self.assertEqual([row["id"] for row in blocking], ["f-3"])
+
+    def test_iter_records_accepts_plain_lists_and_rejects_other_shapes(self) -> None:
+        self.assertEqual([row["id"] for row in columnar.iter_records(self.section)], ["f-1", "f-2", "f-3"])
+        self.assertEqual(list(columnar.iter_records([{"id": "a"}, "skip"])), [{"id": "a"}])
+        self.assertEqual(list(columnar.iter_records({"id": "a"})), [])
+        self.assertIsNone(columnar.ColumnarTable.from_section({"cols": ["id"], "rows": "x"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
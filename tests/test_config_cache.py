@@ -0,0 +1,64 @@
+import copy
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from aidd_runtime import config_cache, gates
+
+
+class ConfigCacheTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        config_cache.clear()
+
+    def test_parses_once_and_reloads_after_edit(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="config-cache-") as tmpdir:
+            root = Path(tmpdir)
+            path = root / "config" / "gates.json"
+            path.parent.mkdir(parents=True)
+            self.assertEqual(config_cache.gates_config(root), {})
+
+            path.write_text(json.dumps({"qa": {"tests": {"commands": [["pytest"]]}}}), encoding="utf-8")
+            first = config_cache.gates_config(root)
+            self.assertIs(first, gates.load_gates_config(root))
+            self.assertIsInstance(first["qa"], dict)
+            with self.assertRaises(TypeError):
+                first["qa"]["enabled"] = False
+            with self.assertRaises(TypeError):
+                first["qa"]["tests"]["commands"].append(["ruff"])
+            thawed = copy.deepcopy(first)
+            thawed["qa"]["enabled"] = False
+            self.assertNotIn("enabled", first["qa"])
+
+            path.write_text(json.dumps({"qa": {"enabled": True}}), encoding="utf-8")
+            stat_result = path.stat()
+            os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+            self.assertEqual(config_cache.gates_config(root), {"qa": {"enabled": True}})
+
+    def test_same_size_rewrite_within_timestamp_tick_is_detected(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="config-cache-") as tmpdir:
+            path = Path(tmpdir) / "conventions.json"
+            path.write_text('{"a": 1}', encoding="utf-8")
+            stat_result = path.stat()
+            self.assertEqual(config_cache.load_json(path), {"a": 1})
+            path.write_text('{"a": 2}', encoding="utf-8")
+            os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+            self.assertEqual(config_cache.load_json(path), {"a": 2})
+
+    def test_parse_errors_are_reported_until_fixed(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="config-cache-") as tmpdir:
+            root = Path(tmpdir)
+            path = root / "config" / "gates.json"
+            path.parent.mkdir(parents=True)
+            path.write_text("{broken", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                gates.load_gates_config(root)
+            with self.assertRaises(ValueError):
+                gates.load_gates_config(root)
+            path.write_text('{"ok": true}', encoding="utf-8")
+            self.assertEqual(gates.load_gates_config(root), {"ok": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,9 @@ import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from aidd_runtime import context_expand
 from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_active_state, write_json, write_tasklist_ready
 
 
@@ -148,6 +150,14 @@ class ContextExpandTests(unittest.TestCase):
             self.assertTrue(entries)
             self.assertEqual(entries[-1].get("stage"), "review")
 
+    def test_regenerate_loop_pack_reports_unexpected_errors_as_failure(self) -> None:
+        with mock.patch.object(context_expand.loop_pack, "generate_loop_pack", side_effect=KeyError("scope")):
+            ok, message = context_expand._regenerate_loop_pack(
+                Path("."), ticket="DEMO-1", stage="implement", work_item_key="iteration_id=I1"
+            )
+        self.assertFalse(ok)
+        self.assertIn("scope", message)
+
     def test_context_expand_blocks_when_loop_pack_regeneration_fails(self) -> None:
         with tempfile.TemporaryDirectory(prefix="context-expand-fail-") as tmpdir:
             root = ensure_project_root(Path(tmpdir))
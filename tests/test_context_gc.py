@@ -181,6 +181,40 @@ class WorkingSetBuilderTests(unittest.TestCase):
             self.assertIn("- Branch:", ws.text)
             self.assertIn("- Dirty files: 1", ws.text)
 
+    def test_working_set_builder_reuses_cached_sections(self) -> None:
+        if shutil.which("git") is None:
+            self.skipTest("git not available")
+        with tempfile.TemporaryDirectory(prefix="context-gc-") as tmpdir:
+            root = Path(tmpdir)
+            git_init(root)
+            git_config_user(root)
+            write_active_feature(root, "demo-ticket")
+            (root / "README.md").write_text("hello\n", encoding="utf-8")
+            subprocess.run(["git", "add", "README.md"], cwd=root, check=True, capture_output=True)
+            subprocess.run(["git", "commit", "-m", "init"], cwd=root, check=True, capture_output=True)
+            tasklist = write_file(root, "docs/tasklist/demo-ticket.md", "- [ ] Task A\n")
+            write_json(root, "config/context_gc.json", {"working_set": {"include_git_status": True}})
+
+            first = working_set_builder.build_working_set(root)
+            self.assertIn("#### Repo state", first.text)
+            self.assertTrue((root / "aidd" / ".cache" / "working_set.json").exists())
+
+            with mock.patch.object(working_set_builder, "_run_git") as run_git, mock.patch.object(
+                working_set_builder, "git_current_branch"
+            ) as branch:
+                tasklist.write_text("- [ ] Task A\n- [ ] Task B\n", encoding="utf-8")
+                second = working_set_builder.build_working_set(root)
+            run_git.assert_not_called()
+            branch.assert_not_called()
+            self.assertIn("- [ ] Task B", second.text)
+            self.assertIn("#### Repo state", second.text)
+
+            subprocess.run(["git", "add", "aidd"], cwd=root, check=True, capture_output=True)
+            with mock.patch.object(working_set_builder, "_run_git", return_value="A  aidd/x") as run_git:
+                third = working_set_builder.build_working_set(root)
+            run_git.assert_called_once()
+            self.assertIn("- Dirty files: 1", third.text)
+
     def test_working_set_builder_includes_context_pack(self) -> None:
         with tempfile.TemporaryDirectory(prefix="context-gc-") as tmpdir:
             root = Path(tmpdir)
@@ -959,6 +993,9 @@ class PreCompactSnapshotTests(unittest.TestCase):
             self.assertTrue(session_path.exists())
             self.assertTrue(ticket_path.exists())
             self.assertTrue(latest_ticket.exists())
+            self.assertTrue(os.path.samefile(session_path, ticket_path))
+            self.assertTrue(os.path.samefile(session_path, latest_ticket))
+            self.assertTrue((session_path.parent / "manifest.json").exists())
 
     def test_precompact_snapshot_reads_env_payload(self) -> None:
         with tempfile.TemporaryDirectory(prefix="context-gc-") as tmpdir:
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from aidd_runtime.reports import context_snapshots
+from tests.helpers import cli_cmd, cli_env, ensure_project_root
+
+
+class ContextSnapshotStoreTests(unittest.TestCase):
+    def test_session_and_ticket_views_share_one_blob(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="context-snapshots-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            base = context_snapshots.context_dir(root)
+            files = {"working_set.md": b"# Working set\n", "precompact_meta.json": b"{}"}
+            session = base / "session-1"
+            ticket = base / "by-ticket" / "DEMO-1" / "session-1"
+            context_snapshots.write_snapshot(root, session, files, meta={"ticket": "DEMO-1"})
+            context_snapshots.write_snapshot(root, ticket, files, meta={"ticket": "DEMO-1"})
+            context_snapshots.write_file(root, base / "latest_working_set.md", files["working_set.md"])
+
+            blobs = sorted(path for path in context_snapshots.objects_dir(root).glob("??/*"))
+            self.assertEqual(len(blobs), 2)
+            self.assertTrue(os.path.samefile(session / "working_set.md", ticket / "working_set.md"))
+            self.assertTrue(os.path.samefile(session / "working_set.md", base / "latest_working_set.md"))
+            self.assertEqual((ticket / "working_set.md").read_bytes(), b"# Working set\n")
+            manifest = context_snapshots.load_manifest(ticket)
+            self.assertEqual(manifest["files"]["working_set.md"]["size"], len(files["working_set.md"]))
+
+    def test_prune_drops_old_snapshots_and_unreferenced_blobs(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="context-snapshots-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            base = context_snapshots.context_dir(root)
+            old = base / "session-old"
+            new = base / "session-new"
+            context_snapshots.write_snapshot(root, old, {"working_set.md": b"old\n"}, meta={})
+            context_snapshots.write_snapshot(root, new, {"working_set.md": b"new\n"}, meta={})
+            context_snapshots.write_file(root, base / "latest_working_set.md", b"latest\n")
+            legacy = base / "session-legacy"
+            legacy.mkdir()
+            (legacy / "precompact_meta.json").write_text("{}", encoding="utf-8")
+            stale = time.time() - 30 * 86400
+            for path in (old / "manifest.json", legacy / "precompact_meta.json"):
+                os.utime(path, (stale, stale))
+
+            preview = context_snapshots.prune(root, max_age_days=7, dry_run=True)
+            self.assertEqual(preview.removed_snapshots, ["session-legacy", "session-old"])
+            self.assertTrue(old.exists())
+
+            result = subprocess.run(
+                cli_cmd("context-snapshots-prune", "--max-age-days", "7", "--format", "json"),
+                cwd=root,
+                text=True,
+                capture_output=True,
+                env=cli_env(),
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            report = json.loads(result.stdout)
+            self.assertEqual(report["removed_snapshots"], ["session-legacy", "session-old"])
+            self.assertEqual(report["removed_blobs"], 1)
+            self.assertFalse(old.exists())
+            self.assertEqual((new / "working_set.md").read_text(encoding="utf-8"), "new\n")
+            self.assertEqual((base / "latest_working_set.md").read_text(encoding="utf-8"), "latest\n")
+            self.assertEqual(len(list(context_snapshots.objects_dir(root).glob("??/*"))), 2)
+
+            trimmed = context_snapshots.prune(root, max_bytes=1)
+            self.assertEqual(trimmed.removed_snapshots, ["session-new"])
+            self.assertEqual(trimmed.kept_snapshots, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
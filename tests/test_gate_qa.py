@@ -5,7 +5,7 @@ from pathlib import Path
 
 from aidd_runtime import qa as qa_tools
 
-from .helpers import HOOKS_DIR, ensure_gates_config, run_hook, write_active_feature, write_active_stage, write_file
+from .helpers import HOOKS_DIR, ensure_gates_config, plugin_hook_commands, run_hook, write_active_feature, write_active_stage, write_file
 
 SRC_PAYLOAD = '{"tool_input":{"file_path":"src/main/App.kt"}}'
 
@@ -410,16 +410,12 @@ def test_debounce_stamp_written_only_on_success(tmp_path):
 
 def test_plugin_hooks_include_qa_gate():
     hooks = json.loads((HOOKS_DIR / "hooks.json").read_text(encoding="utf-8"))
-    stop_hooks = hooks.get("hooks", {}).get("Stop", [])
-    sub_stop_hooks = hooks.get("hooks", {}).get("SubagentStop", [])
-    commands = [
-        hook
-        for entry in stop_hooks + sub_stop_hooks
-        for hook in entry.get("hooks", [])
-    ]
+    assert hooks.get("hooks", {}).get("Stop"), "Stop hooks missing"
+    commands = plugin_hook_commands("Stop") + plugin_hook_commands("SubagentStop")
     qa_hook = next((hook for hook in commands if "gate-qa.sh" in hook.get("command", "")), None)
     assert qa_hook is not None, "gate-qa hook not registered in Stop/SubagentStop"
-    assert qa_hook.get("timeout") == 60, "gate-qa expected timeout=60s"
+    assert not qa_hook["gate"].parallel, "gate-qa writes reports and must run sequentially"
+    assert qa_hook.get("timeout", 0) >= 60 + 900, "Stop cascade must leave gate-qa its 60s next to format-and-test"
 
 
 def test_gate_qa_requires_plugin_root(tmp_path):
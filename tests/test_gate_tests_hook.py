@@ -1,10 +1,11 @@
 import json
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
 
-from .helpers import HOOKS_DIR, ensure_gates_config, run_hook, write_active_feature, write_active_stage, write_file
-from .helpers import write_json
+from .helpers import ensure_gates_config, plugin_hook_commands, run_hook, write_active_feature, write_active_stage, write_file
+from .helpers import git_config_user, git_init, write_json
 
 SRC_PAYLOAD = '{"tool_input":{"file_path":"src/main/kotlin/service/RuleEngine.kt"}}'
 DOC_PAYLOAD = '{"tool_input":{"file_path":"docs/readme.md"}}'
@@ -115,6 +116,53 @@ def test_warns_when_source_outside_rlm_targets(tmp_path):
     assert "не входит в список Researcher targets" in (result.stdout or "")
 
 
+def test_uses_cached_git_test_index(tmp_path):
+    git_init(tmp_path)
+    git_config_user(tmp_path)
+    ensure_gates_config(tmp_path, {"tests_required": "hard"})
+    write_active_stage(tmp_path, "review")
+    write_file(tmp_path, "src/main/kotlin/service/RuleEngine.kt", "class RuleEngine")
+    test_file = write_file(tmp_path, "src/test/kotlin/service/RuleEngineTest.kt", "class RuleEngineTest")
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True, capture_output=True)
+
+    result = run_hook(tmp_path, "gate-tests.sh", SRC_PAYLOAD)
+    assert result.returncode == 0, result.stderr
+    cache = json.loads((tmp_path / "aidd" / ".cache" / "gate-tests.index.json").read_text(encoding="utf-8"))
+    assert "src/test/kotlin/service/RuleEngineTest.kt" in cache["files"]
+    assert all(not item.startswith("src/main/") for item in cache["files"])
+
+    test_file.unlink()
+    result = run_hook(tmp_path, "gate-tests.sh", SRC_PAYLOAD)
+    assert result.returncode == 2
+    assert "нет теста" in (result.stderr or "")
+
+
+def test_git_test_index_includes_untracked_tests(tmp_path):
+    git_init(tmp_path)
+    ensure_gates_config(tmp_path, {"tests_required": "hard"})
+    write_active_stage(tmp_path, "review")
+    write_file(tmp_path, "src/main/kotlin/service/RuleEngine.kt", "class RuleEngine")
+
+    result = run_hook(tmp_path, "gate-tests.sh", SRC_PAYLOAD)
+    assert result.returncode == 2
+
+    write_file(tmp_path, "src/test/kotlin/service/RuleEngineTest.kt", "class RuleEngineTest")
+    result = run_hook(tmp_path, "gate-tests.sh", SRC_PAYLOAD)
+    assert result.returncode == 0, result.stderr
+
+
+
+def test_gitignored_test_file_still_counts(tmp_path):
+    git_init(tmp_path)
+    ensure_gates_config(tmp_path, {"tests_required": "hard"})
+    write_active_stage(tmp_path, "review")
+    write_file(tmp_path, ".gitignore", "src/test/\n")
+    write_file(tmp_path, "src/main/kotlin/service/RuleEngine.kt", "class RuleEngine")
+    write_file(tmp_path, "src/test/kotlin/service/RuleEngineTest.kt", "class RuleEngineTest")
+
+    result = run_hook(tmp_path, "gate-tests.sh", SRC_PAYLOAD)
+    assert result.returncode == 0, result.stderr
+
 def test_gate_tests_requires_plugin_root(tmp_path):
     ensure_gates_config(tmp_path, {"tests_required": "hard"})
     project_root = tmp_path / "aidd"
@@ -130,17 +178,8 @@ def test_gate_tests_requires_plugin_root(tmp_path):
     assert "CLAUDE_PLUGIN_ROOT is required" in result.stderr
 
 def test_plugin_hooks_include_tests_and_post_hooks():
-    hooks = json.loads((HOOKS_DIR / "hooks.json").read_text(encoding="utf-8"))
-    stop_cmds = [
-        hook.get("command", "")
-        for entry in hooks.get("hooks", {}).get("Stop", [])
-        for hook in entry.get("hooks", [])
-    ]
-    sub_stop_cmds = [
-        hook.get("command", "")
-        for entry in hooks.get("hooks", {}).get("SubagentStop", [])
-        for hook in entry.get("hooks", [])
-    ]
+    stop_cmds = [hook.get("command", "") for hook in plugin_hook_commands("Stop")]
+    sub_stop_cmds = [hook.get("command", "") for hook in plugin_hook_commands("SubagentStop")]
     assert any("gate-tests.sh" in cmd for cmd in stop_cmds + sub_stop_cmds), (
         "gate-tests missing in Stop/SubagentStop"
     )
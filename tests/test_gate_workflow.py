@@ -10,6 +10,7 @@ from .helpers import (
     ensure_project_root,
     git_config_user,
     git_init,
+    plugin_hook_commands,
     run_hook,
     tasklist_ready_text,
     write_active_feature,
@@ -73,11 +74,7 @@ def _plugin_hooks():
 
 
 def _has_command(hooks: dict, event: str, needle: str) -> bool:
-    return any(
-        needle in hook.get("command", "")
-        for entry in hooks.get("hooks", {}).get(event, [])
-        for hook in entry.get("hooks", [])
-    )
+    return any(needle in hook.get("command", "") for hook in plugin_hook_commands(event))
 
 
 def _timestamp() -> str:
@@ -576,6 +573,29 @@ def test_prd_draft_blocks_even_with_reviewed_research(tmp_path):
     assert "draft" in combined or "готов" in combined
 
 
+def test_gate_verdicts_replay_until_inputs_change(tmp_path):
+    ticket = "demo-checkout"
+    write_file(tmp_path, "src/main/kotlin/App.kt", "class App")
+    write_active_feature(tmp_path, ticket)
+    write_prd_with_status(tmp_path, ticket, "draft", research_status="reviewed")
+    write_plan_with_review(tmp_path, ticket)
+    write_tasklist_ready(tmp_path, ticket)
+    cache_path = ensure_project_root(tmp_path) / ".cache" / "gates" / f"{ticket}.json"
+
+    first = run_hook(tmp_path, "gate-workflow.sh", SRC_PAYLOAD)
+    assert first.returncode == 2
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["gates"]["analyst"]["verdict"]["status"] == 2
+
+    second = run_hook(tmp_path, "gate-workflow.sh", SRC_PAYLOAD)
+    assert (second.returncode, second.stderr) == (first.returncode, first.stderr)
+
+    write_file(tmp_path, f"docs/prd/{ticket}.prd.md", approved_prd(ticket))
+    run_hook(tmp_path, "gate-workflow.sh", SRC_PAYLOAD)
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["gates"]["analyst"]["verdict"]["status"] == 0
+
+
 def test_idea_new_flow_creates_active_in_aidd_and_blocks_until_ready(tmp_path):
     ticket = "demo-thin"
     project_root = tmp_path / "aidd"
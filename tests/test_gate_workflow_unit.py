@@ -4,6 +4,8 @@ from pathlib import Path
 
 from hooks import gate_workflow
 
+from .helpers import ensure_project_root, write_file
+
 
 def _write_tasklist(tmp_path: Path, text: str) -> Path:
     path = tmp_path / "tasklist.md"
@@ -30,3 +32,17 @@ def test_next3_has_real_items_rejects_placeholders(tmp_path: Path) -> None:
         "## AIDD:NEXT_3\n- [ ] <1. task>\n",
     )
     assert gate_workflow._next3_has_real_items(path) is False
+
+
+def test_plan_review_gate_resolves_root_without_cwd(tmp_path: Path, monkeypatch) -> None:
+    root = ensure_project_root(tmp_path / "project")
+    ticket = "DEMO-CWD"
+    write_file(root, f"docs/plan/{ticket}.md", "# Plan\n\n## Plan Review\nStatus: READY\n")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    status, output = gate_workflow._run_plan_review_gate(root, ticket, "src/app.py", "")
+
+    assert (status, output) == (0, "")
+    assert Path.cwd() == elsewhere
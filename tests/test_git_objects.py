@@ -0,0 +1,85 @@
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aidd_runtime import git_objects
+from tests.helpers import git_config_user, git_init
+
+
+class GitObjectsTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        git_objects.reset()
+
+    def test_reader_serves_head_blobs_trees_and_branch_over_one_pipe(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="git-objects-") as tmpdir:
+            repo = Path(tmpdir)
+            git_init(repo)
+            git_config_user(repo)
+            subprocess.run(["git", "checkout", "-q", "-b", "feature/x"], cwd=repo, check=True)
+            self.assertFalse(git_objects.has_head(repo))
+            self.assertEqual(git_objects.current_branch(repo), "")
+
+            (repo / "docs").mkdir()
+            (repo / "docs" / "tasklist.md").write_text("- [ ] one\n", encoding="utf-8")
+            (repo / "README.md").write_text("héllo\n", encoding="utf-8")
+            subprocess.run(["git", "add", "."], cwd=repo, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True)
+            (repo / "docs" / "tasklist.md").write_text("- [x] one\n", encoding="utf-8")
+
+            self.assertTrue(git_objects.has_head(repo))
+            self.assertEqual(git_objects.current_branch(repo), "feature/x")
+            self.assertEqual(git_objects.read_head_text(repo / "docs", Path("tasklist.md")), "- [ ] one\n")
+            self.assertEqual(git_objects.read_head_text(repo, Path("README.md")), "héllo\n")
+            self.assertIsNone(git_objects.read_head_text(repo, Path("missing.md")))
+
+            reader = git_objects.reader(repo)
+            self.assertIs(reader, git_objects.reader(repo / "docs"))
+            entries = {entry.name: entry.kind for entry in reader.tree("HEAD")}
+            self.assertEqual(entries, {"README.md": "blob", "docs": "tree"})
+            self.assertEqual([entry.name for entry in reader.tree("HEAD:docs")], ["tasklist.md"])
+            self.assertEqual(reader.info("HEAD:README.md").size, len("héllo\n".encode("utf-8")))
+            self.assertFalse(reader.exists("HEAD:nope"))
+            batch_pid = reader._batch.pid
+            self.assertIsNotNone(reader.read("HEAD:README.md"))
+            self.assertEqual(reader._batch.pid, batch_pid)
+
+    def test_non_repository_yields_empty_answers(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="git-objects-") as tmpdir:
+            root = Path(tmpdir)
+            self.assertIsNone(git_objects.toplevel(root))
+            self.assertIsNone(git_objects.reader(root))
+            self.assertIsNone(git_objects.read_head_text(root, Path("a.md")))
+            self.assertFalse(git_objects.has_head(root))
+
+
+    def test_stalled_pipe_and_malformed_data_yield_none(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="git-objects-") as tmpdir:
+            root = Path(tmpdir)
+            reader = git_objects.GitObjectReader(root, read_timeout=0.2)
+            stalled = subprocess.Popen(
+                [sys.executable, "-c", "import sys, time; sys.stdin.readline(); time.sleep(30)"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            with mock.patch.object(reader, "_spawn", return_value=stalled):
+                started = time.monotonic()
+                self.assertIsNone(reader.read("HEAD:README.md"))
+            self.assertLess(time.monotonic() - started, 5)
+            self.assertIsNone(reader._batch)
+            self.assertIsNotNone(stalled.poll())
+
+            oid = "ab" * 20
+            for raw in (b"100644 no-nul", b"100644 a.txt\0" + b"\x01" * 5, b"\xff\xfe a\0" + b"\x01" * 20):
+                with mock.patch.object(reader, "read", return_value=(git_objects.ObjectInfo(oid, "tree", len(raw)), raw)):
+                    self.assertIsNone(reader.tree("HEAD"))
+
+            with mock.patch.object(git_objects.subprocess, "run", side_effect=subprocess.TimeoutExpired("git", 3)):
+                self.assertIsNone(git_objects.repo_info(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
 import json
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 from textwrap import dedent
 
+import pytest
+
 from tests.helpers import REPO_ROOT
 
 SRC_ROOT = REPO_ROOT
@@ -265,3 +268,115 @@ def test_index_sync_collapses_repeated_gate_tests_events(tmp_path):
     assert events[0]["repeat_count"] == 2
     assert events[0]["first_seen"] == "2024-01-01T00:00:00Z"
     assert events[0]["last_seen"] == "2024-01-01T00:01:00Z"
+
+
+def _gate_event(ts: str, summary: str = "docs-only skip") -> str:
+    return json.dumps(
+        {
+            "ts": ts,
+            "type": "gate-tests",
+            "status": "warn",
+            "source": "hook gate-tests",
+            "details": {"summary": summary},
+        }
+    )
+
+
+def test_index_sync_folds_appended_events_incrementally(tmp_path):
+    project_root = ensure_project_root(tmp_path)
+    ticket = "DEMO-7"
+    write_active_feature(project_root, ticket)
+    write_file(project_root, f"docs/tasklist/{ticket}.md", "## AIDD:CONTEXT_PACK\n- Demo\n")
+    events_path = project_root / "reports" / "events" / f"{ticket}.jsonl"
+    write_file(project_root, f"reports/events/{ticket}.jsonl", _gate_event("2024-01-01T00:00:00Z") + "\n")
+
+    payload = json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))
+    assert len(payload["events"]) == 1
+    cache = json.loads((project_root / ".cache" / "index" / f"{ticket}.json").read_text(encoding="utf-8"))
+    assert cache["events"]["offset"] == events_path.stat().st_size
+
+    with events_path.open("a", encoding="utf-8") as handle:
+        handle.write(_gate_event("2024-01-01T00:01:00Z") + "\n")
+        handle.write('{"ts": "2024-01-01T00:02:00Z", "type": "prog')
+
+    payload = json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))
+    events = payload["events"]
+    assert len(events) == 1
+    assert events[0]["repeat_count"] == 2
+    assert events[0]["first_seen"] == "2024-01-01T00:00:00Z"
+    assert events[0]["last_seen"] == "2024-01-01T00:01:00Z"
+
+    with events_path.open("a", encoding="utf-8") as handle:
+        handle.write('ress", "status": "ok"}\n')
+
+    events = json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))["events"]
+    assert [item["type"] for item in events] == ["gate-tests", "progress"]
+    assert events[0]["repeat_count"] == 2
+
+
+def test_index_sync_rebuilds_events_after_rotation(tmp_path):
+    project_root = ensure_project_root(tmp_path)
+    ticket = "DEMO-8"
+    write_active_feature(project_root, ticket)
+    write_file(project_root, f"docs/tasklist/{ticket}.md", "## AIDD:CONTEXT_PACK\n- Demo\n")
+    lines = [_gate_event(f"2024-01-01T00:0{idx}:00Z", summary=f"run {idx}") for idx in range(3)]
+    write_file(project_root, f"reports/events/{ticket}.jsonl", "\n".join(lines) + "\n")
+    assert len(json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))["events"]) == 3
+
+    events_path = project_root / "reports" / "events" / f"{ticket}.jsonl"
+    rotated = events_path.with_suffix(".jsonl.new")
+    rotated.write_text(_gate_event("2024-02-01T00:00:00Z", summary="fresh") + "\n", encoding="utf-8")
+    rotated.replace(events_path)
+
+    events = json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))["events"]
+    assert [item["ts"] for item in events] == ["2024-02-01T00:00:00Z"]
+
+
+def test_index_sync_rebuilds_events_after_truncation(tmp_path):
+    project_root = ensure_project_root(tmp_path)
+    ticket = "DEMO-9"
+    write_active_feature(project_root, ticket)
+    write_file(project_root, f"docs/tasklist/{ticket}.md", "## AIDD:CONTEXT_PACK\n- Demo\n")
+    events_path = project_root / "reports" / "events" / f"{ticket}.jsonl"
+    write_file(project_root, f"reports/events/{ticket}.jsonl", _gate_event("2024-01-01T00:00:00Z", summary="old") + "\n")
+    index_sync.write_index(project_root, ticket, ticket)
+
+    with events_path.open("w", encoding="utf-8") as handle:
+        handle.write(_gate_event("2024-03-01T00:00:00Z", summary="new") + "\n")
+        handle.write(_gate_event("2024-03-01T00:01:00Z", summary="newer") + "\n")
+
+    events = json.loads(index_sync.write_index(project_root, ticket, ticket).read_text(encoding="utf-8"))["events"]
+    assert [item["ts"] for item in events] == ["2024-03-01T00:00:00Z", "2024-03-01T00:01:00Z"]
+
+
+def test_index_sync_reuses_cached_sections_until_sources_change(tmp_path, monkeypatch):
+    project_root = ensure_project_root(tmp_path)
+    ticket = "DEMO-9"
+    write_active_feature(project_root, ticket)
+    write_file(project_root, f"docs/tasklist/{ticket}.md", "## AIDD:CONTEXT_PACK\n- Demo\n")
+    qa_report = project_root / "reports" / "qa" / f"{ticket}.json"
+    write_file(project_root, f"reports/qa/{ticket}.json", json.dumps({"status": "READY"}))
+    old = 1_600_000_000
+    for path in (project_root / "docs" / "tasklist" / f"{ticket}.md", qa_report, qa_report.parent):
+        os.utime(path, (old, old))
+
+    first = index_sync.build_index(project_root, ticket, ticket)
+    cache_path = project_root / ".cache" / "index" / f"{ticket}.json"
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cache["sections"]["artifacts"] == first["artifacts"] == [f"aidd/docs/tasklist/{ticket}.md"]
+    assert cache["sections"]["checks"] == first["checks"]
+    assert first["checks"][0]["status"] == "READY"
+
+    os.utime(cache_path, (old, old))
+    monkeypatch.setattr(index_sync, "_collect_artifacts", lambda *_: pytest.fail("artifacts re-collected"))
+    monkeypatch.setattr(index_sync, "_collect_checks", lambda *_: pytest.fail("checks re-collected"))
+    second = index_sync.build_index(project_root, ticket, ticket)
+    assert second["artifacts"] == first["artifacts"]
+    assert second["checks"] == first["checks"]
+    assert cache_path.stat().st_mtime_ns == old * 1_000_000_000
+
+    monkeypatch.undo()
+    qa_report.write_text(json.dumps({"status": "BLOCKED"}), encoding="utf-8")
+    os.utime(qa_report, (old + 60, old + 60))
+    third = index_sync.build_index(project_root, ticket, ticket)
+    assert third["checks"][0]["status"] == "BLOCKED"
@@ -0,0 +1,99 @@
+import json
+import subprocess
+
+from .helpers import ensure_gates_config, git_config_user, git_init, run_hook, write_file
+
+STRICT_ENV = {"AIDD_HOOKS_MODE": "strict"}
+
+
+def _commit_all(path) -> None:
+    subprocess.run(["git", "add", "-A"], cwd=path, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "init"], cwd=path, check=True, capture_output=True)
+
+
+def _setup_workspace(tmp_path, manifest: str, content: str) -> None:
+    git_init(tmp_path)
+    git_config_user(tmp_path)
+    ensure_gates_config(tmp_path, {"deps_allowlist": True})
+    write_file(tmp_path, "config/allowed-deps.txt", "left-pad\n")
+    (tmp_path / manifest).parent.mkdir(parents=True, exist_ok=True)
+    (tmp_path / manifest).write_text(content, encoding="utf-8")
+    _commit_all(tmp_path)
+
+
+def test_warns_only_for_added_package_json_dependencies(tmp_path):
+    _setup_workspace(
+        tmp_path,
+        "web/package.json",
+        json.dumps({"name": "web", "dependencies": {"react": "^18.0.0"}}, indent=2),
+    )
+    (tmp_path / "web" / "package.json").write_text(
+        json.dumps(
+            {
+                "name": "web",
+                "version": "1.0.0",
+                "dependencies": {"left-pad": "1.3.0", "lodash": "^4.0.0", "react": "^18.2.0"},
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert result.returncode == 0, result.stderr
+    assert "dependency 'lodash'" in result.stdout
+    assert "'react'" not in result.stdout
+    assert "'left-pad'" not in result.stdout
+    assert "'version'" not in result.stdout
+
+    cache = json.loads((tmp_path / "aidd" / ".cache" / "lint-deps.json").read_text(encoding="utf-8"))
+    assert cache["entries"]["web/package.json"]["deps"] == ["lodash"]
+
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert "dependency 'lodash'" in result.stdout
+
+
+def test_pyproject_ignores_non_dependency_tables(tmp_path):
+    _setup_workspace(
+        tmp_path,
+        "pyproject.toml",
+        '[project]\nname = "demo"\ndependencies = ["requests>=2"]\n',
+    )
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["requests>=2", "httpx[http2]>=0.27"]\n\n'
+        "[tool.ruff]\nline-length = 100\n",
+        encoding="utf-8",
+    )
+
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert result.returncode == 0, result.stderr
+    assert "dependency 'httpx'" in result.stdout
+    assert "line-length" not in result.stdout
+    assert "'requests'" not in result.stdout
+
+
+def test_line_based_manifests_still_use_diff(tmp_path):
+    _setup_workspace(tmp_path, "requirements.txt", "requests==2.31.0\n")
+    (tmp_path / "requirements.txt").write_text("requests==2.31.0\nflask>=3\nleft-pad\n", encoding="utf-8")
+
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert result.returncode == 0, result.stderr
+    assert "dependency 'flask'" in result.stdout
+    assert "'requests'" not in result.stdout
+    assert "'left-pad'" not in result.stdout
+
+
+def test_untracked_manifests_are_skipped_and_staged_ones_linted_from_toplevel(tmp_path):
+    _setup_workspace(tmp_path, "requirements.txt", "requests==2.31.0\n")
+    (tmp_path / "services").mkdir()
+    (tmp_path / "services" / "requirements.txt").write_text("flask>=3\n", encoding="utf-8")
+    (tmp_path / "aidd" / "requirements.txt").write_text("django>=5\n", encoding="utf-8")
+
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert result.returncode == 0, result.stderr
+    assert "dependency" not in result.stdout
+
+    subprocess.run(["git", "add", "services/requirements.txt"], cwd=tmp_path, check=True, capture_output=True)
+    result = run_hook(tmp_path, "lint-deps.sh", "{}", extra_env=STRICT_ENV)
+    assert "dependency 'flask'" in result.stdout
+    assert "'django'" not in result.stdout
@@ -1,10 +1,12 @@
 import json
+import os
 import re
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
 
+from aidd_runtime import loop_pack
 from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_active_state, write_file
 
 
@@ -494,6 +496,36 @@ class LoopPackTests(unittest.TestCase):
             self.assertEqual(payload.get("work_item_id"), "I1")
             self.assertEqual(payload.get("selection"), "next3")
 
+    def test_generate_loop_pack_in_process_reuses_parsed_tasklist(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-pack-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            seed_loop_pack_fixture(root)
+            tasklist_path = root / "docs" / "tasklist" / "DEMO-1.md"
+
+            result = loop_pack.generate_loop_pack(
+                root, ticket="DEMO-1", stage="implement", work_item="iteration_id=I1", prewarm=False
+            )
+            self.assertEqual(result.exit_code, 0)
+            self.assertTrue(str(result.payload["path"]).endswith("reports/loops/DEMO-1/iteration_id_I1.loop.pack.md"))
+            self.assertIn("[loop-pack] saved", result.message)
+            self.assertFalse((root / "reports" / "loops" / "DEMO-1" / "id_review_F6.loop.pack.md").exists())
+            os.utime(tasklist_path, (1_600_000_000, 1_600_000_000))
+            self.assertIs(loop_pack.load_tasklist(tasklist_path), loop_pack.load_tasklist(tasklist_path))
+
+    def test_load_tasklist_reparses_recent_same_size_rewrites(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-pack-") as tmpdir:
+            tasklist_path = Path(tmpdir) / "DEMO-1.md"
+            tasklist_path.write_text("## AIDD:HANDOFF_INBOX\n- [ ] item\n", encoding="utf-8")
+            before = tasklist_path.stat()
+            first = loop_pack.load_tasklist(tasklist_path)
+
+            tasklist_path.write_text("## AIDD:HANDOFF_INBOX\n- [x] item\n", encoding="utf-8")
+            os.utime(tasklist_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+            second = loop_pack.load_tasklist(tasklist_path)
+
+            self.assertEqual(first.sections["AIDD:HANDOFF_INBOX"], ["## AIDD:HANDOFF_INBOX", "- [ ] item"])
+            self.assertEqual(second.sections["AIDD:HANDOFF_INBOX"], ["## AIDD:HANDOFF_INBOX", "- [x] item"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,10 @@ def _fixture_json(name: str) -> dict:
     return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
 
 
+def _watchdog_fired(reason: str) -> tuple[subprocess.CompletedProcess[str], str]:
+    return subprocess.CompletedProcess(args=["loop-step"], returncode=-15, stdout="", stderr=""), reason
+
+
 class LoopRunTests(unittest.TestCase):
     def test_loop_run_extract_next_action_sanitizes_legacy_alias(self) -> None:
         message = "BLOCK: pending. Next action: `/feature-dev-aidd:tasklist-refiner DEMO-1`."
@@ -1942,6 +1946,229 @@ class LoopRunTests(unittest.TestCase):
             self.assertEqual(payload.get("marker_signal_events"), [])
             self.assertTrue(payload.get("report_noise_events"))
 
+    def _seed_in_process_step(self, root: Path, ticket: str) -> None:
+        self._seed_stage_chain_baseline(root, ticket)
+        write_active_state(root, ticket=ticket, work_item="iteration_id=I1")
+        write_file(
+            root,
+            f"reports/loops/{ticket}/iteration_id_I1/stage.implement.result.json",
+            json.dumps(
+                {
+                    "schema": "aidd.stage_result.v1",
+                    "ticket": ticket,
+                    "stage": "implement",
+                    "scope_key": "iteration_id_I1",
+                    "result": "continue",
+                    "updated_at": "2024-01-02T00:00:00Z",
+                }
+            ),
+        )
+
+    def test_run_loop_step_in_process_runs_step_without_subprocess_boundary(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-IN-PROCESS"
+            self._seed_in_process_step(root, ticket)
+            runner_log = root / "runner.log"
+            runner = Path(__file__).resolve().parent / "fixtures" / "loop_step" / "runner.sh"
+            cwd_before = os.getcwd()
+            with patch.dict(os.environ, {"AIDD_LOOP_RUNNER_LOG": str(runner_log), "AIDD_ALLOW_PLUGIN_WRITES": "1"}):
+                result = loop_run_module.run_loop_step(
+                    REPO_ROOT,
+                    root.parent,
+                    root,
+                    ticket,
+                    f"bash {runner}",
+                    from_qa=None,
+                    work_item_key=None,
+                    select_qa_handoff=False,
+                    stream_mode=None,
+                    timeout_seconds=0,
+                    step_mode="in-process",
+                )
+
+            self.assertEqual(os.getcwd(), cwd_before)
+            self.assertEqual(result.returncode, 10, msg=result.stdout)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload.get("stage"), "implement")
+            self.assertIn("-p /feature-dev-aidd:implement", runner_log.read_text(encoding="utf-8"))
+
+    def test_run_loop_step_records_phase_telemetry(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-TELEMETRY"
+            self._seed_in_process_step(root, ticket)
+            runner = Path(__file__).resolve().parent / "fixtures" / "loop_step" / "runner.sh"
+            telemetry_file = root / "reports" / "loops" / ticket / "loop.telemetry.jsonl"
+            with patch.dict(os.environ, {"AIDD_LOOP_RUNNER_LOG": str(root / "runner.log"), "AIDD_ALLOW_PLUGIN_WRITES": "1"}):
+                result = loop_run_module.run_loop_step(
+                    REPO_ROOT,
+                    root.parent,
+                    root,
+                    ticket,
+                    f"bash {runner}",
+                    from_qa=None,
+                    work_item_key=None,
+                    select_qa_handoff=False,
+                    stream_mode=None,
+                    timeout_seconds=0,
+                    step_mode="in-process",
+                    telemetry_env={
+                        "AIDD_LOOP_TELEMETRY_PATH": str(telemetry_file),
+                        "AIDD_LOOP_TELEMETRY_RUN_ID": "run-1",
+                        "AIDD_LOOP_TELEMETRY_ITERATION": "3",
+                    },
+                )
+
+            self.assertEqual(result.returncode, 10, msg=result.stdout)
+            self.assertNotIn("AIDD_LOOP_TELEMETRY_PATH", os.environ)
+            records = [json.loads(line) for line in telemetry_file.read_text(encoding="utf-8").splitlines()]
+            phases = {record["phase"]: record for record in records}
+            self.assertIn("runner", phases)
+            self.assertIn("stage_chain_preflight", phases)
+            self.assertIn("output_contract", phases)
+            runner_record = phases["runner"]
+            self.assertEqual(runner_record["schema"], "aidd.loop_telemetry.v1")
+            self.assertEqual(runner_record["run_id"], "run-1")
+            self.assertEqual(runner_record["iteration"], 3)
+            self.assertEqual(runner_record["exit_code"], 0)
+            self.assertGreaterEqual(runner_record["subprocess_count"], 1)
+            self.assertGreater(runner_record["bytes_streamed"], 0)
+            self.assertTrue(all(record["duration_ms"] >= 0 for record in records))
+
+    def test_step_mode_defaults_to_subprocess_and_in_process_needs_no_deadline(self) -> None:
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("AIDD_LOOP_STEP_MODE", None)
+            self.assertEqual(loop_run_module._resolve_step_mode(None), "subprocess")  # type: ignore[attr-defined]
+        effective = loop_run_module._effective_step_mode  # type: ignore[attr-defined]
+        self.assertEqual(effective("in-process", timeout_seconds=0, silent_stall_seconds=0), "in-process")
+        self.assertEqual(effective("in-process", timeout_seconds=600, silent_stall_seconds=0), "subprocess")
+        self.assertEqual(effective("in-process", timeout_seconds=0, silent_stall_seconds=30), "subprocess")
+
+    def test_run_loop_step_in_process_with_deadline_runs_as_subprocess(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-IN-PROCESS-STALL"
+            self._seed_in_process_step(root, ticket)
+            runner = write_file(root, "stall-runner.sh", "#!/usr/bin/env bash\nsleep 60\n")
+            started = time.monotonic()
+            with patch.object(
+                loop_run_module,
+                "_run_loop_step_in_process",
+                side_effect=AssertionError("in-process step has no killable deadline"),
+            ):
+                result = loop_run_module.run_loop_step(
+                    REPO_ROOT,
+                    root.parent,
+                    root,
+                    ticket,
+                    f"bash {runner}",
+                    from_qa=None,
+                    work_item_key=None,
+                    select_qa_handoff=False,
+                    stream_mode=None,
+                    timeout_seconds=2,
+                    step_mode="in-process",
+                )
+
+            self.assertLess(time.monotonic() - started, 30)
+            self.assertEqual(result.returncode, 20)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload.get("reason_code"), "seed_stage_silent_stall")
+            self.assertEqual(payload.get("watchdog_marker"), 1)
+
+    def test_run_loop_step_subprocess_silent_stall_terminates_before_budget(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-SUBPROCESS-STALL"
+            self._seed_in_process_step(root, ticket)
+            runner = write_file(root, "stall-runner.sh", "#!/usr/bin/env bash\necho started\nexec sleep 60\n")
+            started = time.monotonic()
+            with patch.dict(os.environ, {"AIDD_ALLOW_PLUGIN_WRITES": "1"}):
+                result = loop_run_module.run_loop_step(
+                    REPO_ROOT,
+                    root.parent,
+                    root,
+                    ticket,
+                    f"bash {runner}",
+                    from_qa=None,
+                    work_item_key=None,
+                    select_qa_handoff=False,
+                    stream_mode=None,
+                    timeout_seconds=120,
+                    stage_budget_seconds=120,
+                    stage_budget_remaining_seconds=120,
+                    budget_exhausted_on_timeout=True,
+                    silent_stall_seconds=2,
+                )
+
+            self.assertLess(time.monotonic() - started, 30)
+            self.assertEqual(result.returncode, 20)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload.get("reason_code"), "seed_stage_silent_stall")
+            self.assertFalse(payload.get("budget_exhausted"))
+            diagnostics = json.loads(payload.get("stage_result_diagnostics") or "{}")
+            self.assertTrue(diagnostics.get("silent_stall_detected"))
+
+    def test_run_loop_step_silent_stall_resets_on_output_growth(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-SUBPROCESS-CHATTY"
+            self._seed_in_process_step(root, ticket)
+            fixture_runner = Path(__file__).resolve().parent / "fixtures" / "loop_step" / "runner.sh"
+            runner = write_file(
+                root,
+                "chatty-runner.sh",
+                "#!/usr/bin/env bash\n"
+                "for i in 1 2 3 4 5 6 7 8 9 10; do echo tick-$i; sleep 0.5; done\n"
+                f'exec bash {fixture_runner} "$@"\n',
+            )
+            with patch.dict(
+                os.environ,
+                {"AIDD_LOOP_RUNNER_LOG": str(root / "runner.log"), "AIDD_ALLOW_PLUGIN_WRITES": "1"},
+            ):
+                result = loop_run_module.run_loop_step(
+                    REPO_ROOT,
+                    root.parent,
+                    root,
+                    ticket,
+                    f"bash {runner}",
+                    from_qa=None,
+                    work_item_key=None,
+                    select_qa_handoff=False,
+                    stream_mode=None,
+                    timeout_seconds=120,
+                    silent_stall_seconds=3,
+                )
+
+            self.assertEqual(result.returncode, 10, msg=result.stdout)
+
+    def test_step_watchdog_silent_stall_clock_runs_only_while_runner_is_up(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-WATCHDOG"
+            state_path = loop_run_module._runner_state_path(root, ticket)  # type: ignore[attr-defined]
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text("running", encoding="utf-8")
+            fired: list[str] = []
+            watchdog = loop_run_module._StepWatchdog(  # type: ignore[attr-defined]
+                target=root,
+                ticket=ticket,
+                timeout_seconds=0,
+                silent_stall_seconds=1,
+                on_fire=fired.append,
+                poll_seconds=0.05,
+            )
+            with watchdog:
+                # The stale "running" left by an earlier step is cleared; a silent pre-runner phase never stalls.
+                time.sleep(1.5)
+                self.assertEqual(fired, [])
+                state_path.write_text("running", encoding="utf-8")
+                deadline = time.monotonic() + 10
+                while not fired and time.monotonic() < deadline:
+                    time.sleep(0.05)
+            self.assertEqual(fired, ["silent_stall"])
+
     def test_run_loop_step_timeout_returns_scope_aware_blocked_payload(self) -> None:
         with tempfile.TemporaryDirectory(prefix="loop-run-") as tmpdir:
             root = ensure_project_root(Path(tmpdir))
@@ -1961,7 +2188,7 @@ class LoopRunTests(unittest.TestCase):
                     }
                 ),
             )
-            with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["loop-step"], timeout=1)):
+            with patch.object(loop_run_module, "_run_loop_step_subprocess", return_value=_watchdog_fired("timeout")):
                 result = loop_run_module.run_loop_step(
                     REPO_ROOT,
                     root.parent,
@@ -1996,7 +2223,7 @@ class LoopRunTests(unittest.TestCase):
             future = time.time() + 3
             os.utime(stream_log, (future, future))
             os.utime(stream_jsonl, (future, future))
-            with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["loop-step"], timeout=1)):
+            with patch.object(loop_run_module, "_run_loop_step_subprocess", return_value=_watchdog_fired("timeout")):
                 result = loop_run_module.run_loop_step(
                     REPO_ROOT,
                     root.parent,
@@ -2030,7 +2257,7 @@ class LoopRunTests(unittest.TestCase):
             future = time.time() + 3
             os.utime(stream_log, (future, future))
             os.utime(stream_jsonl, (future, future))
-            with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["loop-step"], timeout=1)):
+            with patch.object(loop_run_module, "_run_loop_step_subprocess", return_value=_watchdog_fired("timeout")):
                 result = loop_run_module.run_loop_step(
                     REPO_ROOT,
                     root.parent,
@@ -2066,7 +2293,7 @@ class LoopRunTests(unittest.TestCase):
             old = max(time.time() - 3600, 1)
             os.utime(stream_log, (old, old))
             os.utime(stream_jsonl, (old, old))
-            with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["loop-step"], timeout=1)):
+            with patch.object(loop_run_module, "_run_loop_step_subprocess", return_value=_watchdog_fired("timeout")):
                 result = loop_run_module.run_loop_step(
                     REPO_ROOT,
                     root.parent,
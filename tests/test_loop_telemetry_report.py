@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aidd_runtime.reports import loop_telemetry
+from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_active_state, write_file
+
+
+def _record(run_id: str, phase: str, duration_ms: float, *, kind: str = "phase", **fields) -> str:
+    payload = {
+        "schema": "aidd.loop_telemetry.v1",
+        "kind": kind,
+        "run_id": run_id,
+        "iteration": 1,
+        "phase": phase,
+        "duration_ms": duration_ms,
+        **fields,
+    }
+    return json.dumps(payload)
+
+
+class LoopTelemetryReportTests(unittest.TestCase):
+    def test_report_aggregates_percentiles_per_phase(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-telemetry-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-TELEMETRY"
+            write_active_state(root, ticket=ticket)
+            lines = [_record("run-a", "runner", float(value), bytes_streamed=10) for value in range(1, 21)]
+            lines.append(_record("run-b", "output_contract", 5.0))
+            lines.append(_record("run-b", "loop_step", 42.0, kind="iteration", reason_code="stage_result_blocked"))
+            lines.append("not-json")
+            lines.append(json.dumps({"schema": "other", "phase": "runner", "duration_ms": 9999}))
+            write_file(root, f"reports/loops/{ticket}/loop.telemetry.jsonl", "\n".join(lines) + "\n")
+
+            result = subprocess.run(
+                cli_cmd("loop-telemetry-report", "--format", "json"),
+                cwd=root,
+                text=True,
+                capture_output=True,
+                env=cli_env(),
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            report = json.loads(result.stdout)
+            self.assertEqual(report["ticket"], ticket)
+            self.assertEqual(report["runs"], 2)
+            phases = {item["phase"]: item for item in report["phases"]}
+            runner = phases["runner"]
+            self.assertEqual(runner["count"], 20)
+            self.assertEqual(runner["p50_ms"], 10.0)
+            self.assertEqual(runner["p95_ms"], 19.0)
+            self.assertEqual(runner["total_ms"], 210.0)
+            self.assertEqual(runner["bytes_streamed"], 200)
+            self.assertEqual(phases["iteration:loop_step"]["reason_codes"], {"stage_result_blocked": 1})
+
+            result = subprocess.run(
+                cli_cmd("loop-telemetry-report", "--last-runs", "1"),
+                cwd=root,
+                text=True,
+                capture_output=True,
+                env=cli_env(),
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            self.assertIn("runs=1", result.stdout)
+            self.assertIn("output_contract", result.stdout)
+            self.assertNotIn("runner", result.stdout)
+
+    def test_emit_rotates_full_log_and_report_reads_both_generations(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="loop-telemetry-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            ticket = "DEMO-ROTATE"
+            write_active_state(root, ticket=ticket)
+            path = loop_telemetry.telemetry_path(root, ticket)
+            with patch.dict(os.environ, {loop_telemetry.ENV_MAX_BYTES: "300", loop_telemetry.ENV_ENABLED: "1"}):
+                for value in range(1, 7):
+                    loop_telemetry.emit("phase", phase="runner", duration_ms=value, path=path, run_id="run-a")
+            rotated = loop_telemetry.rotated_path(path)
+            self.assertTrue(rotated.exists())
+            self.assertLess(path.stat().st_size, 300 + 200)
+            total = sum(len(item.read_text(encoding="utf-8").splitlines()) for item in (rotated, path))
+            self.assertLess(total, 6)
+
+            result = subprocess.run(
+                cli_cmd("loop-telemetry-report", "--format", "json"),
+                cwd=root,
+                text=True,
+                capture_output=True,
+                env=cli_env(),
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            phases = {item["phase"]: item for item in json.loads(result.stdout)["phases"]}
+            self.assertEqual(phases["runner"]["count"], total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
+import os
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
 
+from aidd_runtime import md_outline
 from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_file
 
 
@@ -155,5 +157,57 @@ class MdSliceTests(unittest.TestCase):
             self.assertNotIn("- stale", content)
 
 
+    def test_md_outline_offsets_and_disk_cache(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="md-outline-") as tmpdir:
+            root = Path(tmpdir)
+            doc = root / "doc.md"
+            doc.write_text(
+                "# Título\n\n## AIDD:NEXT_3\n- [ ] ünïcode\n### nested\n- deep\n"
+                "<!-- handoff:qa start -->\n- fix\n<!-- handoff:qa end -->\n## aidd:risks\n- r1\n",
+                encoding="utf-8",
+            )
+            os.utime(doc, (1_600_000_000, 1_600_000_000))
+            cache_dir = md_outline.outline_cache_dir(root)
+            outline = md_outline.load_outline(doc, cache_dir=cache_dir)
+            span = outline.section("## AIDD:NEXT_3")
+            self.assertIsNotNone(span)
+            self.assertEqual(span[:2], (2, 9))
+            body = md_outline.read_lines(doc, span[2], span[3])
+            self.assertEqual(body[0], "## AIDD:NEXT_3")
+            self.assertEqual(body[-1], "<!-- handoff:qa end -->")
+            self.assertEqual(outline.aidd_section("AIDD:RISKS")[:2], (9, 11))
+            start, end = outline.handoff("qa")
+            self.assertEqual(md_outline.read_lines(doc, start.offset, end.end_offset)[1], "- fix")
+            self.assertEqual(len(list(cache_dir.glob("*.json"))), 1)
+
+            md_outline._MEMORY_CACHE.clear()
+            cached = md_outline.load_outline(doc, cache_dir=cache_dir)
+            self.assertEqual(cached.to_payload(), outline.to_payload())
+
+            doc.write_text("## AIDD:NEXT_3\n- only\n", encoding="utf-8")
+            refreshed = md_outline.load_outline(doc, cache_dir=cache_dir)
+            self.assertEqual(refreshed.section("## AIDD:NEXT_3")[:2], (0, 2))
+            self.assertIsNone(refreshed.aidd_section("AIDD:RISKS"))
+
+    def test_md_outline_does_not_trust_recently_modified_files(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="md-outline-") as tmpdir:
+            root = Path(tmpdir)
+            doc = root / "doc.md"
+            cache_dir = md_outline.outline_cache_dir(root)
+            doc.write_text("## AIDD:A\n- é\n## AIDD:B\n", encoding="utf-8")
+            first = md_outline.load_outline(doc, cache_dir=cache_dir)
+            stat_before = doc.stat()
+
+            # Same size, same mtime: only the racy-window rule notices the rewrite.
+            doc.write_text("## AIDD:Aé\n- \n## AIDD:B\n", encoding="utf-8")
+            os.utime(doc, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+            second = md_outline.load_outline(doc, cache_dir=cache_dir)
+
+            self.assertFalse(cache_dir.exists())
+            self.assertIsNone(second.aidd_section("AIDD:A"))
+            self.assertEqual(second.aidd_section("AIDD:B")[:2], first.aidd_section("AIDD:B")[:2])
+            # A stale offset inside a multibyte character reads as a replacement, not an error.
+            self.assertEqual(md_outline.read_lines(doc, 10, 11), ["\ufffd"])
+
 if __name__ == "__main__":
     unittest.main()
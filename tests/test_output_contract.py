@@ -4,6 +4,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from aidd_runtime import output_contract
 from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_active_state, write_file
 
 
@@ -69,6 +70,47 @@ class OutputContractTests(unittest.TestCase):
             self.assertIn("status_mismatch_stage_result", warnings)
             self.assertIn("read_order_context_before_loop", warnings)
 
+    def test_streamed_scanner_matches_log_scan_without_reading_log(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="output-contract-") as tmpdir:
+            root = ensure_project_root(Path(tmpdir))
+            lines = [
+                '{"type":"system","subtype":"init"}',
+                "status: BLOCKED",
+                "Status: READY",
+                "Work item key: iteration_id=I1",
+                "  Artifacts updated: src/demo.py  ",
+                "Tests: not-run",
+                "Blockers/Handoff: none",
+                "Next actions: none",
+                "AIDD:READ_LOG: aidd/reports/loops/DEMO-OUT/iteration_id_I1.loop.pack.md (reason: loop pack); "
+                "aidd/docs/prd/DEMO-OUT.prd.md (reason: rollout)",
+            ]
+            log_path = root / "reports" / "loops" / "DEMO-OUT" / "cli.implement.stream.log"
+            write_file(root, "reports/loops/DEMO-OUT/cli.implement.stream.log", "\n".join(lines) + "\n")
+            scanner = output_contract.ContractScanner()
+            for line in lines:
+                scanner.feed(line + "\n")
+            self.assertEqual(scanner.lines, len(lines))
+            self.assertEqual(scanner.fields["status"], "READY")
+            self.assertEqual(scanner.fields["artifacts"], "src/demo.py")
+            self.assertEqual(scanner.read_log[1], {"path": "aidd/docs/prd/DEMO-OUT.prd.md", "reason": "rollout"})
+
+            kwargs = dict(
+                target=root,
+                ticket="DEMO-OUT",
+                stage="implement",
+                scope_key="iteration_id_I1",
+                work_item_key="iteration_id=I1",
+                log_path=log_path,
+            )
+            from_file = output_contract.check_output_contract(**kwargs)
+            log_path.unlink()
+            streamed = output_contract.check_output_contract(**kwargs, scanner=scanner)
+            self.assertEqual(streamed, from_file)
+            self.assertEqual(streamed["missing_fields"], [])
+            self.assertIn("full_doc_without_missing_fields", streamed["warnings"])
+            self.assertIn("actions_log_missing", streamed["warnings"])
+
 
 if __name__ == "__main__":
     unittest.main()
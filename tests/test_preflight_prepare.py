@@ -3,7 +3,9 @@ import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from aidd_runtime import preflight_prepare
 from tests.helpers import cli_cmd, cli_env, ensure_project_root, write_active_state, write_tasklist_ready
 
 
@@ -494,5 +496,25 @@ class PreflightPrepareTests(unittest.TestCase):
             self.assertIn("work item id=TST-001 not found in tasklist", str(payload.get("reason") or ""))
 
 
+    def test_unexpected_loop_pack_error_maps_to_loop_pack_failed(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="preflight-prepare-") as tmpdir:
+            target = Path(tmpdir)
+            with mock.patch.object(
+                preflight_prepare.loop_pack, "generate_loop_pack", side_effect=KeyError("work_item")
+            ):
+                with self.assertRaises(preflight_prepare.PreflightBlocked) as ctx:
+                    preflight_prepare._run_loop_pack(target, ticket="DEMO-1", stage="implement", work_item_key="I1")
+            self.assertEqual(ctx.exception.reason_code, "loop_pack_failed")
+            self.assertIn("work_item", ctx.exception.reason)
+
+    def test_failed_loop_pack_without_reason_maps_to_loop_pack_failed(self) -> None:
+        failed = preflight_prepare.loop_pack.LoopPackResult(exit_code=2, payload={}, message="loop-pack exploded")
+        with tempfile.TemporaryDirectory(prefix="preflight-prepare-") as tmpdir:
+            with mock.patch.object(preflight_prepare.loop_pack, "generate_loop_pack", return_value=failed):
+                with self.assertRaises(preflight_prepare.PreflightBlocked) as ctx:
+                    preflight_prepare._run_loop_pack(Path(tmpdir), ticket="DEMO-1", stage="implement", work_item_key="I1")
+        self.assertEqual(ctx.exception.reason_code, "loop_pack_failed")
+        self.assertEqual(ctx.exception.reason, "loop-pack exploded")
+
 if __name__ == "__main__":
     unittest.main()
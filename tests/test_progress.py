@@ -1,4 +1,8 @@
-from aidd_runtime import progress
+import subprocess
+from pathlib import Path
+
+from aidd_runtime import git_objects, progress
+from tests.helpers import git_config_user, git_init
 
 
 def test_normalize_progress_log_dedupes_and_archives():
@@ -17,3 +21,33 @@ def test_parse_progress_log_lines_skips_empty_marker():
     entries, invalid = progress.parse_progress_log_lines(["- (empty)", "- invalid entry"])
     assert entries == []
     assert len(invalid) == 1
+
+
+def test_checkbox_diff_is_cached_by_head_blob_and_content(tmp_path, monkeypatch):
+    git_objects.reset()
+    git_init(tmp_path)
+    git_config_user(tmp_path)
+    tasklist_rel = Path("docs/tasklist/DEMO.md")
+    tasklist = tmp_path / tasklist_rel
+    tasklist.parent.mkdir(parents=True)
+    tasklist.write_text("- [ ] I1 one\n- [ ] I2 two\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+
+    new_text = "- [x] I1   one\n- [ ] I2 two\n- [ ] handoff (source: aidd/reports/qa/DEMO.json)\n- [x] I1 one\n"
+    diff = progress._cached_checkbox_diff(tmp_path, "DEMO", tasklist_rel, new_text)
+    assert diff.checked == ["- [x] I1   one"]
+    assert diff.open_with_reference == ["- [ ] handoff (source: aidd/reports/qa/DEMO.json)"]
+    assert progress._progress_cache_path(tmp_path, "DEMO").exists()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("cached diff expected")
+
+    monkeypatch.setattr(progress, "diff_checkboxes", _fail)
+    assert progress._cached_checkbox_diff(tmp_path, "DEMO", tasklist_rel, new_text) == diff
+    monkeypatch.undo()
+
+    refreshed = progress._cached_checkbox_diff(tmp_path, "DEMO", tasklist_rel, new_text + "- [x] I2 two\n")
+    assert refreshed.checked == ["- [x] I1   one", "- [x] I2 two"]
+    assert not progress._is_code_file(".cache/progress/DEMO.json", progress.ProgressConfig.load(tmp_path))
+    git_objects.reset()
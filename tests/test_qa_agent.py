@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional, Dict
 from unittest.mock import patch
 
+from aidd_runtime import qa_agent
+
 from .helpers import (
     REPO_ROOT,
     cli_cmd,
@@ -707,3 +709,82 @@ Updated: 2024-01-02
         self.assertEqual(payload["status"], "WARN")
         self.assertTrue(any(f["severity"] == "major" for f in payload["findings"]))
         self.assertFalse(any(f["severity"] == "blocker" for f in payload["findings"]))
+
+    def test_parse_added_lines_tracks_hunk_line_numbers(self):
+        diff_text = (
+            "diff --git a/src/app.py b/src/app.py\n"
+            "--- a/src/app.py\n"
+            "+++ b/src/app.py\n"
+            "@@ -2,0 +3,2 @@ def main():\n"
+            "+    value = 1  # TODO tidy\n"
+            "++++ b/not-a-header\n"
+            "@@ -10 +12 @@\n"
+            "-    old()\n"
+            "+    new()\n"
+            "\\ No newline at end of file\n"
+            "diff --git a/src/gone.py b/src/gone.py\n"
+            "--- a/src/gone.py\n"
+            "+++ /dev/null\n"
+            "@@ -1 +0,0 @@\n"
+            "-# FIXME\n"
+        )
+
+        added = qa_agent.parse_added_lines(diff_text)
+
+        self.assertEqual(
+            added,
+            {
+                "src/app.py": [
+                    (3, "    value = 1  # TODO tidy"),
+                    (4, "+++ b/not-a-header"),
+                    (12, "    new()"),
+                ]
+            },
+        )
+
+    def test_collect_added_lines_reads_workspace_diff_against_head(self):
+        write_file(self.project_root, "src/main/Legacy.kt", "// TODO pre-existing\nval x = 1\n")
+        self._commit_all()
+        write_file(self.project_root, "src/main/Legacy.kt", "// TODO pre-existing\nval x = 1\nval y = 2 // FIXME new\n")
+
+        with patch.object(qa_agent, "ROOT_DIR", self.project_root), patch.dict(os.environ, {"QA_AGENT_DIFF_BASE": ""}):
+            added = qa_agent.collect_added_lines()
+            scoped = {item.details for item in qa_agent.analyse_code_tokens(["src/main/Legacy.kt"])}
+            full = {item.details for item in qa_agent.analyse_code_tokens(["src/main/Legacy.kt"], full_scan=True)}
+
+        self.assertEqual(added, {"src/main/Legacy.kt": [(3, "val y = 2 // FIXME new")]})
+        self.assertEqual(scoped, {"src/main/Legacy.kt:3 → val y = 2 // FIXME new"})
+        self.assertIn("src/main/Legacy.kt:1 → // TODO pre-existing", full)
+        self.assertTrue(qa_agent.parse_args(["--full-scan"]).full_scan)
+
+    def test_code_tokens_full_scan_only_untracked_files_outside_diff(self):
+        write_file(self.project_root, "src/main/Legacy.kt", "// FIXME pre-existing\n")
+        write_file(self.project_root, "src/main/Tool.kt", "// TODO pre-existing\n")
+        self._commit_all()
+        (self.project_root / "src" / "main" / "Tool.kt").chmod(0o755)
+        write_file(self.project_root, "src/main/Fresh.kt", "val a = 1\n// TODO new\n")
+        paths = ["src/main/Legacy.kt", "src/main/Tool.kt", "src/main/Fresh.kt"]
+
+        with patch.object(qa_agent, "ROOT_DIR", self.project_root), patch.dict(os.environ, {"QA_AGENT_DIFF_BASE": ""}):
+            details = {item.details for item in qa_agent.analyse_code_tokens(paths)}
+
+        self.assertEqual(details, {"src/main/Fresh.kt:2 → // TODO new"})
+
+    def test_pre_existing_fixme_only_blocks_with_full_scan(self):
+        write_file(self.project_root, "src/main/App.kt", "class App { // FIXME: pre-existing }\n")
+        self._commit_all()
+        write_file(self.project_root, "src/main/App.kt", "class App { // FIXME: pre-existing }\nval ok = 1\n")
+
+        result = self.run_agent("--gate", "--format", "json")
+
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        self.assertNotIn("FIXME", result.stderr)
+
+        result = self.run_agent("--gate", env={"QA_AGENT_FULL_SCAN": "1"})
+
+        self.assertEqual(result.returncode, 2, msg=result.stderr)
+        self.assertIn("FIXME", result.stderr)
+
+    def _commit_all(self) -> None:
+        subprocess.run(["git", "add", "-A"], cwd=self.project_root, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "init"], cwd=self.project_root, check=True, capture_output=True)
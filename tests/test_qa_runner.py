@@ -1,11 +1,13 @@
 import json
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
 from tests.helpers import ensure_project_root, write_active_state
+from aidd_runtime import gates
 from aidd_runtime import qa as qa_module
 
 
@@ -114,6 +116,50 @@ class QaRunnerTests(unittest.TestCase):
             self.assertEqual(executed[0].get("status"), "pass")
             self.assertTrue(str(executed[0].get("command") or "").startswith(str(external_runner)))
 
+
+    def test_commands_run_concurrently_with_deadlines_and_streamed_skip_markers(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="qa-runner-") as tmpdir:
+            workspace = Path(tmpdir)
+            target = ensure_project_root(workspace)
+            report_path = target / "reports" / "qa" / "DEMO-QA5.json"
+
+            started = time.monotonic()
+            executed, summary, reason_code = qa_module._run_qa_tests(
+                target,
+                workspace,
+                ticket="DEMO-QA5",
+                slug_hint="DEMO-QA5",
+                branch=None,
+                report_path=report_path,
+                allow_missing=False,
+                commands_override=[
+                    ["bash", "-c", "sleep 1; echo suite-a ok"],
+                    ["bash", "-c", "printf 'no tests '; sleep 0.3; printf 'ran\\n'"],
+                    ["bash", "-c", "sleep 30 & sleep 30"],
+                ],
+                max_workers=3,
+                command_timeout=1.5,
+            )
+            elapsed = time.monotonic() - started
+
+            self.assertLess(elapsed, 10)
+            self.assertEqual(summary, "fail")
+            self.assertEqual(reason_code, "")
+            self.assertEqual([entry["status"] for entry in executed], ["pass", "skipped", "fail"])
+            self.assertEqual(executed[2]["reason_code"], "tests_timeout")
+            logs = [target / str(entry["log"]).split("/", 1)[1] for entry in executed]
+            self.assertEqual(logs[0].name, "DEMO-QA5-tests-1.log")
+            self.assertIn("suite-a ok", logs[0].read_text(encoding="utf-8"))
+            self.assertIn("no tests ran", logs[1].read_text(encoding="utf-8"))
+            self.assertIn("deadline", logs[2].read_text(encoding="utf-8"))
+
+    def test_qa_tests_limits_default_to_no_deadline(self) -> None:
+        limits = gates.load_qa_tests_limits({})
+        self.assertEqual(limits["command_timeout_seconds"], 0.0)
+        self.assertEqual(limits["total_timeout_seconds"], 0.0)
+        configured = gates.load_qa_tests_limits({"qa": {"tests": {"command_timeout_seconds": 3600}}})
+        self.assertEqual(configured["command_timeout_seconds"], 3600)
+
     def test_qa_main_syncs_active_stage_to_qa_before_execution(self) -> None:
         with tempfile.TemporaryDirectory(prefix="qa-stage-sync-") as tmpdir:
             workspace = Path(tmpdir)
@@ -107,6 +107,20 @@ class ReportsPackTests(unittest.TestCase):
         self.assertIn("blocking", pack["findings"]["cols"])
         self.assertEqual(pack["findings"]["rows"][0][0], "qa-issue-1")
 
+    def test_serialized_pack_keeps_empty_columnar_cells_in_place(self) -> None:
+        payload = {
+            "ticket": "QA-2",
+            "findings": [
+                {"id": "qa-issue-1", "severity": "major", "scope": "", "title": "Flaky suite"},
+            ],
+        }
+        pack = reports_pack.build_qa_pack(payload, source_path="aidd/reports/qa/QA-2.json")
+        findings = json.loads(reports_pack._serialize_pack(pack))["findings"]
+        row = findings["rows"][0]
+        self.assertEqual(len(row), len(findings["cols"]))
+        self.assertEqual(row[findings["cols"].index("scope")], "")
+        self.assertEqual(row[findings["cols"].index("title")], "Flaky suite")
+
     def test_prd_pack_includes_id_column(self) -> None:
         payload = {
             "ticket": "PRD-1",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime as dt
 import io
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -14,11 +15,13 @@ from tests.helpers import REPO_ROOT
 
 sys.path.append(str(REPO_ROOT))
 
-from aidd_runtime import research_check  # noqa: E402
+from aidd_runtime import research_check, research_guard, rlm_lang_scan  # noqa: E402
 
 from .helpers import (
     ensure_gates_config,
     ensure_project_root,
+    git_config_user,
+    git_init,
     write_active_feature,
     write_active_stage,
     write_file,
@@ -575,6 +578,64 @@ class ResearchCheckTests(unittest.TestCase):
         finally:
             os.chdir(old_cwd)
 
+    def test_detect_langs_from_paths_uses_cached_git_histogram(self) -> None:
+        workspace = self.tmp_path / "ws"
+        project_root = ensure_project_root(workspace)
+        git_init(workspace)
+        git_config_user(workspace)
+        (workspace / "src" / "main" / "kotlin").mkdir(parents=True)
+        (workspace / "src" / "main" / "kotlin" / "App.kt").write_text("class App\n", encoding="utf-8")
+        subprocess.run(["git", "add", "src"], cwd=workspace, check=True, capture_output=True)
+
+        detected = research_guard._detect_langs_from_paths(
+            project_root, ["src"], ["kt", "java"], ticket="demo-langs"
+        )
+        self.assertEqual(detected, {"kt"})
+        cache_path = project_root / ".cache" / "research" / "demo-langs.langs.json"
+        self.assertTrue(cache_path.exists())
+
+        (workspace / "src" / "main" / "java").mkdir(parents=True)
+        (workspace / "src" / "main" / "java" / "Legacy.java").write_text("class Legacy {}\n", encoding="utf-8")
+        subprocess.run(["git", "add", "src"], cwd=workspace, check=True, capture_output=True)
+        detected = research_guard._detect_langs_from_paths(
+            project_root, ["src"], ["kt", "java"], ticket="demo-langs"
+        )
+        self.assertEqual(detected, {"kt", "java"})
+
+    def test_detect_langs_from_paths_counts_untracked_files(self) -> None:
+        workspace = self.tmp_path / "ws"
+        project_root = ensure_project_root(workspace)
+        git_init(workspace)
+        git_config_user(workspace)
+        (workspace / "src").mkdir()
+        (workspace / "src" / "App.kt").write_text("class App\n", encoding="utf-8")
+        subprocess.run(["git", "add", "src"], cwd=workspace, check=True, capture_output=True)
+        self.assertEqual(
+            research_guard._detect_langs_from_paths(project_root, ["src"], ["kt", "java"], ticket="demo-untracked"),
+            {"kt"},
+        )
+
+        # Neither HEAD nor the index changes, yet the new untracked source must be seen.
+        (workspace / "src" / "Legacy.java").write_text("class Legacy {}\n", encoding="utf-8")
+        (workspace / ".gitignore").write_text("build/\n", encoding="utf-8")
+        (workspace / "src" / "build").mkdir()
+        (workspace / "src" / "build" / "Gen.java").write_text("class Gen {}\n", encoding="utf-8")
+        histogram = rlm_lang_scan.git_ext_histogram(project_root, "demo-untracked", [workspace / "src"])
+        self.assertEqual(histogram, {".java": 1, ".kt": 1})
+        self.assertEqual(
+            research_guard._detect_langs_from_paths(project_root, ["src"], ["kt", "java"], ticket="demo-untracked"),
+            {"kt", "java"},
+        )
+
+    def test_should_require_rlm_reads_targets_histogram(self) -> None:
+        project_root = ensure_project_root(self.tmp_path)
+        ensure_gates_config(project_root)
+        settings = research_guard.load_settings(project_root)
+        targets = {"files": [], "paths": ["missing"], "stats": {"ext_histogram": {".kt": 3}}}
+        self.assertTrue(research_guard._should_require_rlm(project_root, settings=settings, rlm_targets=targets))
+        targets["stats"]["ext_histogram"] = {".md": 1}
+        self.assertFalse(research_guard._should_require_rlm(project_root, settings=settings, rlm_targets=targets))
+
 
 if __name__ == "__main__":
     unittest.main()
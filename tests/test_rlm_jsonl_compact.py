@@ -6,7 +6,7 @@ from pathlib import Path
 
 from tests.helpers import ensure_project_root, write_active_feature
 
-from aidd_runtime import rlm_jsonl_compact
+from aidd_runtime import rlm_jsonl_compact, rlm_stats
 
 
 class RlmJsonlCompactTests(unittest.TestCase):
@@ -45,6 +45,21 @@ class RlmJsonlCompactTests(unittest.TestCase):
             self.assertEqual(len(compact_nodes), 2)
             self.assertEqual(len(compact_links), 1)
 
+            stats = rlm_stats.load_stats(project_root, ticket)
+            nodes_entry = rlm_stats.fresh_section(stats, rlm_stats.SECTION_NODES, root=project_root, path=nodes_path)
+            self.assertIsNotNone(nodes_entry)
+            self.assertEqual(nodes_entry["rows"], 2)
+            self.assertEqual(nodes_entry["node_kinds"], {"dir": 1, "file": 1})
+            self.assertEqual(nodes_entry["file_nodes"], 1)
+            links_entry = rlm_stats.fresh_section(stats, rlm_stats.SECTION_LINKS, root=project_root, path=links_path)
+            self.assertEqual(links_entry["rows"], 1)
+
+            with links_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"link_id": "l2"}) + "\n")
+            self.assertIsNone(
+                rlm_stats.fresh_section(stats, rlm_stats.SECTION_LINKS, root=project_root, path=links_path)
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
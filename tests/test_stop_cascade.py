@@ -0,0 +1,88 @@
+import io
+import json
+import threading
+import time
+
+from hooks import hooklib, stop_cascade
+
+from .helpers import run_hook, write_active_feature, write_file
+
+STOP_PAYLOAD = '{"hook_event_name":"Stop","tool_input":{"file_path":"src/main/kotlin/App.kt"}}'
+
+
+def test_stop_cascade_merges_gate_output_and_blocks(tmp_path):
+    write_file(tmp_path, "src/main/kotlin/App.kt", "class App")
+    write_active_feature(tmp_path, "demo-checkout")
+
+    result = run_hook(tmp_path, "stop-cascade.sh", STOP_PAYLOAD, extra_env={"CLAUDE_SKIP_QA": "1"})
+    assert result.returncode == 2
+    assert "[gate-workflow] BLOCK: нет плана" in result.stderr
+    assert "[format-and-test]" in result.stderr
+
+    events_path = tmp_path / "aidd" / "reports" / "events" / "demo-checkout.jsonl"
+    events = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    cascade = [event for event in events if event.get("type") == "stop-cascade"]
+    assert cascade and cascade[-1]["status"] == "fail"
+    gates = cascade[-1]["details"]["gates"]
+    assert list(gates) == [gate.name for gate in stop_cascade.GATES]
+    assert gates["gate-workflow"]["status"] == 2
+    assert all(isinstance(item["duration_ms"], int) for item in gates.values())
+
+
+def test_combined_status_prefers_block_then_first_failure():
+    def result(status: int) -> stop_cascade.GateResult:
+        return stop_cascade.GateResult("gate", status, "", "", 0)
+
+    assert stop_cascade.combined_status([result(0), result(0)]) == 0
+    assert stop_cascade.combined_status([result(1), result(2)]) == 2
+    assert stop_cascade.combined_status([result(0), result(3), result(1)]) == 3
+
+
+
+def test_run_cascade_isolates_import_crashes_and_slow_parallel_gates(tmp_path, monkeypatch):
+    (tmp_path / "broken.sh").write_text("raise RuntimeError('boom at import')\n", encoding="utf-8")
+    (tmp_path / "slow.sh").write_text("import time\n\ndef main():\n    time.sleep(30)\n    return 0\n", encoding="utf-8")
+    (tmp_path / "fast.sh").write_text("def main():\n    print('fast ok')\n    return 0\n", encoding="utf-8")
+    (tmp_path / "after.sh").write_text("def main():\n    print('after ok')\n    return 0\n", encoding="utf-8")
+    monkeypatch.setattr(stop_cascade, "HOOKS_DIR", tmp_path)
+    monkeypatch.setattr(hooklib, "read_hook_payload", lambda: {})
+    gates = (
+        stop_cascade.StopGate("broken", "broken.sh", parallel=True, timeout_seconds=1.0),
+        stop_cascade.StopGate("slow", "slow.sh", parallel=True, timeout_seconds=0.5),
+        stop_cascade.StopGate("fast", "fast.sh", parallel=True, timeout_seconds=1.0),
+        stop_cascade.StopGate("after", "after.sh"),
+    )
+
+    started = time.monotonic()
+    results = {result.name: result for result in stop_cascade.run_cascade(gates)}
+
+    assert time.monotonic() - started < 10
+    assert results["broken"].status == 1
+    assert "boom at import" in results["broken"].stderr
+    assert results["slow"].status == 1
+    assert "timed out after 0.5s" in results["slow"].stderr
+    assert (results["fast"].status, results["fast"].stdout) == (0, "fast ok\n")
+    assert (results["after"].status, results["after"].stdout) == (0, "after ok\n")
+
+def test_thread_stream_router_keeps_thread_output_apart():
+    fallback = io.StringIO()
+    router = hooklib.ThreadStreamRouter(fallback)
+    buffers = [io.StringIO() for _ in range(4)]
+    barrier = threading.Barrier(len(buffers))
+
+    def worker(index: int) -> None:
+        with router.capture(buffers[index]):
+            barrier.wait()
+            for _ in range(50):
+                print(f"gate-{index}", file=router)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(len(buffers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print("main", file=router)
+
+    for index, buf in enumerate(buffers):
+        assert set(buf.getvalue().split()) == {f"gate-{index}"}
+    assert fallback.getvalue() == "main\n"
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import os
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from aidd_runtime import tasklist_parser
 
@@ -139,6 +144,22 @@ class TasklistParserTests(unittest.TestCase):
     def test_build_compact_answers_returns_empty_without_question_markers(self) -> None:
         self.assertEqual(tasklist_parser.build_compact_answers("status: blocked"), "")
 
+    def test_read_lines_memoizes_settled_files_and_rereads_on_change(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="tasklist-lines-") as tmpdir:
+            path = Path(tmpdir) / "DEMO.md"
+            path.write_text("# Tasklist\n- [ ] I1\n", encoding="utf-8")
+            settled = time.time_ns() - 10 * tasklist_parser.RACY_WINDOW_NS
+            os.utime(path, ns=(settled, settled))
+
+            lines = tasklist_parser.read_lines(path)
+            self.assertEqual(lines, ["# Tasklist", "- [ ] I1"])
+            lines.append("mutated")
+            with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+                self.assertEqual(tasklist_parser.read_lines(path), ["# Tasklist", "- [ ] I1"])
+
+            path.write_text("# Tasklist\n- [x] I1\n", encoding="utf-8")
+            self.assertEqual(tasklist_parser.read_lines(path), ["# Tasklist", "- [x] I1"])
+
 
 if __name__ == "__main__":
     unittest.main()
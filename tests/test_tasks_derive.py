@@ -750,3 +750,60 @@ class TasksDeriveIndexAutoSyncTests(unittest.TestCase):
 
             self.assertEqual(result.returncode, 0, msg=result.stderr)
             self.assertFalse(index_path.exists())
+
+
+def _derive(project_root: Path, source: str) -> None:
+    result = subprocess.run(
+        cli_cmd("tasks-derive", "--source", source, "--ticket", "demo-checkout", "--append"),
+        cwd=project_root,
+        text=True,
+        capture_output=True,
+        env=cli_env(),
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def _qa_report(recommendation: str) -> dict:
+    return {
+        "status": "WARN",
+        "tests_summary": "pass",
+        "tests_executed": [],
+        "findings": [
+            {"id": "qa-1", "severity": "minor", "scope": "ui", "title": "Spacing", "recommendation": "Fix spacing"},
+            {"id": "qa-2", "severity": "major", "scope": "api", "title": "Timeout", "recommendation": recommendation},
+        ],
+    }
+
+
+def test_tasks_derive_handoff_index_matches_full_merge(tmp_path):
+    review_report = {
+        "status": "WARN",
+        "findings": [{"id": "rv-1", "severity": "minor", "scope": "ui", "title": "Naming", "recommendation": "Rename"}],
+    }
+    results = []
+    for name, keep_index in (("indexed", True), ("scan", False)):
+        project_root = ensure_project_root(tmp_path / name)
+        write_active_feature(project_root, "demo-checkout")
+        write_file(project_root, "docs/tasklist/demo-checkout.md", _base_tasklist())
+        write_json(project_root, "reports/reviewer/demo-checkout/demo-checkout.json", review_report)
+        index_path = project_root / ".cache" / "tasks-derive" / "demo-checkout.json"
+        steps = (("qa", "Retry v1"), ("review", None), ("qa", "Retry v1"), ("qa", "Retry v2"), ("review", None))
+        for source, recommendation in steps:
+            if recommendation:
+                write_json(project_root, "reports/qa/demo-checkout.json", _qa_report(recommendation))
+            if not keep_index and index_path.exists():
+                index_path.unlink()
+            _derive(project_root, source)
+        if keep_index:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            text = (project_root / "docs/tasklist/demo-checkout.md").read_text(encoding="utf-8")
+            for source in ("qa", "review"):
+                section = index["sections"][source]
+                assert text[section["start"] : section["end"]].startswith(f"<!-- handoff:{source}")
+            assert set(index["sections"]["qa"]["noop"]) >= {"qa:qa-1"}
+        results.append((project_root / "docs/tasklist/demo-checkout.md").read_text(encoding="utf-8"))
+
+    indexed, scanned = results
+    assert indexed == scanned
+    assert "Retry v2" in indexed and "Retry v1" not in indexed
+    assert indexed.count("id: review:rv-1") == 1
@@ -1,3 +1,4 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -74,6 +75,35 @@ class ToolsInventoryTests(unittest.TestCase):
             self.assertEqual(hook_entry.get("runtime_classification"), "python_entrypoint")
             self.assertEqual(hook_entry.get("python_owner_path"), "hooks/gate-workflow.sh")
 
+    def test_consumer_scan_reuses_cache_for_unchanged_files(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="tools-inventory-") as tmpdir:
+            root = Path(tmpdir)
+            (root / "hooks").mkdir(parents=True, exist_ok=True)
+            (root / "docs" / "node_modules").mkdir(parents=True, exist_ok=True)
+            (root / "hooks" / "gate.sh").write_text("#!/usr/bin/env python3\n", encoding="utf-8")
+            (root / "hooks" / "lint.sh").write_text("#!/usr/bin/env python3\n", encoding="utf-8")
+            (root / "docs" / "guide.md").write_text("Run `${CLAUDE_PLUGIN_ROOT}/hooks/gate.sh`.\n", encoding="utf-8")
+            (root / "docs" / "node_modules" / "vendored.md").write_text("hooks/gate.sh\n", encoding="utf-8")
+            cache_path = root / "aidd" / ".cache" / "tools-inventory.scan.json"
+            entrypoints = ["hooks/gate.sh", "hooks/lint.sh"]
+
+            usage = tools_inventory._scan_consumers(root, entrypoints, cache_path=cache_path)
+            self.assertEqual(usage["hooks/gate.sh"], ["docs/guide.md"])
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+            self.assertEqual(cache["files"]["docs/guide.md"]["refs"], ["hooks/gate.sh"])
+            self.assertNotIn("docs/node_modules/vendored.md", cache["files"])
+
+            # Unchanged (mtime, size) entries are served from the cache without re-reading the file.
+            cache["files"]["docs/guide.md"]["refs"] = ["hooks/lint.sh"]
+            cache_path.write_text(json.dumps(cache), encoding="utf-8")
+            usage = tools_inventory._scan_consumers(root, entrypoints, cache_path=cache_path)
+            self.assertEqual(usage["hooks/lint.sh"], ["docs/guide.md"])
+
+            (root / "docs" / "guide.md").write_text("Run hooks/gate.sh and hooks/gate.sh again.\n", encoding="utf-8")
+            usage = tools_inventory._scan_consumers(root, entrypoints, cache_path=cache_path)
+            self.assertEqual(usage["hooks/gate.sh"], ["docs/guide.md"])
+            self.assertEqual(usage["hooks/lint.sh"], [])
+
 
 if __name__ == "__main__":
     unittest.main()
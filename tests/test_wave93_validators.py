@@ -1,5 +1,9 @@
 import json
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from tests.helpers import REPO_ROOT
 from aidd_runtime import (
@@ -224,5 +228,44 @@ class Wave93SchemaAndValidatorTests(unittest.TestCase):
         )
 
 
+    def test_skill_contract_verdicts_are_cached_by_content_hash(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="contract-cache-") as tmpdir:
+            root = Path(tmpdir)
+            paths = []
+            for idx, stage in enumerate(("implement", "review", "qa")):
+                target = root / f"copy{idx}" / stage / "CONTRACT.yaml"
+                target.parent.mkdir(parents=True)
+                shutil.copyfile(REPO_ROOT / "skills" / stage / "CONTRACT.yaml", target)
+                paths.append(target)
+            broken = root / "broken" / "implement" / "CONTRACT.yaml"
+            broken.parent.mkdir(parents=True)
+            broken.write_text("schema: aidd.skill_contract.v1\nstage: qa\n", encoding="utf-8")
+            paths.append(broken)
+            cache_file = root / "cache.json"
+
+            with mock.patch.object(skill_contract_validate, "PARALLEL_MIN_CONTRACTS", 2):
+                verdicts = skill_contract_validate.validate_contract_files(paths, cache_file=cache_file, workers=2)
+            self.assertEqual([verdicts[path] for path in paths[:3]], [(None, [])] * 3)
+            self.assertTrue(any("must match directory name" in err for err in verdicts[broken][1]))
+
+            payload = json.loads(cache_file.read_text(encoding="utf-8"))
+            self.assertEqual(payload["validator_version"], skill_contract_validate.VALIDATOR_VERSION)
+            self.assertEqual(len(payload["entries"]), 4)
+
+            skill_contract_validate._MEMORY_CACHE.clear()
+            with mock.patch.object(skill_contract_validate, "validate_contract_data", side_effect=AssertionError):
+                cached = skill_contract_validate.validate_contract_files(paths, cache_file=cache_file)
+            self.assertEqual(cached, verdicts)
+
+            skill_contract_validate._MEMORY_CACHE.clear()
+            with mock.patch.object(skill_contract_validate, "VALIDATOR_VERSION", 999):
+                with mock.patch.object(
+                    skill_contract_validate, "validate_contract_data", return_value=["fresh"]
+                ) as validate:
+                    fresh = skill_contract_validate.validate_contract_files(paths[:1], cache_file=cache_file)
+            self.assertEqual(fresh[paths[0]], (None, ["fresh"]))
+            validate.assert_called_once()
+            skill_contract_validate._MEMORY_CACHE.clear()
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ import json
 import re
 import unittest
 
-from tests.helpers import REPO_ROOT
+from tests.helpers import REPO_ROOT, plugin_hook_commands
 
 
 class Wave95PolicyGuards(unittest.TestCase):
@@ -71,6 +71,7 @@ class Wave95PolicyGuards(unittest.TestCase):
             for hook in entry.get("hooks", [])
             if isinstance(hook, dict)
         ]
+        commands += [hook.get("command", "") for hook in plugin_hook_commands("Stop")]
         self.assertFalse(any("gate-prd-review" in cmd for cmd in commands))
         self.assertTrue(any("gate-workflow.sh" in cmd for cmd in commands))
 